@@ -1,8 +1,102 @@
+import argparse
+
+from .cache import DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL, DEFAULT_DISK_CACHE_SIZE
+from .datasets import DEFAULT_RESIDENT_SIZE
+from .results import DEFAULT_INLINE_LIMIT
 from .server import serve
 
 
 def main() -> None:
-    serve()
+    parser = argparse.ArgumentParser(
+        description="MCP server providing TA-Lib technical analysis indicators"
+    )
+    parser.add_argument(
+        "--inline-limit",
+        type=int,
+        default=DEFAULT_INLINE_LIMIT,
+        help="Results larger than this many bytes of JSON are returned as a "
+        "ta://results/<id> resource link instead of inline text",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help="Maximum size in bytes of the in-process result cache (0 disables it)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help="Seconds after which cached results expire",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for a persistent result cache that survives restarts",
+    )
+    parser.add_argument(
+        "--disk-cache-size",
+        type=int,
+        default=DEFAULT_DISK_CACHE_SIZE,
+        help="Maximum size in bytes of the persistent result cache",
+    )
+    parser.add_argument(
+        "--dataset-dir",
+        help="Directory in which registered datasets are stored as memory-mapped "
+        "column files that survive restarts",
+    )
+    parser.add_argument(
+        "--dataset-memory",
+        type=int,
+        default=DEFAULT_RESIDENT_SIZE,
+        help="Maximum size in bytes of the stored datasets kept mapped in memory",
+    )
+    parser.add_argument(
+        "--db-path",
+        help="SQLite file holding a time-indexed OHLCV database that indicator "
+        "tools can query by symbol and time range",
+    )
+    parser.add_argument(
+        "--panel-workers",
+        type=int,
+        help="Threads computing the rows of panel requests (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=0.0,
+        help="Milliseconds a call on a single series waits for concurrent calls "
+        "of the same tool and parameters, to compute them together as a panel "
+        "(0 disables batching)",
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "sse", "streamable-http"],
+        default="stdio",
+        help="Transport to serve on; the HTTP transports accept concurrent "
+        "requests, e.g. upload chunks sent in parallel",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address the HTTP transports bind to"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="Port the HTTP transports listen on"
+    )
+    args = parser.parse_args()
+    serve(
+        inline_limit=args.inline_limit,
+        cache_size=args.cache_size,
+        cache_ttl=args.cache_ttl,
+        cache_dir=args.cache_dir,
+        disk_cache_size=args.disk_cache_size,
+        dataset_dir=args.dataset_dir,
+        dataset_memory=args.dataset_memory,
+        db_path=args.db_path,
+        panel_workers=args.panel_workers,
+        batch_window=args.batch_window_ms / 1000,
+        transport=args.transport,
+        host=args.host,
+        port=args.port,
+    )
 
 
 if __name__ == "__main__":
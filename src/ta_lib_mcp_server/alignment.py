@@ -0,0 +1,76 @@
+import functools
+
+import numpy as np
+
+JOINS = ("inner", "outer", "ffill")
+
+
+def _timestamps(values: list[int] | np.ndarray, length: int) -> np.ndarray:
+    timestamps = np.asarray(values, dtype=np.int64)
+    if timestamps.ndim != 1 or len(timestamps) != length:
+        raise ValueError(f"Got {len(timestamps)} timestamps for {length} values")
+    if np.any(timestamps[1:] <= timestamps[:-1]):
+        raise ValueError("Timestamps must be strictly increasing")
+    return timestamps
+
+
+def join_positions(
+    timestamps: list[np.ndarray], how: str = "inner"
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Join sorted timestamp series and locate each series' values on the result.
+
+    Returns the joined timestamps and, for every series, the position of its
+    value at each joined timestamp, or -1 where it has none:
+
+    - ``inner`` keeps the timestamps present in every series;
+    - ``outer`` keeps those present in any series, the others missing there;
+    - ``ffill`` keeps those present in any series from the first at which
+      every series has started, each series carrying its last value forward.
+    """
+    if how not in JOINS:
+        raise ValueError(f"Unknown join {how!r}; use one of {list(JOINS)}")
+    if how == "inner":
+        joined = functools.reduce(
+            lambda left, right: np.intersect1d(left, right, assume_unique=True),
+            timestamps,
+        )
+    else:
+        joined = functools.reduce(np.union1d, timestamps)
+    if how == "ffill":
+        if any(len(series) == 0 for series in timestamps):
+            joined = joined[:0]
+        else:
+            start = max(series[0] for series in timestamps)
+            joined = joined[joined.searchsorted(start) :]
+        return joined, [
+            series.searchsorted(joined, "right") - 1 for series in timestamps
+        ]
+    positions = []
+    for series in timestamps:
+        found = series.searchsorted(joined)
+        if how == "outer":
+            inside = found < len(series)
+            matched = np.zeros(len(joined), dtype=bool)
+            matched[inside] = series[found[inside]] == joined[inside]
+            found[~matched] = -1
+        positions.append(found)
+    return joined, positions
+
+
+def align(
+    series: list[tuple[list[int] | np.ndarray, np.ndarray]], how: str = "inner"
+) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Align ``(timestamps, values)`` series on their joined timestamps.
+
+    Returns the joined timestamps and every series' values on them, NaN
+    where a series has no value (see ``join_positions``).
+    """
+    timestamps = [_timestamps(stamps, len(values)) for stamps, values in series]
+    joined, positions = join_positions(timestamps, how)
+    aligned = []
+    for (_, values), found in zip(series, positions, strict=True):
+        out = np.full(len(joined), np.nan)
+        present = found >= 0
+        out[present] = values[found[present]]
+        aligned.append(out)
+    return joined, aligned
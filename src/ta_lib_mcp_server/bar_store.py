@@ -0,0 +1,196 @@
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from .datasets import DEFAULT_RESIDENT_SIZE
+from .hashing import to_float64_array
+
+TIMESTAMP = "timestamp"
+
+
+@dataclass
+class SymbolBars:
+    """All stored bars of one symbol as columns sorted by timestamp."""
+
+    symbol: str
+    timestamps: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + sum(
+            values.nbytes for values in self.columns.values()
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise ValueError(
+                f"Symbol {self.symbol!r} has no column {name!r}; "
+                f"available columns: {sorted(self.columns)}"
+            ) from None
+
+    def window(
+        self, start: int | None, end: int | None, warmup: int = 0
+    ) -> tuple[int, int, int]:
+        """Locate the bars with ``start <= timestamp <= end``.
+
+        Returns ``(begin, first, stop)``: the bars in range are ``first:stop``
+        and ``begin:first`` are up to ``warmup`` bars preceding them.
+        """
+        first = 0 if start is None else self.timestamps.searchsorted(start, "left")
+        stop = (
+            len(self.timestamps)
+            if end is None
+            else self.timestamps.searchsorted(end, "right")
+        )
+        if first >= stop:
+            raise ValueError(f"Symbol {self.symbol!r} has no bars in the given range")
+        return int(max(first - warmup, 0)), int(first), int(stop)
+
+    def describe(self) -> dict:
+        return {
+            "symbol": self.symbol,
+            "length": len(self.timestamps),
+            "first": int(self.timestamps[0]) if len(self.timestamps) else None,
+            "last": int(self.timestamps[-1]) if len(self.timestamps) else None,
+            "columns": sorted(self.columns),
+        }
+
+
+class BarStore:
+    """Embedded OHLCV database in a single SQLite file.
+
+    Each symbol's bars are stored column-wise, as one blob of raw little-endian
+    values per column, sorted by timestamp. Loading a symbol is therefore a
+    handful of blob reads, and time ranges are located with binary searches on
+    the timestamp column. Loaded symbols are kept in memory up to
+    ``max_resident_bytes``, least recently used first out.
+    """
+
+    def __init__(self, path: str, max_resident_bytes: int = DEFAULT_RESIDENT_SIZE):
+        self.max_resident_bytes = max_resident_bytes
+        self._loaded: OrderedDict[str, SymbolBars] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS columns (symbol TEXT NOT NULL, "
+                "name TEXT NOT NULL, data BLOB NOT NULL, PRIMARY KEY (symbol, name))"
+            )
+
+    def write(
+        self,
+        symbol: str,
+        timestamps: list[int],
+        columns: dict[str, list[float]],
+    ) -> SymbolBars:
+        """Insert bars, replacing stored bars that have the same timestamp."""
+        new_timestamps = np.asarray(timestamps, dtype=np.int64)
+        new_columns = {
+            name: to_float64_array(values) for name, values in columns.items()
+        }
+        if TIMESTAMP in new_columns:
+            raise ValueError(f"{TIMESTAMP!r} is reserved for the bar timestamps")
+        for name, values in new_columns.items():
+            if len(values) != len(new_timestamps):
+                raise ValueError(
+                    f"Column {name!r} has {len(values)} values "
+                    f"for {len(new_timestamps)} timestamps"
+                )
+        with self._lock:
+            stored = self._load(symbol)
+            if stored is not None:
+                if set(new_columns) != set(stored.columns):
+                    raise ValueError(
+                        f"Bars for {symbol!r} must have the columns "
+                        f"{sorted(stored.columns)}"
+                    )
+                new_timestamps = np.concatenate([stored.timestamps, new_timestamps])
+                new_columns = {
+                    name: np.concatenate([values, new_columns[name]])
+                    for name, values in stored.columns.items()
+                }
+            bars = _sorted_unique(symbol, new_timestamps, new_columns)
+            with self._db:
+                self._db.execute("DELETE FROM columns WHERE symbol = ?", (symbol,))
+                self._db.executemany(
+                    "INSERT INTO columns VALUES (?, ?, ?)",
+                    [
+                        (symbol, TIMESTAMP, bars.timestamps.astype("<i8").tobytes()),
+                        *(
+                            (symbol, name, values.astype("<f8").tobytes())
+                            for name, values in bars.columns.items()
+                        ),
+                    ],
+                )
+            self._insert(bars)
+            return bars
+
+    def get(self, symbol: str) -> SymbolBars:
+        with self._lock:
+            bars = self._load(symbol)
+        if bars is None:
+            raise ValueError(f"Unknown symbol: {symbol!r}")
+        return bars
+
+    def delete(self, symbol: str) -> SymbolBars:
+        bars = self.get(symbol)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM columns WHERE symbol = ?", (symbol,))
+            self._loaded.pop(symbol, None)
+        return bars
+
+    def symbols(self) -> list[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT symbol FROM columns ORDER BY symbol"
+            ).fetchall()
+        return [symbol for (symbol,) in rows]
+
+    def _load(self, symbol: str) -> SymbolBars | None:
+        bars = self._loaded.get(symbol)
+        if bars is not None:
+            self._loaded.move_to_end(symbol)
+            return bars
+        rows = self._db.execute(
+            "SELECT name, data FROM columns WHERE symbol = ?", (symbol,)
+        ).fetchall()
+        if not rows:
+            return None
+        data = dict(rows)
+        bars = SymbolBars(
+            symbol,
+            np.frombuffer(data.pop(TIMESTAMP), dtype="<i8"),
+            {name: np.frombuffer(blob, dtype="<f8") for name, blob in data.items()},
+        )
+        return self._insert(bars)
+
+    def _insert(self, bars: SymbolBars) -> SymbolBars:
+        self._loaded[bars.symbol] = bars
+        self._loaded.move_to_end(bars.symbol)
+        resident = sum(item.nbytes for item in self._loaded.values())
+        while resident > self.max_resident_bytes and len(self._loaded) > 1:
+            _, evicted = self._loaded.popitem(last=False)
+            resident -= evicted.nbytes
+        return bars
+
+
+def _sorted_unique(
+    symbol: str, timestamps: np.ndarray, columns: dict[str, np.ndarray]
+) -> SymbolBars:
+    """Sort bars by timestamp, keeping the last bar given for each timestamp."""
+    if np.all(timestamps[1:] > timestamps[:-1]):
+        return SymbolBars(symbol, timestamps, columns)
+    order = np.argsort(timestamps, kind="stable")
+    timestamps = timestamps[order]
+    last = np.append(timestamps[1:] != timestamps[:-1], True)
+    return SymbolBars(
+        symbol,
+        timestamps[last],
+        {name: values[order][last] for name, values in columns.items()},
+    )
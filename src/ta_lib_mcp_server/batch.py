@@ -0,0 +1,256 @@
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .datasets import DEFAULT_COLUMNS
+from .indicator_tools import IndicatorTools
+
+# TA-Lib treats values closer to zero than this as zero when dividing.
+_ZERO = 1e-8
+
+
+class BatchSpec(BaseModel):
+    """One indicator computation in a batch."""
+
+    function: str = Field(description="TA-Lib function, e.g. RSI, MACD or NATR")
+    params: dict[str, Any] = Field(
+        default_factory=dict, description="Parameters of the function"
+    )
+    name: str | None = Field(
+        default=None,
+        description="Key of the result in the response; defaults to the lowercase "
+        "function name followed by the given parameter values, e.g. 'macd_12_26_9'. "
+        "An indicator with several outputs is returned as '<name>.<output>'",
+    )
+
+    def key(self) -> str:
+        if self.name is not None:
+            return self.name
+        return "_".join(
+            [self.function.lower(), *(str(value) for value in self.params.values())]
+        )
+
+
+class BatchPlanner:
+    """Computes indicators on one set of inputs, sharing their intermediates.
+
+    Identical computations are done once, and indicators that TA-Lib builds
+    from other indicators are derived from them when those are computed anyway:
+    NATR from ATR, ADXR from ADX, DX from PLUS_DI and MINUS_DI, and MACD, APO
+    and PPO from their moving averages, which are shared with each other and
+    with requested EMA, SMA and MA indicators. Every derivation repeats TA-Lib's
+    own arithmetic, so the results are identical to separate calls.
+    """
+
+    def __init__(self, indicators: IndicatorTools, series: dict[str, np.ndarray]):
+        self.indicators = indicators
+        self.series = series
+        self.planned: set[tuple] = set()
+        self._results: dict[tuple, dict[str, np.ndarray]] = {}
+
+    def normalize(self, function: str, params: dict[str, Any]) -> tuple:
+        """Return the key identifying an indicator computation."""
+        indicator = self.indicators.indicator(function)
+        validated = dict(indicator.params.model_validate(params))
+        return (indicator.function, tuple(sorted(validated.items())))
+
+    def plan(self, specs: list[BatchSpec]) -> None:
+        """Note the computations a batch needs, so derivations can rely on them."""
+        self.planned.update(
+            self.normalize(spec.function, spec.params) for spec in specs
+        )
+
+    def compute(self, function: str, params: dict[str, Any]) -> dict[str, np.ndarray]:
+        key = self.normalize(function, params)
+        result = self._results.get(key)
+        if result is None:
+            function, items = key
+            params = dict(items)
+            derive = _DERIVATIONS.get(function)
+            result = derive(self, params) if derive is not None else None
+            if result is None:
+                indicator = self.indicators.indicator(function)
+                result = indicator(self.inputs(indicator.series), params)
+            self._results[key] = result
+        return result
+
+    def inputs(self, names: list[str]) -> dict[str, np.ndarray]:
+        inputs = {}
+        for name in names:
+            column = DEFAULT_COLUMNS.get(name, name)
+            if column not in self.series:
+                raise ValueError(
+                    f"Missing input series {column!r}; available: {sorted(self.series)}"
+                )
+            inputs[name] = self.series[column]
+        return inputs
+
+    def moving_average(self, period: int, matype: str, offset: int = 0) -> np.ndarray:
+        """Return MA(close[offset:]) aligned to the full input length."""
+        if offset == 0:
+            return self.compute("MA", {"timeperiod": period, "matype": matype})["ma"]
+        close = self.inputs(["real"])["real"]
+        key = ("MA", (("matype", matype), ("offset", offset), ("timeperiod", period)))
+        if key not in self._results:
+            average = self.indicators.indicator("MA")(
+                {"real": close[offset:]}, {"timeperiod": period, "matype": matype}
+            )["ma"]
+            self._results[key] = {
+                "ma": np.concatenate([np.full(offset, np.nan), average])
+            }
+        return self._results[key]["ma"]
+
+
+def _ema(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    if params["timeperiod"] < 2:
+        return None
+    return {"ema": planner.moving_average(params["timeperiod"], "EMA")}
+
+
+def _sma(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    if params["timeperiod"] < 2:
+        return None
+    return {"sma": planner.moving_average(params["timeperiod"], "SMA")}
+
+
+def _natr(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    atr = planner.compute("ATR", params)["atr"]
+    close = planner.inputs(["close"])["close"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        natr = (atr / close) * 100.0
+    natr[(np.abs(close) < _ZERO) & ~np.isnan(atr)] = 0.0
+    return {"natr": natr}
+
+
+def _adxr(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    period = params["timeperiod"]
+    if period < 2:
+        return None
+    adx = planner.compute("ADX", params)["adx"]
+    adxr = np.full(len(adx), np.nan)
+    # Series too short for a value are all NaN, as TA-Lib returns them.
+    if len(adx) >= period:
+        adxr[period - 1 :] = (adx[period - 1 :] + adx[: len(adx) - (period - 1)]) / 2.0
+    return {"adxr": adxr}
+
+
+def _dx(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    if (
+        not {
+            planner.normalize("PLUS_DI", params),
+            planner.normalize("MINUS_DI", params),
+        }
+        <= planner.planned
+    ):
+        return None
+    plus = planner.compute("PLUS_DI", params)["plus_di"]
+    minus = planner.compute("MINUS_DI", params)["minus_di"]
+    total = minus + plus
+    if np.any(np.abs(total) < _ZERO):
+        # TA-Lib carries the previous DX forward there; leave that to TA-Lib.
+        return None
+    return {"dx": 100.0 * (np.abs(minus - plus) / total)}
+
+
+def _macd(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    fast, slow, signal = (
+        params["fastperiod"],
+        params["slowperiod"],
+        params["signalperiod"],
+    )
+    if fast < 2 or slow < 2 or signal < 2:
+        return None
+    if np.isnan(planner.inputs(["real"])["real"]).any():
+        # TA-Lib skips leading NaNs before offsetting the fast EMA.
+        return None
+    if slow < fast:
+        fast, slow = slow, fast
+    # TA-Lib starts the fast EMA where the slow one starts, not at the first bar.
+    line = planner.moving_average(fast, "EMA", slow - fast) - planner.moving_average(
+        slow, "EMA"
+    )
+    start = slow - 1
+    if len(line) <= start:
+        return None
+    macdsignal = np.full(len(line), np.nan)
+    macdsignal[start:] = planner.indicators.indicator("EMA")(
+        {"real": line[start:]}, {"timeperiod": signal}
+    )["ema"]
+    macd = line.copy()
+    macd[: start + signal - 1] = np.nan
+    return {"macd": macd, "macdsignal": macdsignal, "macdhist": macd - macdsignal}
+
+
+def _oscillator_averages(
+    planner: BatchPlanner, params: dict
+) -> tuple[np.ndarray, np.ndarray] | None:
+    fast, slow = params["fastperiod"], params["slowperiod"]
+    if fast < 2 or slow < 2:
+        return None
+    if slow < fast:
+        fast, slow = slow, fast
+    return (
+        planner.moving_average(fast, params["matype"]),
+        planner.moving_average(slow, params["matype"]),
+    )
+
+
+def _apo(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    averages = _oscillator_averages(planner, params)
+    if averages is None:
+        return None
+    fast, slow = averages
+    return {"apo": fast - slow}
+
+
+def _ppo(planner: BatchPlanner, params: dict) -> dict[str, np.ndarray] | None:
+    averages = _oscillator_averages(planner, params)
+    if averages is None:
+        return None
+    fast, slow = averages
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ppo = ((fast - slow) / slow) * 100.0
+    ppo[(np.abs(slow) < _ZERO) & ~np.isnan(fast)] = 0.0
+    return {"ppo": ppo}
+
+
+_DERIVATIONS: dict[str, Callable[[BatchPlanner, dict], dict | None]] = {
+    "EMA": _ema,
+    "SMA": _sma,
+    "NATR": _natr,
+    "ADXR": _adxr,
+    "DX": _dx,
+    "MACD": _macd,
+    "APO": _apo,
+    "PPO": _ppo,
+}
+
+
+def run_batch(
+    indicators: IndicatorTools,
+    series: dict[str, np.ndarray],
+    specs: list[BatchSpec],
+) -> dict[str, np.ndarray]:
+    """Compute every spec on the same inputs and return their outputs by name."""
+    if not specs:
+        raise ValueError("A batch needs at least one indicator")
+    names = [spec.key() for spec in specs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Result names must be unique, repeated: {duplicates}")
+    planner = BatchPlanner(indicators, series)
+    planner.plan(specs)
+    outputs = {}
+    for name, spec in zip(names, specs, strict=True):
+        try:
+            result = planner.compute(spec.function, spec.params)
+        except Exception as error:
+            raise ValueError(f"Indicator {name!r} failed: {error}") from error
+        if len(result) == 1:
+            outputs[name] = next(iter(result.values()))
+        else:
+            for key, values in result.items():
+                outputs[f"{name}.{key}"] = values
+    return outputs
@@ -0,0 +1,112 @@
+import asyncio
+from collections.abc import Callable
+
+import numpy as np
+
+
+class MicroBatcher:
+    """Collects concurrent single-series calls of an indicator into panels.
+
+    Calls of the same tool with the same parameters that arrive within
+    ``window`` seconds of the first are computed together once the window
+    closes: those of equal length are stacked into a 2D panel for the NumPy
+    kernels, and the rest are split across the panel workers, before every
+    caller gets its own row back. ``window`` is the latency a call may wait
+    for others to join it.
+    """
+
+    def __init__(self, indicators, window: float):
+        self.indicators = indicators
+        self.window = window
+        self._pending: dict[str, list[tuple[dict, asyncio.Future]]] = {}
+
+    async def submit(
+        self, name: str, function: str, fn: Callable, params: dict, inputs: dict
+    ) -> dict:
+        """Wait for the batch a call joins and return the call's result."""
+        loop = asyncio.get_running_loop()
+        group = self.indicators.cache.make_key(name, params, {})
+        future = loop.create_future()
+        requests = self._pending.setdefault(group, [])
+        requests.append((inputs, future))
+        if len(requests) == 1:
+            loop.call_later(
+                self.window,
+                lambda: loop.create_task(
+                    self._flush(self._pending.pop(group), name, function, fn, params)
+                ),
+            )
+        return await future
+
+    async def _flush(
+        self,
+        requests: list[tuple[dict, asyncio.Future]],
+        name: str,
+        function: str,
+        fn: Callable,
+        params: dict,
+    ) -> None:
+        try:
+            results = await asyncio.to_thread(
+                self._compute,
+                name,
+                function,
+                fn,
+                params,
+                [inputs for inputs, _ in requests],
+            )
+        except Exception:
+            # One invalid call fails the batch, so each call is retried on its
+            # own to report the error to its caller only.
+            results = []
+            for inputs, _ in requests:
+                try:
+                    results.append(await asyncio.to_thread(fn, **params, **inputs))
+                except Exception as error:
+                    results.append(error)
+        for (_, future), result in zip(requests, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _compute(
+        self,
+        name: str,
+        function: str,
+        fn: Callable,
+        params: dict,
+        batch: list[dict[str, np.ndarray]],
+    ) -> list[dict]:
+        results: list[dict | None] = [None] * len(batch)
+        by_length: dict[int, list[int]] = {}
+        for i, inputs in enumerate(batch):
+            lengths = {len(values) for values in inputs.values()}
+            if len(lengths) == 1:
+                by_length.setdefault(lengths.pop(), []).append(i)
+        for indices in by_length.values():
+            if len(indices) < 2:
+                continue
+            panel = self.indicators.compute_kernel(
+                function,
+                params,
+                {
+                    input_name: np.stack([batch[i][input_name] for i in indices])
+                    for input_name in batch[indices[0]]
+                },
+            )
+            if panel is not None:
+                for row, i in enumerate(indices):
+                    results[i] = {
+                        output: values[row] for output, values in panel.items()
+                    }
+        remaining = [i for i, result in enumerate(results) if result is None]
+        if remaining:
+            rows = self.indicators.compute_rows(
+                name, function, fn, params, [(batch[i], None, {}) for i in remaining]
+            )
+            for i, result in zip(remaining, rows, strict=True):
+                results[i] = result
+        return results
@@ -0,0 +1,275 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import orjson
+import talib
+
+from .encoding import encode_json
+from .hashing import digest_bytes, fingerprint
+
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHE_TTL = 3600.0
+DEFAULT_DISK_CACHE_SIZE = 1024 * 1024 * 1024
+
+
+def input_digest(array: np.ndarray, content: str | None = None) -> str:
+    """Return the cache key component identifying one input array.
+
+    ``content`` is the array's precomputed content fingerprint, if known.
+    """
+    if content is None:
+        content = fingerprint(array)
+    return f"{array.dtype.str}{array.shape}:{content}"
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int | float):
+        # 2 and 2.0 select the same TA-Lib computation.
+        return float(value)
+    return repr(value)
+
+
+@dataclass
+class CacheEntry:
+    """An indicator result together with its encoded response bytes."""
+
+    key: str
+    result: dict[str, Any]
+    encoded: bytes
+    expires_at: float | None = None
+
+    @property
+    def nbytes(self) -> int:
+        arrays = sum(
+            value.nbytes
+            for value in self.result.values()
+            if isinstance(value, np.ndarray)
+        )
+        return len(self.encoded) + arrays
+
+
+class DiskCache:
+    """SQLite-backed store of encoded results that survives restarts.
+
+    Entries are keyed by the same content-derived key as the in-memory cache and
+    never go stale, so there is no TTL; the least recently read entries are
+    deleted once the stored bytes exceed ``max_bytes``. The store is cleared if
+    it was written by a different TA-Lib version.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_DISK_CACHE_SIZE):
+        os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(directory, "results.sqlite3"), check_same_thread=False
+        )
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, "
+                "encoded BLOB NOT NULL, size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+            )
+            row = self._db.execute(
+                "SELECT value FROM meta WHERE name = 'talib_version'"
+            ).fetchone()
+            if row is None or row[0] != talib.__version__:
+                self._db.execute("DELETE FROM results")
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('talib_version', ?)",
+                    (talib.__version__,),
+                )
+        self._size, self._clock = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(accessed), 0) FROM results"
+        ).fetchone()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT encoded FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (self._tick(), key)
+            )
+            return row[0]
+
+    def put(self, key: str, encoded: bytes) -> None:
+        if len(encoded) > self.max_bytes:
+            return
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT size FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._size -= row[0]
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, encoded, len(encoded), self._tick()),
+            )
+            self._size += len(encoded)
+            while self._size > self.max_bytes:
+                oldest, size = self._db.execute(
+                    "SELECT key, size FROM results ORDER BY accessed LIMIT 1"
+                ).fetchone()
+                self._db.execute("DELETE FROM results WHERE key = ?", (oldest,))
+                self._size -= size
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+            self._size = 0
+
+    def _tick(self) -> int:
+        """Return the next value of the access counter used for LRU ordering."""
+        self._clock += 1
+        return self._clock
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"entries": entries, "bytes": self._size, "max_bytes": self.max_bytes}
+
+
+class ResultCache:
+    """In-process cache of encoded indicator results.
+
+    Entries are keyed by the tool name, its normalized parameters and the content
+    digest of every input array, so identical requests on identical data are
+    served without calling TA-Lib or re-encoding the response. The cache is
+    bounded to ``max_bytes`` with least-recently-used eviction, and entries older
+    than ``ttl`` seconds are discarded. A ``max_bytes`` of 0 disables caching.
+
+    When a ``disk`` cache is given, every result is also written to it and
+    memory misses fall back to it, so results survive a process restart.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_SIZE,
+        ttl: float | None = DEFAULT_CACHE_TTL,
+        disk: DiskCache | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk = disk
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(
+        tool: str,
+        params: dict[str, Any],
+        inputs: dict[str, np.ndarray],
+        digests: dict[str, str] | None = None,
+    ) -> str:
+        """Build the cache key of a tool call.
+
+        ``digests`` maps input names to already known ``input_digest`` values,
+        which are used instead of hashing those inputs again.
+        """
+        digests = digests or {}
+        parts = [
+            tool,
+            sorted((name, _normalize(value)) for name, value in params.items()),
+            sorted(
+                (name, digests.get(name) or input_digest(array))
+                for name, array in inputs.items()
+            ),
+        ]
+        return digest_bytes(repr(parts).encode())
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= time.monotonic():
+                    self._remove(key)
+                    self.expirations += 1
+                    entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        encoded = self.disk.get(key) if self.disk is not None else None
+        with self._lock:
+            if encoded is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+        entry = CacheEntry(key, orjson.loads(encoded), encoded)
+        self._insert(entry)
+        return entry
+
+    def put(self, key: str, result: dict[str, Any]) -> CacheEntry:
+        """Encode a result and cache it, returning the new entry."""
+        entry = CacheEntry(key, result, encode_json(result))
+        if self.disk is not None:
+            self.disk.put(key, entry.encoded)
+        self._insert(entry)
+        return entry
+
+    def _insert(self, entry: CacheEntry) -> None:
+        if self.ttl is not None:
+            entry.expires_at = time.monotonic() + self.ttl
+        if entry.nbytes > self.max_bytes:
+            return
+        key = entry.key
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += entry.nbytes
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict[str, Any]:
+        disk = self.disk.stats() if self.disk is not None else None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "disk": disk,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.nbytes
@@ -0,0 +1,428 @@
+import functools
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import talib
+
+PATTERN_INPUTS = ("open", "high", "low", "close")
+
+
+@dataclass(frozen=True)
+class CandleSetting:
+    """How TA-Lib judges a candle feature as long, short, near, etc.
+
+    The threshold is ``factor`` times the average of ``range_type`` over the
+    preceding ``period`` candles, or over the candle itself when ``period`` is
+    zero. Averages of upper plus lower shadows are halved.
+    """
+
+    range_type: str
+    period: int
+    factor: float
+
+
+# TA-Lib's default candle settings.
+SETTINGS = {
+    "BodyLong": CandleSetting("RealBody", 10, 1.0),
+    "BodyVeryLong": CandleSetting("RealBody", 10, 3.0),
+    "BodyShort": CandleSetting("RealBody", 10, 1.0),
+    "BodyDoji": CandleSetting("HighLow", 10, 0.1),
+    "ShadowLong": CandleSetting("RealBody", 0, 1.0),
+    "ShadowVeryLong": CandleSetting("RealBody", 0, 2.0),
+    "ShadowShort": CandleSetting("Shadows", 10, 1.0),
+    "ShadowVeryShort": CandleSetting("HighLow", 10, 0.1),
+    "Near": CandleSetting("HighLow", 5, 0.2),
+    "Far": CandleSetting("HighLow", 5, 0.6),
+    "Equal": CandleSetting("HighLow", 5, 0.05),
+}
+
+
+_OPERATORS = {"<": np.less, "<=": np.less_equal, ">": np.greater}
+
+
+class CandleFeatures:
+    """Per-candle features of one set of OHLC bars, each computed once.
+
+    Detectors read them through ``ago``, ``threshold`` and ``compare`` as views
+    aligned on the candles a pattern evaluates, so shifting a feature by a few
+    candles does not copy it. Comparisons of a feature with a threshold are
+    cached too, since several patterns test e.g. for a long body one candle ago.
+
+    ``average`` reproduces TA-Lib's running totals exactly: TA-Lib sums the
+    first window and then adds and removes one candle per step, so the rounding
+    of an average depends on the candle at which its total was started, which
+    is part of the cache key.
+    """
+
+    def __init__(self, open, high, low, close):
+        self.length = len(close)
+        self._features = {"open": open, "high": high, "low": low, "close": close}
+        self._averages: dict[tuple[CandleSetting, int], np.ndarray] = {}
+        self._means: dict[tuple[str, int, int], np.ndarray] = {}
+        self._differences: dict[tuple[str, int], np.ndarray] = {}
+        self._comparisons: dict[tuple, np.ndarray] = {}
+
+    def feature(self, name: str) -> np.ndarray:
+        if name not in self._features:
+            self._features[name] = getattr(self, "_" + name)()
+        return self._features[name]
+
+    def _white(self) -> np.ndarray:
+        return self.feature("close") >= self.feature("open")
+
+    def _color(self) -> np.ndarray:
+        """1 for white (rising) candles and -1 for black ones."""
+        color = self.feature("white").astype(np.int32)
+        color *= 2
+        color -= 1
+        return color
+
+    def _body(self) -> np.ndarray:
+        body = self.feature("close") - self.feature("open")
+        return np.abs(body, out=body)
+
+    def _top(self) -> np.ndarray:
+        # TA-Lib takes the open whenever close >= open is false, even for NaN.
+        return _unless_nan(
+            np.maximum(self.feature("close"), self.feature("open")),
+            self.feature("open"),
+        )
+
+    def _bottom(self) -> np.ndarray:
+        return _unless_nan(
+            np.minimum(self.feature("close"), self.feature("open")),
+            self.feature("close"),
+        )
+
+    def _upper_shadow(self) -> np.ndarray:
+        return self.feature("high") - self.feature("top")
+
+    def _lower_shadow(self) -> np.ndarray:
+        return self.feature("bottom") - self.feature("low")
+
+    def _high_low(self) -> np.ndarray:
+        return self.feature("high") - self.feature("low")
+
+    def _shadows(self) -> np.ndarray:
+        return self.feature("upper_shadow") + self.feature("lower_shadow")
+
+    def range(self, range_type: str) -> np.ndarray:
+        if range_type == "RealBody":
+            return self.feature("body")
+        if range_type == "HighLow":
+            return self.feature("high_low")
+        return self.feature("shadows")
+
+    def average(self, name: str, start: int) -> np.ndarray:
+        """Return the threshold of a setting for the candles from ``start`` on."""
+        setting = SETTINGS[name]
+        # Settings that only differ by name, like BodyLong and BodyShort, share.
+        key = (setting, start)
+        if key not in self._averages:
+            if setting.period == 0:
+                average = self.range(setting.range_type)[start:]
+            else:
+                average = self._mean(setting.range_type, setting.period, start)
+            if setting.factor != 1.0:
+                average = setting.factor * average
+            if setting.range_type == "Shadows":
+                average = average / 2.0
+            self._averages[key] = average
+        return self._averages[key]
+
+    def _mean(self, range_type: str, period: int, start: int) -> np.ndarray:
+        """Return TA-Lib's running mean of a range over the preceding candles."""
+        key = (range_type, period, start)
+        if key not in self._means:
+            values = self.range(range_type)
+            steps = self._steps(range_type, period)
+            mean = np.empty(self.length - start)
+            mean[:1] = np.cumsum(values[start - period : start])[-1:]
+            mean[1:] = steps[start - period : self.length - 1 - period]
+            np.cumsum(mean, out=mean)
+            mean /= period
+            self._means[key] = mean
+        return self._means[key]
+
+    def _steps(self, range_type: str, period: int) -> np.ndarray:
+        """Return the change of a running total of ``period`` candles per candle."""
+        key = (range_type, period)
+        if key not in self._differences:
+            values = self.range(range_type)
+            self._differences[key] = values[period:] - values[:-period]
+        return self._differences[key]
+
+    def ago(self, name: str, k: int, lookback: int) -> np.ndarray:
+        """Return a feature of candle ``i - k`` for each evaluated candle ``i``."""
+        return self.feature(name)[lookback - k : self.length - k]
+
+    def threshold(self, name: str, k: int, lookback: int) -> np.ndarray:
+        """Return a setting's threshold for candle ``i - k``."""
+        average = self.average(name, lookback - k)
+        return average[: len(average) - k] if k else average
+
+    def compare(
+        self, name: str, operator: str, setting: str, k: int, lookback: int
+    ) -> np.ndarray:
+        """Compare a feature of candle ``i - k`` with a setting's threshold."""
+        key = (name, operator, setting, k, lookback)
+        if key not in self._comparisons:
+            self._comparisons[key] = _OPERATORS[operator](
+                self.ago(name, k, lookback), self.threshold(setting, k, lookback)
+            )
+        return self._comparisons[key]
+
+
+def _gap_up(f: CandleFeatures, k: int, lookback: int) -> np.ndarray:
+    """Whether the real body of candle ``i - k`` gaps up from the one before."""
+    return f.ago("bottom", k, lookback) > f.ago("top", k + 1, lookback)
+
+
+def _gap_down(f: CandleFeatures, k: int, lookback: int) -> np.ndarray:
+    return f.ago("top", k, lookback) < f.ago("bottom", k + 1, lookback)
+
+
+def _unless_nan(values: np.ndarray, fallback: np.ndarray) -> np.ndarray:
+    missing = np.isnan(values)
+    if missing.any():
+        values[missing] = fallback[missing]
+    return values
+
+
+def _hits(hit: np.ndarray, signal=100) -> tuple[np.ndarray, np.ndarray]:
+    """Return the candles where a pattern is found and its signal there.
+
+    ``signal`` is a constant or a function of the candles found.
+    """
+    candles = np.flatnonzero(hit)
+    if callable(signal):
+        return candles, signal(candles).astype(np.int32)
+    return candles, np.full(len(candles), signal, dtype=np.int32)
+
+
+def _engulfing(f: CandleFeatures, lookback: int, params):
+    white, previous = f.ago("white", 0, lookback), f.ago("white", 1, lookback)
+    o, c = f.ago("open", 0, lookback), f.ago("close", 0, lookback)
+    po, pc = f.ago("open", 1, lookback), f.ago("close", 1, lookback)
+    rising = white & ~previous & (((c >= po) & (o < pc)) | ((c > po) & (o <= pc)))
+    falling = ~white & previous & (((o >= pc) & (c < po)) | ((o > pc) & (c <= po)))
+
+    def signal(i):
+        # 100 for a full engulfing, 80 when the bodies share an end.
+        full = (o[i] != pc[i]) & (c[i] != po[i])
+        return np.where(full, 100, 80) * f.ago("color", 0, lookback)[i]
+
+    return _hits(rising | falling, signal)
+
+
+def _doji(f: CandleFeatures, lookback: int, params):
+    return _hits(f.compare("body", "<=", "BodyDoji", 0, lookback))
+
+
+def _doji_star(f: CandleFeatures, lookback: int, params):
+    hit = f.compare("body", ">", "BodyLong", 1, lookback) & f.compare(
+        "body", "<=", "BodyDoji", 0, lookback
+    )
+    # The doji must gap away from the previous body in its direction.
+    i = np.flatnonzero(hit)
+    hit[i] = np.where(
+        f.ago("white", 1, lookback)[i],
+        f.ago("bottom", 0, lookback)[i] > f.ago("top", 1, lookback)[i],
+        f.ago("top", 0, lookback)[i] < f.ago("bottom", 1, lookback)[i],
+    )
+    return _hits(hit, lambda j: -100 * f.ago("color", 1, lookback)[j])
+
+
+def _dragonfly_doji(f: CandleFeatures, lookback: int, params):
+    return _hits(
+        f.compare("body", "<=", "BodyDoji", 0, lookback)
+        & f.compare("upper_shadow", "<", "ShadowVeryShort", 0, lookback)
+        & f.compare("lower_shadow", ">", "ShadowVeryShort", 0, lookback)
+    )
+
+
+def _gravestone_doji(f: CandleFeatures, lookback: int, params):
+    return _hits(
+        f.compare("body", "<=", "BodyDoji", 0, lookback)
+        & f.compare("lower_shadow", "<", "ShadowVeryShort", 0, lookback)
+        & f.compare("upper_shadow", ">", "ShadowVeryShort", 0, lookback)
+    )
+
+
+def _long_legged_doji(f: CandleFeatures, lookback: int, params):
+    return _hits(
+        f.compare("body", "<=", "BodyDoji", 0, lookback)
+        & (
+            f.compare("lower_shadow", ">", "ShadowLong", 0, lookback)
+            | f.compare("upper_shadow", ">", "ShadowLong", 0, lookback)
+        )
+    )
+
+
+def _hammer(f: CandleFeatures, lookback: int, params):
+    hit = (
+        f.compare("body", "<", "BodyShort", 0, lookback)
+        & f.compare("lower_shadow", ">", "ShadowLong", 0, lookback)
+        & f.compare("upper_shadow", "<", "ShadowVeryShort", 0, lookback)
+    )
+    # The body must also be near the previous candle's low.
+    i = np.flatnonzero(hit)
+    hit[i] = f.ago("bottom", 0, lookback)[i] <= (
+        f.ago("low", 1, lookback)[i] + f.threshold("Near", 1, lookback)[i]
+    )
+    return _hits(hit)
+
+
+def _harami(body_setting: str):
+    def harami(f: CandleFeatures, lookback: int, params):
+        hit = f.compare("body", ">", "BodyLong", 1, lookback) & f.compare(
+            "body", "<=", body_setting, 0, lookback
+        )
+
+        def body_within(i, strictly: bool):
+            top, bottom = f.ago("top", 0, lookback)[i], f.ago("bottom", 0, lookback)[i]
+            previous_top = f.ago("top", 1, lookback)[i]
+            previous_bottom = f.ago("bottom", 1, lookback)[i]
+            if strictly:
+                return (top < previous_top) & (bottom > previous_bottom)
+            return (top <= previous_top) & (bottom >= previous_bottom)
+
+        i = np.flatnonzero(hit)
+        hit[i] = body_within(i, strictly=False)
+
+        def signal(j):
+            # 100 when the body is strictly inside the previous one, 80 otherwise.
+            strength = np.where(body_within(j, strictly=True), 100, 80)
+            return -strength * f.ago("color", 1, lookback)[j]
+
+        return _hits(hit, signal)
+
+    return harami
+
+
+def _star(middle_setting: str, direction: int):
+    """Morning (``direction`` 1) and evening (-1) stars and doji stars."""
+
+    def star(f: CandleFeatures, lookback: int, params):
+        penetration = params.get("penetration", 0.3)
+        rising = direction == 1
+        hit = (
+            f.compare("body", ">", "BodyLong", 2, lookback)
+            & (f.ago("white", 2, lookback) != rising)
+            & f.compare("body", "<=", middle_setting, 1, lookback)
+            & (_gap_down(f, 1, lookback) if rising else _gap_up(f, 1, lookback))
+            & f.compare("body", ">", "BodyShort", 0, lookback)
+            & (f.ago("white", 0, lookback) == rising)
+        )
+        i = np.flatnonzero(hit)
+        close = f.ago("close", 0, lookback)[i]
+        threshold = f.ago("close", 2, lookback)[i] + direction * (
+            f.ago("body", 2, lookback)[i] * penetration
+        )
+        # TA-Lib builds may fuse this multiply-add, which rounds differently,
+        # so a close within an ulp of the threshold is left to TA-Lib.
+        if np.any(np.abs(close - threshold) <= np.abs(np.spacing(threshold))):
+            return None
+        hit[i] = direction * (close - threshold) > 0
+        return _hits(hit, direction * 100)
+
+    return star
+
+
+# Pattern detectors over shared candle features, by TA-Lib function name. A
+# detector returns the candles, counted from ``lookback``, where the pattern is
+# found and its signal there, or None when TA-Lib has to decide the result.
+PATTERNS: dict[
+    str,
+    Callable[
+        [CandleFeatures, int, dict[str, Any]],
+        tuple[np.ndarray, np.ndarray] | None,
+    ],
+] = {
+    "CDLENGULFING": _engulfing,
+    "CDLDOJI": _doji,
+    "CDLDOJISTAR": _doji_star,
+    "CDLDRAGONFLYDOJI": _dragonfly_doji,
+    "CDLGRAVESTONEDOJI": _gravestone_doji,
+    "CDLLONGLEGGEDDOJI": _long_legged_doji,
+    "CDLHAMMER": _hammer,
+    "CDLHARAMI": _harami("BodyShort"),
+    "CDLHARAMICROSS": _harami("BodyDoji"),
+    "CDLMORNINGSTAR": _star("BodyShort", 1),
+    "CDLEVENINGSTAR": _star("BodyShort", -1),
+    "CDLMORNINGDOJISTAR": _star("BodyDoji", 1),
+    "CDLEVENINGDOJISTAR": _star("BodyDoji", -1),
+}
+
+
+@functools.cache
+def _lookback(pattern: str) -> int:
+    return talib.abstract.Function(pattern).lookback
+
+
+class CandleEngine:
+    """Evaluates candlestick patterns on one set of OHLC bars.
+
+    The features all patterns share are computed once, and each supported
+    pattern is a few vectorized comparisons over them. Like TA-Lib's wrapper,
+    bars before the first one without NaN values are skipped and a pattern
+    reports 0 for the candles it cannot evaluate.
+    """
+
+    def __init__(self, inputs: dict[str, np.ndarray]):
+        self.length = len(inputs["close"])
+        missing = np.zeros(self.length, dtype=bool)
+        for name in PATTERN_INPUTS:
+            missing |= np.isnan(inputs[name])
+        self.begin = int(np.argmin(missing)) if not missing.all() else self.length
+        self.features = CandleFeatures(
+            *(inputs[name][self.begin :] for name in PATTERN_INPUTS)
+        )
+
+    @staticmethod
+    def supports(pattern: str) -> bool:
+        return pattern in PATTERNS and calibrated(pattern)
+
+    def hits(
+        self, pattern: str, params: dict[str, Any]
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the bars where a pattern is found and its non-zero outputs.
+
+        Returns None if TA-Lib has to compute the pattern.
+        """
+        lookback = _lookback(pattern)
+        if self.begin + lookback >= self.length:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.int32)
+        found = PATTERNS[pattern](self.features, lookback, params)
+        if found is None:
+            return None
+        candles, signal = found
+        return candles + (self.begin + lookback), signal
+
+    def evaluate(self, pattern: str, params: dict[str, Any]) -> np.ndarray | None:
+        """Return the pattern's output, or None if TA-Lib has to compute it."""
+        found = self.hits(pattern, params)
+        if found is None:
+            return None
+        result = np.zeros(self.length, dtype=np.int32)
+        result[found[0]] = found[1]
+        return result
+
+
+@functools.cache
+def calibrated(pattern: str) -> bool:
+    """Check that a detector reproduces the installed TA-Lib bit for bit."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=5000))
+    open = close + rng.normal(size=5000) * rng.choice([0.01, 0.3, 2.0], size=5000)
+    bars = {
+        "open": open,
+        "high": np.maximum(open, close) + rng.random(5000) * rng.choice([0, 1], 5000),
+        "low": np.minimum(open, close) - rng.random(5000) * rng.choice([0, 1], 5000),
+        "close": close,
+    }
+    params = dict(talib.abstract.Function(pattern).parameters)
+    expected = getattr(talib, pattern)(*bars.values(), **params)
+    return np.array_equal(CandleEngine(bars).evaluate(pattern, params), expected)
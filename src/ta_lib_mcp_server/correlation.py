@@ -0,0 +1,222 @@
+import base64
+from typing import Any
+
+import numpy as np
+
+from .indicator_tools import IndicatorTools
+from .results import DEFAULT_STORE_LIMIT
+from .tools.statistic_functions import calculate_beta
+
+# A rolling matrix may use at most as much memory as the result store.
+MAX_MATRIX_VALUES = DEFAULT_STORE_LIMIT // 8
+
+METHODS = ("correlation", "covariance")
+
+# TA-Lib treats values closer to zero than this as zero.
+_ZERO = 1e-8
+
+# Rolling matrices are computed in blocks of about this many values.
+_BLOCK_VALUES = 1 << 20
+
+# A variance this small relative to the sum of squares it is computed from is
+# rounding error, and the series is taken as constant over the window.
+_NEGLIGIBLE = 1e-12
+
+
+def _finish(
+    cross: np.ndarray, sums: np.ndarray, period: int, method: str
+) -> np.ndarray:
+    """Turn windowed sums of products and values into matrices.
+
+    ``cross`` holds the sums of ``x_i * x_j`` with shape ``[..., N, N]`` and
+    ``sums`` the sums of ``x_i`` with shape ``[..., N]``.
+    """
+    magnitudes = np.diagonal(cross, axis1=-2, axis2=-1).copy()
+    # Sums of the products of deviations from the window means.
+    cross = cross - sums[..., :, None] * sums[..., None, :] / period
+    if method == "covariance":
+        return cross / period
+    squares = np.diagonal(cross, axis1=-2, axis2=-1)
+    constant = squares <= _NEGLIGIBLE * magnitudes
+    with np.errstate(divide="ignore", invalid="ignore"):
+        matrix = cross / np.sqrt(squares[..., :, None] * squares[..., None, :])
+    # Like TA-Lib's CORREL, a constant series correlates zero with any other.
+    matrix[constant[..., :, None] | constant[..., None, :]] = 0.0
+    return matrix
+
+
+def latest_matrix(panel: np.ndarray, period: int, method: str) -> np.ndarray:
+    """Return the N x N matrix over the last ``period`` bars of a panel."""
+    window = panel[:, -period:]
+    window = window - window.mean(axis=1, keepdims=True)
+    return _finish(window @ window.T, window.sum(axis=1), period, method)
+
+
+def rolling_matrix(panel: np.ndarray, period: int, method: str) -> np.ndarray:
+    """Return the N x N matrix of every window, with shape [bars, N, N].
+
+    The windowed moments are differences of running sums of the values and
+    of their pairwise products, so every bar costs O(N^2) whatever the
+    period. The running sums restart for every block of a few periods of
+    bars, taken about the block's mean, so their rounding errors stay as
+    small as those of summing each window. Matrices before the first full
+    window are NaN.
+    """
+    symbols, length = panel.shape
+    out = np.full((length, symbols, symbols), np.nan)
+    block = max(1, min(_BLOCK_VALUES // symbols**2, 8 * period))
+    for start in range(period - 1, length, block):
+        stop = min(start + block, length)
+        segment = panel[:, start - period + 1 : stop]
+        segment = segment - segment.mean(axis=1, keepdims=True)
+        cross = np.zeros((segment.shape[1] + 1, symbols, symbols))
+        np.cumsum(np.einsum("it,jt->tij", segment, segment), axis=0, out=cross[1:])
+        sums = np.zeros((segment.shape[1] + 1, symbols))
+        np.cumsum(segment.T, axis=0, out=sums[1:])
+        out[start:stop] = _finish(
+            cross[period:] - cross[:-period],
+            sums[period:] - sums[:-period],
+            period,
+            method,
+        )
+    return out
+
+
+def top_pairs(matrix: np.ndarray, symbols: list[str], k: int) -> list[dict[str, Any]]:
+    """Return the ``k`` pairs of distinct symbols with the largest |value|."""
+    first, second = np.triu_indices(len(symbols), k=1)
+    values = matrix[first, second]
+    order = np.argsort(-np.abs(values), kind="stable")[:k]
+    return [
+        {"symbols": [symbols[first[i]], symbols[second[i]]], "value": values[i]}
+        for i in order
+    ]
+
+
+def _returns(prices: np.ndarray) -> np.ndarray:
+    """Return one-bar returns along the last axis, zero after a zero price."""
+    previous = prices[..., :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = (prices[..., 1:] - previous) / previous
+    returns[np.abs(previous) < _ZERO] = 0.0
+    return returns
+
+
+def latest_beta(panel: np.ndarray, benchmark: np.ndarray, period: int) -> np.ndarray:
+    """Return the latest beta of every series of a panel against a benchmark.
+
+    Beta is the covariance of the series' and the benchmark's one-bar returns
+    over the last ``period`` returns, divided by the variance of the
+    benchmark's, as TA-Lib's ``BETA(benchmark, series)`` computes it. The
+    benchmark's sums are computed once for all series.
+    """
+    x = _returns(benchmark[-period - 1 :])
+    y = _returns(panel[:, -period - 1 :])
+    x_sum = x.sum()
+    x_squares = period * (x @ x)
+    x_variance = x_squares - x_sum * x_sum
+    # Like TA-Lib, a benchmark constant over the window gives a beta of zero.
+    if x_variance <= _NEGLIGIBLE * x_squares:
+        return np.zeros(len(panel))
+    return (period * (y @ x) - x_sum * y.sum(axis=1)) / x_variance
+
+
+def run_beta(
+    indicators: IndicatorTools,
+    panel: np.ndarray,
+    benchmark: np.ndarray,
+    symbols: list[str],
+    timeperiod: int,
+    rolling: bool = False,
+) -> dict[str, Any]:
+    """Compute the beta of every symbol of a panel against a benchmark.
+
+    Latest betas are computed for all symbols at once. TA-Lib's single pass
+    is faster than any array arithmetic for whole series, so with
+    ``rolling`` each symbol's series is computed by TA-Lib's BETA on the
+    panel workers.
+    """
+    if len(symbols) != len(panel):
+        raise ValueError(f"Got {len(symbols)} symbols for {len(panel)} series")
+    if panel.shape[1] != len(benchmark):
+        raise ValueError("The series and the benchmark differ in length")
+    if timeperiod < 1:
+        raise ValueError("timeperiod must be at least 1")
+    if len(benchmark) <= timeperiod:
+        raise ValueError(
+            f"The series have {len(benchmark)} bars; beta over {timeperiod} "
+            "returns needs more"
+        )
+    if rolling:
+        rows = indicators.compute_rows(
+            "beta_panel",
+            "BETA",
+            calculate_beta,
+            {"timeperiod": timeperiod},
+            [({"real0": benchmark, "real1": row}, None, {}) for row in panel],
+        )
+        beta = np.stack([row["beta"] for row in rows])
+    else:
+        beta = latest_beta(panel, benchmark, timeperiod)
+    return {"timeperiod": timeperiod, "symbols": symbols, "beta": beta}
+
+
+def run_correlation(
+    panel: np.ndarray,
+    symbols: list[str],
+    timeperiod: int,
+    method: str = "correlation",
+    rolling: bool = False,
+    top_k: int | None = None,
+    encoding: str = "json",
+) -> dict[str, Any]:
+    """Compute the correlation or covariance matrix of a panel of symbols.
+
+    Covariances are population covariances, as TA-Lib's VAR is a population
+    variance, and correlations equal TA-Lib's CORREL for every pair. With
+    ``rolling`` the matrix of every window is returned, with shape
+    [bars, N, N]; otherwise only that of the last window. ``top_k`` adds the
+    pairs with the strongest latest value. With the ``base64`` encoding the
+    matrix is returned as little-endian float64 bytes in row-major order
+    under ``values`` instead of nested lists under ``matrix``.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; use one of {list(METHODS)}")
+    if panel.ndim != 2 or len(panel) < 2:
+        raise ValueError("The panel needs at least two series of equal length")
+    if len(symbols) != len(panel):
+        raise ValueError(f"Got {len(symbols)} symbols for {len(panel)} series")
+    if timeperiod < 2:
+        raise ValueError("timeperiod must be at least 2")
+    if panel.shape[1] < timeperiod:
+        raise ValueError(
+            f"The series have {panel.shape[1]} bars, fewer than timeperiod"
+        )
+    if np.isnan(panel).any():
+        raise ValueError("The panel contains NaN values")
+    if rolling:
+        size = panel.shape[1] * len(panel) ** 2
+        if size > MAX_MATRIX_VALUES:
+            raise ValueError(
+                f"The rolling matrices hold {size} values, more than the "
+                f"{MAX_MATRIX_VALUES} allowed; pass fewer symbols or bars"
+            )
+        matrix = rolling_matrix(panel, timeperiod, method)
+        latest = matrix[-1]
+    else:
+        matrix = latest = latest_matrix(panel, timeperiod, method)
+    result: dict[str, Any] = {
+        "method": method,
+        "timeperiod": timeperiod,
+        "symbols": symbols,
+        "shape": list(matrix.shape),
+    }
+    if encoding == "base64":
+        result["values"] = base64.b64encode(matrix.astype("<f8").tobytes()).decode()
+    elif encoding == "json":
+        result["matrix"] = matrix
+    else:
+        raise ValueError(f"Unknown encoding {encoding!r}; use json or base64")
+    if top_k is not None:
+        result["pairs"] = top_pairs(latest, symbols, top_k)
+    return result
@@ -0,0 +1,381 @@
+import os
+import re
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .cache import input_digest
+from .hashing import Fingerprint, to_float64_array
+
+# Column read for the generic ``real`` input when a dataset does not name one.
+DEFAULT_COLUMNS = {"real": "close"}
+DEFAULT_RESIDENT_SIZE = 1024 * 1024 * 1024
+DEFAULT_DERIVED_SIZE = 64 * 1024 * 1024
+
+_SAFE_NAME = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_.-]*")
+
+
+class DerivedResults:
+    """Indicator results kept on a dataset to extend them when bars are appended.
+
+    Bounded to ``max_bytes`` of result arrays with least-recently-used
+    eviction; an evicted result is recomputed in full on its next use.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_DERIVED_SIZE):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._results: OrderedDict[Any, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._results.get(key)
+            if item is None:
+                return None
+            self._results.move_to_end(key)
+            return item[0]
+
+    def put(self, key: Any, derived: Any) -> None:
+        size = sum(
+            value.nbytes
+            for value in derived.result.values()
+            if isinstance(value, np.ndarray)
+        )
+        with self._lock:
+            previous = self._results.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            if size > self.max_bytes:
+                return
+            self._results[key] = (derived, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, evicted) = self._results.popitem(last=False)
+                self.nbytes -= evicted
+
+    def copy(self) -> "DerivedResults":
+        copied = DerivedResults(self.max_bytes)
+        with self._lock:
+            copied._results = OrderedDict(self._results)
+            copied.nbytes = self.nbytes
+        return copied
+
+
+@dataclass
+class Dataset:
+    """A named set of equal-length float64 columns registered by a client.
+
+    Column fingerprints and finiteness are computed on first use, so opening a
+    memory-mapped dataset does not read its data.
+    """
+
+    name: str
+    columns: dict[str, np.ndarray]
+    fingerprints: dict[str, Fingerprint] = field(default_factory=dict)
+    finite: dict[str, bool] = field(default_factory=dict)
+    # Indicator results on this dataset kept for extension by later appends.
+    derived: DerivedResults = field(default_factory=DerivedResults, repr=False)
+
+    @property
+    def length(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.columns.values())
+
+    def column(self, name: str) -> np.ndarray:
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise ValueError(
+                f"Dataset {self.name!r} has no column {name!r}; "
+                f"available columns: {sorted(self.columns)}"
+            ) from None
+
+    def fingerprint(self, name: str) -> Fingerprint:
+        if name not in self.fingerprints:
+            self.fingerprints[name] = Fingerprint(self.column(name))
+        return self.fingerprints[name]
+
+    def is_finite(self, name: str) -> bool:
+        if name not in self.finite:
+            self.finite[name] = bool(np.isfinite(self.column(name)).all())
+        return self.finite[name]
+
+    def digest(self, name: str) -> str:
+        """Return the cache key digest of a column without rehashing it."""
+        return input_digest(self.column(name), self.fingerprint(name).hexdigest())
+
+    def check_append(self, columns: dict[str, np.ndarray]) -> None:
+        if set(columns) != set(self.columns):
+            raise ValueError(
+                f"Appended bars must cover exactly the columns {sorted(self.columns)}"
+            )
+        _check_lengths(columns)
+
+    def append(
+        self,
+        columns: dict[str, np.ndarray],
+        extended: dict[str, np.ndarray] | None = None,
+    ) -> "Dataset":
+        """Return a new snapshot with bars appended, hashing only the new bars.
+
+        ``extended`` holds the already extended columns, e.g. remapped files;
+        otherwise the new bars are concatenated in memory.
+        """
+        self.check_append(columns)
+        if extended is None:
+            extended = {
+                column: np.concatenate([values, columns[column]])
+                for column, values in self.columns.items()
+            }
+        return Dataset(
+            self.name,
+            extended,
+            {
+                column: fingerprint.copy().update(columns[column])
+                for column, fingerprint in self.fingerprints.items()
+            },
+            {
+                column: finite and bool(np.isfinite(columns[column]).all())
+                for column, finite in self.finite.items()
+            },
+            self.derived.copy(),
+        )
+
+    def describe(self) -> dict:
+        return {
+            "dataset": self.name,
+            "length": self.length,
+            "columns": sorted(self.columns),
+            "nbytes": self.nbytes,
+        }
+
+
+def _to_arrays(columns: dict[str, list[float]]) -> dict[str, np.ndarray]:
+    return {column: to_float64_array(values) for column, values in columns.items()}
+
+
+def _check_lengths(columns: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    lengths = {column: len(values) for column, values in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Dataset columns must have equal lengths, got {lengths}")
+    return columns
+
+
+def _check_name(kind: str, name: str) -> str:
+    if not _SAFE_NAME.fullmatch(name):
+        raise ValueError(
+            f"Invalid {kind} name {name!r}: use letters, digits, '_', '-' and '.'"
+        )
+    return name
+
+
+class ColumnStore:
+    """Datasets stored as memory-mapped column files.
+
+    Each dataset is a directory holding one file of raw little-endian float64
+    values per column, so a dataset is reopened by mapping its files without
+    parsing or copying them, and appending bars only writes the new values.
+    """
+
+    suffix = ".f64"
+    dtype = np.dtype("<f8")
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = Path(directory)
+
+    def names(self) -> list[str]:
+        return sorted(
+            path.name
+            for path in self.directory.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        )
+
+    def exists(self, name: str) -> bool:
+        return (self.directory / name).is_dir()
+
+    def write(self, name: str, columns: dict[str, np.ndarray]) -> None:
+        """Store a dataset, atomically replacing any dataset of the same name."""
+        staging = self._staging()
+        for column, values in columns.items():
+            (staging / (column + self.suffix)).write_bytes(
+                values.astype(self.dtype).tobytes()
+            )
+        self.install(name, staging)
+
+    def allocate(
+        self, columns: list[str], length: int
+    ) -> tuple[Path, dict[str, np.ndarray]]:
+        """Create writable, zero-filled mapped columns in a staging directory."""
+        staging = self._staging()
+        arrays = {}
+        for column in columns:
+            path = staging / (column + self.suffix)
+            with path.open("wb") as file:
+                file.truncate(length * self.dtype.itemsize)
+            arrays[column] = np.memmap(path, dtype=self.dtype, mode="r+")
+        return staging, arrays
+
+    def install(self, name: str, staging: Path) -> None:
+        """Make a staging directory the dataset ``name``, replacing any existing."""
+        path = self.directory / name
+        if path.is_dir():
+            # Mappings of the replaced files stay valid until they are closed.
+            retired = path.rename(self._staging_path())
+            staging.rename(path)
+            shutil.rmtree(retired)
+        else:
+            staging.rename(path)
+
+    def discard(self, staging: Path) -> None:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    def _staging_path(self) -> Path:
+        return self.directory / f".staging.{uuid.uuid4().hex}"
+
+    def _staging(self) -> Path:
+        staging = self._staging_path()
+        staging.mkdir()
+        return staging
+
+    def append(self, name: str, columns: dict[str, np.ndarray]) -> None:
+        for column, values in columns.items():
+            with (self.directory / name / (column + self.suffix)).open("ab") as file:
+                file.write(values.astype(self.dtype).tobytes())
+
+    def open(self, name: str) -> dict[str, np.ndarray]:
+        """Map the columns of a dataset read-only."""
+        columns = {}
+        for path in sorted((self.directory / name).glob("*" + self.suffix)):
+            column = path.name.removesuffix(self.suffix)
+            if path.stat().st_size < self.dtype.itemsize:
+                columns[column] = np.empty(0, dtype=self.dtype)
+            else:
+                columns[column] = np.memmap(path, dtype=self.dtype, mode="r")
+        # An append interrupted part-way leaves some columns longer than others.
+        length = min((len(values) for values in columns.values()), default=0)
+        return {column: values[:length] for column, values in columns.items()}
+
+    def delete(self, name: str) -> None:
+        shutil.rmtree(self.directory / name)
+
+
+class DatasetRegistry:
+    """Holds client-uploaded series so tools can reference them by name.
+
+    Datasets are immutable snapshots: appending bars replaces the registered
+    snapshot, so calls already running keep a consistent view of the columns
+    and their fingerprints.
+
+    Given a ``directory``, datasets are written to a ``ColumnStore`` there and
+    served from memory-mapped files, so they survive restarts. Mappings are
+    kept open for at most ``max_resident_bytes`` of data; the least recently
+    used datasets beyond that are closed and remapped on their next use.
+    Each dataset keeps at most ``max_derived_bytes`` of indicator results to
+    extend on append.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_resident_bytes: int = DEFAULT_RESIDENT_SIZE,
+        max_derived_bytes: int = DEFAULT_DERIVED_SIZE,
+    ):
+        self.store = ColumnStore(directory) if directory else None
+        self.max_resident_bytes = max_resident_bytes
+        self.max_derived_bytes = max_derived_bytes
+        self.evictions = 0
+        self._datasets: OrderedDict[str, Dataset] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_names(self, name: str, columns) -> None:
+        """Reject dataset and column names that cannot be stored as files."""
+        if not columns:
+            raise ValueError("A dataset needs at least one column")
+        if self.store is not None:
+            _check_name("dataset", name)
+            for column in columns:
+                _check_name("column", column)
+
+    def register(self, name: str, columns: dict[str, list[float]]) -> Dataset:
+        self.check_names(name, columns)
+        arrays = _check_lengths(_to_arrays(columns))
+        with self._lock:
+            if self.store is not None:
+                self.store.write(name, arrays)
+                arrays = self.store.open(name)
+            return self._insert(self._dataset(name, arrays))
+
+    def install(self, name: str, staging: Path) -> Dataset:
+        """Register the columns written to a ``ColumnStore`` staging directory."""
+        with self._lock:
+            self.store.install(name, staging)
+            return self._insert(self._dataset(name, self.store.open(name)))
+
+    def append(self, name: str, columns: dict[str, list[float]]) -> Dataset:
+        arrays = _to_arrays(columns)
+        with self._lock:
+            dataset = self._get(name)
+            extended = None
+            if self.store is not None:
+                dataset.check_append(arrays)
+                self.store.append(name, arrays)
+                extended = self.store.open(name)
+            return self._insert(dataset.append(arrays, extended))
+
+    def get(self, name: str) -> Dataset:
+        with self._lock:
+            return self._get(name)
+
+    def _get(self, name: str) -> Dataset:
+        dataset = self._datasets.get(name)
+        if dataset is not None:
+            self._datasets.move_to_end(name)
+            return dataset
+        if self.store is not None and self.store.exists(name):
+            return self._insert(self._dataset(name, self.store.open(name)))
+        raise ValueError(f"Unknown dataset: {name!r}")
+
+    def _dataset(self, name: str, columns: dict[str, np.ndarray]) -> Dataset:
+        return Dataset(name, columns, derived=DerivedResults(self.max_derived_bytes))
+
+    def _insert(self, dataset: Dataset) -> Dataset:
+        self._datasets[dataset.name] = dataset
+        self._datasets.move_to_end(dataset.name)
+        if self.store is not None:
+            resident = sum(item.nbytes for item in self._datasets.values())
+            while resident > self.max_resident_bytes and len(self._datasets) > 1:
+                _, evicted = self._datasets.popitem(last=False)
+                resident -= evicted.nbytes
+                self.evictions += 1
+        return dataset
+
+    def drop(self, name: str) -> Dataset:
+        with self._lock:
+            dataset = self._get(name)
+            del self._datasets[name]
+            if self.store is not None:
+                self.store.delete(name)
+            return dataset
+
+    def list(self) -> list[Dataset]:
+        with self._lock:
+            if self.store is None:
+                return list(self._datasets.values())
+            return [
+                self._datasets.get(name) or Dataset(name, self.store.open(name))
+                for name in self.store.names()
+            ]
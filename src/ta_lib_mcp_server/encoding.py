@@ -0,0 +1,28 @@
+from typing import Any
+
+import numpy as np
+import orjson
+
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        # orjson only serializes C-contiguous arrays of native numeric dtypes.
+        if not obj.flags.c_contiguous:
+            return np.ascontiguousarray(obj)
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot encode {type(obj).__name__} as JSON")
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a tool result as compact JSON bytes.
+
+    NumPy arrays are written directly from their buffers without building
+    intermediate Python lists. NaN and infinite values, which TA-Lib uses for
+    the lookback period, are always encoded as ``null``. Values of types
+    orjson cannot encode raise ``TypeError``.
+    """
+    return orjson.dumps(value, default=_default, option=JSON_OPTIONS)
@@ -0,0 +1,48 @@
+import numpy as np
+import xxhash
+
+
+def to_float64_array(data) -> np.ndarray:
+    """Convert input data to the contiguous float64 buffer TA-Lib consumes."""
+    return np.ascontiguousarray(data, dtype=np.float64)
+
+
+class Fingerprint:
+    """Incremental XXH3-128 digest of an array's raw buffer.
+
+    Hashing is streaming, so extending a series by ``k`` values only hashes the
+    new values, and the digest equals that of hashing the extended series from
+    scratch. The digest covers the buffer contents only; callers that need to
+    tell apart arrays of different dtypes or shapes must key on those as well.
+    """
+
+    def __init__(self, array: np.ndarray | None = None):
+        self._hasher = xxhash.xxh3_128()
+        self.length = 0
+        if array is not None:
+            self.update(array)
+
+    def update(self, array: np.ndarray) -> "Fingerprint":
+        """Feed the values appended to the series since the last update."""
+        array = np.ascontiguousarray(array)
+        self._hasher.update(memoryview(array).cast("B"))
+        self.length += len(array)
+        return self
+
+    def copy(self) -> "Fingerprint":
+        clone = Fingerprint.__new__(Fingerprint)
+        clone._hasher = self._hasher.copy()
+        clone.length = self.length
+        return clone
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+def fingerprint(array: np.ndarray) -> str:
+    """Return the content digest of an array's raw buffer."""
+    return xxhash.xxh3_128_hexdigest(memoryview(np.ascontiguousarray(array)).cast("B"))
+
+
+def digest_bytes(data: bytes) -> str:
+    return xxhash.xxh3_128_hexdigest(data)
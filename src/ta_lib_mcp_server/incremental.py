@@ -0,0 +1,836 @@
+import collections
+import copy
+import functools
+import math
+from dataclasses import dataclass, field
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+import talib
+from talib import abstract
+
+from .tools.types import MA_TYPE_MAP
+
+try:
+    from math import fma
+except ImportError:  # Python < 3.13
+    # Veltkamp's constant 2**27 + 1 splits a double into two halves of 26 bits.
+    _SPLIT = 134217729.0
+
+    def fma(x: float, y: float, z: float) -> float:
+        """Return ``x * y + z`` rounded once.
+
+        This is Boldo and Melquiond's emulation, as in ``kernels``: the exact
+        product and sum are split into rounded parts and errors, whose sum is
+        rounded to odd so the final rounding to nearest is correct. Operands
+        so large that the splitting overflows are computed exactly instead,
+        and infinite or NaN operands give what ``x * y + z`` gives.
+        """
+        product = x * y
+        scaled = _SPLIT * x
+        x_high = scaled - (scaled - x)
+        x_low = x - x_high
+        scaled = _SPLIT * y
+        y_high = scaled - (scaled - y)
+        y_low = y - y_high
+        product_error = (
+            (x_high * y_high - product) + x_high * y_low + x_low * y_high
+        ) + x_low * y_low
+        high = z + product
+        virtual = high - z
+        low = (z - (high - virtual)) + (product - virtual)
+        odd = low + product_error
+        virtual = odd - low
+        error = (low - (odd - virtual)) + (product_error - virtual)
+        if error and not int(odd / math.ulp(odd)) & 1:
+            odd = math.nextafter(odd, math.copysign(math.inf, error))
+        result = high + odd
+        if math.isfinite(result):
+            return result
+        if not all(map(math.isfinite, (x, y, z))):
+            return x * y + z
+        return float(Fraction(x) * Fraction(y) + Fraction(z))
+
+
+# Whether ``talib.stream`` returns stateful stream objects, as ta-lib-python
+# 0.8 does; earlier releases return the last value as a plain float.
+STREAM_OBJECTS = hasattr(talib, "InsufficientHistory")
+
+# Functions whose output at bar ``i`` only depends on bars ``i - lookback`` to
+# ``i``, so appended bars are covered by recomputing the last ``lookback + k``
+# bars. Functions taking an MA type are left out because the lookback and the
+# recursion depend on the selected average.
+WINDOWED_FUNCTIONS = frozenset(
+    {
+        "AROON",
+        "AROONOSC",
+        "AVGPRICE",
+        "BETA",
+        "BOP",
+        "CCI",
+        "CORREL",
+        "LINEARREG",
+        "LINEARREG_ANGLE",
+        "LINEARREG_INTERCEPT",
+        "LINEARREG_SLOPE",
+        "MEDPRICE",
+        "MIDPOINT",
+        "MIDPRICE",
+        "MOM",
+        "ROC",
+        "ROCP",
+        "ROCR",
+        "ROCR100",
+        "SMA",
+        "STDDEV",
+        "TRANGE",
+        "TRIMA",
+        "TSF",
+        "TYPPRICE",
+        "VAR",
+        "WCLPRICE",
+        "WILLR",
+        "WMA",
+        *(name for name in talib.get_function_groups()["Pattern Recognition"]),
+    }
+)
+
+# Windowed functions that TA-Lib computes with running sums carried from the
+# first bar, so recomputing their window alone differs from the full series
+# in the last digits.
+RUNNING_SUM_FUNCTIONS = frozenset(
+    {
+        "BETA",
+        "CCI",
+        "CORREL",
+        "LINEARREG",
+        "LINEARREG_ANGLE",
+        "LINEARREG_INTERCEPT",
+        "LINEARREG_SLOPE",
+        "SMA",
+        "STDDEV",
+        "TRIMA",
+        "TSF",
+        "VAR",
+        "WMA",
+    }
+)
+
+
+@dataclass
+class DerivedResult:
+    """An indicator result computed on the first ``length`` bars of a dataset."""
+
+    length: int
+    result: dict[str, Any]
+    state: "RecursiveState | None" = field(default=None, repr=False)
+
+
+def talib_parameters(function: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Return the TA-Lib parameters among ``params``, with MA types as numbers."""
+    parameters = {}
+    for name, default in abstract.Function(function).parameters.items():
+        if name in params:
+            value = params[name]
+            if isinstance(value, str):
+                value = MA_TYPE_MAP[value]
+            parameters[name] = type(default)(value)
+    return parameters
+
+
+def lookback(function: str, params: dict[str, Any]) -> int:
+    """Return the number of leading bars TA-Lib consumes before its first output."""
+    indicator = abstract.Function(function)
+    indicator.set_parameters(talib_parameters(function, params))
+    return indicator.lookback
+
+
+class RecursiveState:
+    """Resumable state of a recursive TA-Lib indicator.
+
+    Subclasses replay TA-Lib's recurrence in Python so that values for appended
+    bars are bit-identical to a full recomputation. Because the rounding of the
+    compiled library is build-dependent, a state class is only used once
+    ``calibrated()`` has confirmed that it reproduces the installed TA-Lib.
+    """
+
+    function: str
+    inputs: tuple[str, ...]
+    # Output names in TA-Lib's order, as the indicator tools name them.
+    outputs: tuple[str, ...]
+    # Parameters the state is checked with besides TA-Lib's defaults.
+    calibration_params: tuple[dict[str, Any], ...] = ()
+
+    @classmethod
+    def from_history(
+        cls,
+        inputs: dict[str, np.ndarray],
+        params: dict[str, Any],
+        outputs: tuple[np.ndarray, ...],
+    ) -> "RecursiveState | None":
+        """Build the state after the given bars, or None if it has none yet."""
+        raise NotImplementedError
+
+    def extend(self, inputs: dict[str, np.ndarray]) -> tuple[np.ndarray, ...]:
+        """Advance over appended bars and return the values of each output."""
+        raise NotImplementedError
+
+    @classmethod
+    def calibrated(cls) -> bool:
+        return _calibrate(cls)
+
+
+def _is_zero(value: float) -> bool:
+    return -1e-8 < value < 1e-8
+
+
+def _true_range(high: float, low: float, previous_close: float) -> float:
+    """Return the true range of a bar, as TA-Lib's TRUE_RANGE macro does."""
+    true_range = high - low
+    distance = abs(high - previous_close)
+    if distance > true_range:
+        true_range = distance
+    distance = abs(low - previous_close)
+    if distance > true_range:
+        true_range = distance
+    return true_range
+
+
+class EMAState(RecursiveState):
+    function = "EMA"
+    inputs = ("real",)
+    outputs = ("ema",)
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, timeperiod: int, value: float):
+        self.k = 2.0 / (timeperiod + 1)
+        self.value = value
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        (output,) = outputs
+        if len(output) == 0 or np.isnan(output[-1]):
+            return None
+        return cls(params.get("timeperiod", 30), float(output[-1]))
+
+    def step(self, price: float) -> float:
+        # The bundled TA-Lib build contracts this update to a fused multiply-add.
+        self.value = fma(price - self.value, self.k, self.value)
+        return self.value
+
+    def extend(self, inputs):
+        return (np.array([self.step(price) for price in inputs["real"].tolist()]),)
+
+
+def _ema_series(real: np.ndarray, timeperiod: int) -> np.ndarray:
+    """Return TA-Lib's EMA of a series, also for the period of one MACD allows."""
+    if timeperiod > 1:
+        return talib.EMA(real, timeperiod)
+    (values,) = EMAState(1, float(real[0])).extend({"real": real[1:]})
+    return np.concatenate([real[:1], values])
+
+
+class DEMAState(RecursiveState):
+    function = "DEMA"
+    inputs = ("real",)
+    outputs = ("dema",)
+    calibration_params = ({"timeperiod": 2},)
+    # Number of chained EMAs.
+    depth = 2
+
+    def __init__(self, averages: list[EMAState]):
+        self.averages = averages
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        (output,) = outputs
+        if len(output) == 0 or np.isnan(output[-1]):
+            return None
+        # Each EMA averages the previous one from its first value on.
+        timeperiod = params.get("timeperiod", 30)
+        averages = []
+        values = inputs["real"]
+        for _ in range(cls.depth):
+            values = talib.EMA(values, timeperiod)[timeperiod - 1 :]
+            averages.append(EMAState(timeperiod, float(values[-1])))
+        return cls(averages)
+
+    def combine(self, first: float, second: float) -> float:
+        return 2.0 * first - second
+
+    def extend(self, inputs):
+        values = []
+        for price in inputs["real"].tolist():
+            averages = []
+            for average in self.averages:
+                price = average.step(price)
+                averages.append(price)
+            values.append(self.combine(*averages))
+        return (np.array(values),)
+
+
+class TEMAState(DEMAState):
+    function = "TEMA"
+    outputs = ("tema",)
+    depth = 3
+
+    def combine(self, first: float, second: float, third: float) -> float:
+        return 3.0 * first - 3.0 * second + third
+
+
+class T3State(RecursiveState):
+    function = "T3"
+    inputs = ("real",)
+    outputs = ("t3",)
+    calibration_params = ({"timeperiod": 2, "vfactor": 0.0}, {"vfactor": 0.3})
+
+    def __init__(self, timeperiod: int, vfactor: float):
+        self.timeperiod = timeperiod
+        self.k = 2.0 / (timeperiod + 1.0)
+        self.one_minus_k = 1.0 - self.k
+        # Tillson's weights of the last four of six chained EMAs.
+        square = vfactor * vfactor
+        self.c1 = -square * vfactor
+        self.c2 = 3.0 * (square - self.c1)
+        self.c3 = -6.0 * square - 3.0 * (vfactor - self.c1)
+        # The bundled TA-Lib build contracts this weight's sums of products.
+        self.c4 = fma(3.0, square, fma(3.0, vfactor, 1.0) - self.c1)
+        self.averages: list[float] = []
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        timeperiod = params.get("timeperiod", 5)
+        real = inputs["real"].tolist()
+        # TA-Lib passes the prices through for a period of one.
+        if timeperiod < 2 or len(real) <= 6 * (timeperiod - 1):
+            return None
+        state = cls(timeperiod, params.get("vfactor", 0.7))
+        # TA-Lib seeds each EMA with the mean of its first timeperiod values,
+        # stepping the EMAs before it over the bars this takes.
+        total = real[0]
+        for price in real[1:timeperiod]:
+            total += price
+        state.averages.append(total / timeperiod)
+        position = timeperiod
+        for _ in range(5):
+            total = state.averages[-1]
+            for price in real[position : position + timeperiod - 1]:
+                total += state._step(price)
+            position += timeperiod - 1
+            state.averages.append(total / timeperiod)
+        state.extend({"real": inputs["real"][position:]})
+        return state
+
+    def _step(self, price: float) -> float:
+        """Step the EMAs seeded so far and return the value of the last."""
+        for i, average in enumerate(self.averages):
+            # The bundled TA-Lib build contracts this update to a fused
+            # multiply-add.
+            price = self.averages[i] = fma(self.one_minus_k, average, self.k * price)
+        return price
+
+    def _value(self) -> float:
+        e3, e4, e5, e6 = self.averages[2:]
+        return fma(self.c4, e3, fma(self.c3, e4, fma(self.c1, e6, self.c2 * e5)))
+
+    def extend(self, inputs):
+        values = []
+        for price in inputs["real"].tolist():
+            self._step(price)
+            values.append(self._value())
+        return (np.array(values),)
+
+
+class KAMAState(RecursiveState):
+    function = "KAMA"
+    inputs = ("real",)
+    outputs = ("kama",)
+    calibration_params = ({"timeperiod": 2}, {"timeperiod": 10})
+    # Smoothing constants of the slowest (30 bars) and fastest (2 bars) EMAs.
+    slowest = 2.0 / 31.0
+    spread = 2.0 / 3.0 - slowest
+
+    def __init__(self, window: list[float], volatility: float, value: float):
+        # The last timeperiod + 1 prices and the sum of their absolute changes.
+        self.window = collections.deque(window, maxlen=len(window))
+        self.volatility = volatility
+        self.value = value
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        timeperiod = params.get("timeperiod", 30)
+        real = inputs["real"].tolist()
+        # TA-Lib passes the prices through for a period of one.
+        if timeperiod < 2 or len(real) <= timeperiod:
+            return None
+        volatility = 0.0
+        for previous, price in zip(
+            real[:timeperiod], real[1 : timeperiod + 1], strict=True
+        ):
+            volatility += abs(previous - price)
+        state = cls(real[: timeperiod + 1], volatility, real[timeperiod - 1])
+        state._smooth(real[timeperiod], real[timeperiod] - real[0])
+        state.extend({"real": inputs["real"][timeperiod + 1 :]})
+        return state
+
+    def _smooth(self, price: float, change: float) -> float:
+        if self.volatility <= change or _is_zero(self.volatility):
+            efficiency = 1.0
+        else:
+            efficiency = abs(change / self.volatility)
+        # The bundled TA-Lib build contracts these to fused multiply-adds.
+        constant = fma(efficiency, self.spread, self.slowest)
+        constant *= constant
+        self.value = fma(price - self.value, constant, self.value)
+        return self.value
+
+    def extend(self, inputs):
+        values = []
+        window = self.window
+        for price in inputs["real"].tolist():
+            self.volatility -= abs(window[0] - window[1])
+            self.volatility += abs(price - window[-1])
+            values.append(self._smooth(price, price - window[1]))
+            window.append(price)
+        return (np.array(values),)
+
+
+class RSIState(RecursiveState):
+    function = "RSI"
+    inputs = ("real",)
+    outputs = ("rsi",)
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, timeperiod: int, previous: float, gain: float, loss: float):
+        self.timeperiod = timeperiod
+        self.previous = previous
+        self.gain = gain
+        self.loss = loss
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        timeperiod = params.get("timeperiod", 14)
+        real = inputs["real"].tolist()
+        if len(real) <= timeperiod:
+            return None
+        gain = loss = 0.0
+        for previous, price in zip(
+            real[:timeperiod], real[1 : timeperiod + 1], strict=True
+        ):
+            change = price - previous
+            if change < 0:
+                loss -= change
+            else:
+                gain += change
+        # TA-Lib scales the first averages by 1 / period rather than dividing.
+        scale = 1.0 / timeperiod
+        state = cls(timeperiod, real[timeperiod], gain * scale, loss * scale)
+        state.extend({"real": inputs["real"][timeperiod + 1 :]})
+        return state
+
+    def extend(self, inputs):
+        values = []
+        scale = 1.0 / self.timeperiod
+        for price in inputs["real"].tolist():
+            change = price - self.previous
+            self.previous = price
+            self.loss *= self.timeperiod - 1
+            self.gain *= self.timeperiod - 1
+            if change < 0:
+                self.loss -= change
+            else:
+                self.gain += change
+            self.loss *= scale
+            self.gain *= scale
+            total = self.gain + self.loss
+            values.append(100.0 * (self.gain / total) if abs(total) >= 1e-8 else 0.0)
+        return (np.array(values),)
+
+
+class MACDState(RecursiveState):
+    function = "MACD"
+    inputs = ("real",)
+    outputs = ("macd", "macdsignal", "macdhist")
+    calibration_params = (
+        {"fastperiod": 26, "slowperiod": 12, "signalperiod": 9},
+        {"fastperiod": 2, "slowperiod": 3, "signalperiod": 1},
+    )
+
+    def __init__(self, fast: EMAState, slow: EMAState, signal: EMAState):
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        if len(outputs[0]) == 0 or np.isnan(outputs[0][-1]):
+            return None
+        fast, slow = sorted(
+            (params.get("fastperiod", 12), params.get("slowperiod", 26))
+        )
+        real = inputs["real"]
+        # TA-Lib starts the fast EMA so that its first value falls on the
+        # slow EMA's, and the signal EMA on their first difference.
+        fast_average = talib.EMA(real[slow - fast :], fast)[fast - 1 :]
+        slow_average = talib.EMA(real, slow)[slow - 1 :]
+        signalperiod = params.get("signalperiod", 9)
+        signal = _ema_series(fast_average - slow_average, signalperiod)
+        return cls(
+            EMAState(fast, float(fast_average[-1])),
+            EMAState(slow, float(slow_average[-1])),
+            EMAState(signalperiod, float(signal[-1])),
+        )
+
+    def extend(self, inputs):
+        rows = []
+        for price in inputs["real"].tolist():
+            macd = self.fast.step(price) - self.slow.step(price)
+            signal = self.signal.step(macd)
+            rows.append((macd, signal, macd - signal))
+        return tuple(np.array(values) for values in zip(*rows, strict=True))
+
+
+class ATRState(RecursiveState):
+    function = "ATR"
+    inputs = ("high", "low", "close")
+    outputs = ("atr",)
+    calibration_params = ({"timeperiod": 1}, {"timeperiod": 2})
+
+    def __init__(self, timeperiod: int, value: float, close: float):
+        # Wilder's smoothing, weighting the previous average by (p - 1) / p.
+        self.weight = (timeperiod - 1) / timeperiod
+        self.value = value
+        self.close = close
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        (output,) = outputs
+        if len(output) == 0 or np.isnan(output[-1]):
+            return None
+        timeperiod = params.get("timeperiod", 14)
+        return cls(timeperiod, float(output[-1]), float(inputs["close"][-1]))
+
+    def extend(self, inputs):
+        values = []
+        for high, low, close in zip(
+            *(inputs[name].tolist() for name in self.inputs), strict=True
+        ):
+            true_range = _true_range(high, low, self.close)
+            self.close = close
+            # The bundled TA-Lib build contracts this to a fused multiply-add.
+            self.value = fma(self.weight, self.value, true_range * (1.0 - self.weight))
+            values.append(self.value)
+        return (np.array(values),)
+
+
+class ADXState(RecursiveState):
+    function = "ADX"
+    inputs = ("high", "low", "close")
+    outputs = ("adx",)
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, timeperiod: int, high: float, low: float, close: float):
+        self.timeperiod = timeperiod
+        self.high, self.low, self.close = high, low, close
+        # Wilder's sums of the directional movements and true ranges.
+        self.minus_dm = self.plus_dm = self.true_range = 0.0
+        self.value = 0.0
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        timeperiod = params.get("timeperiod", 14)
+        bars = list(zip(*(inputs[name].tolist() for name in cls.inputs), strict=True))
+        if len(bars) < 2 * timeperiod:
+            return None
+        state = cls(timeperiod, *bars[0])
+        for bar in bars[1:timeperiod]:
+            state._move(*bar, smooth=False)
+        # The first ADX is the mean of the next timeperiod directional indices.
+        total = 0.0
+        for bar in bars[timeperiod : 2 * timeperiod]:
+            index = state._move(*bar, smooth=True)
+            if index is not None:
+                total += index
+        state.value = total / timeperiod
+        state.extend({name: inputs[name][2 * timeperiod :] for name in cls.inputs})
+        return state
+
+    def _move(self, high: float, low: float, close: float, smooth: bool):
+        """Add a bar to the sums and return its directional index, if any."""
+        up, down = high - self.high, self.low - low
+        true_range = _true_range(high, low, self.close)
+        self.high, self.low, self.close = high, low, close
+        if smooth:
+            self.minus_dm -= self.minus_dm / self.timeperiod
+            self.plus_dm -= self.plus_dm / self.timeperiod
+        if down > 0 and up < down:
+            self.minus_dm += down
+        elif up > 0 and up > down:
+            self.plus_dm += up
+        if smooth:
+            self.true_range = (
+                self.true_range - self.true_range / self.timeperiod + true_range
+            )
+        else:
+            self.true_range += true_range
+        if _is_zero(self.true_range):
+            return None
+        minus_di = 100.0 * (self.minus_dm / self.true_range)
+        plus_di = 100.0 * (self.plus_dm / self.true_range)
+        total = minus_di + plus_di
+        if _is_zero(total):
+            return None
+        return 100.0 * (abs(minus_di - plus_di) / total)
+
+    def extend(self, inputs):
+        values = []
+        for bar in zip(*(inputs[name].tolist() for name in self.inputs), strict=True):
+            index = self._move(*bar, smooth=True)
+            if index is not None:
+                self.value = (
+                    self.value * (self.timeperiod - 1) + index
+                ) / self.timeperiod
+            values.append(self.value)
+        return (np.array(values),)
+
+
+class SARState(RecursiveState):
+    function = "SAR"
+    inputs = ("high", "low")
+    outputs = ("sar",)
+
+    def __init__(self, acceleration: float, maximum: float):
+        self.acceleration = min(acceleration, maximum)
+        self.maximum = maximum
+        self.af = self.acceleration
+        self.is_long = True
+        self.sar = self.ep = 0.0
+        self.high = self.low = 0.0
+
+    @classmethod
+    def from_history(cls, inputs, params, output):
+        high, low = inputs["high"].tolist(), inputs["low"].tolist()
+        if len(high) < 2:
+            return None
+        state = cls(params.get("acceleration", 0.02), params.get("maximum", 0.2))
+        # TA-Lib picks the initial direction from the first bar's minus DM.
+        up, down = high[1] - high[0], low[0] - low[1]
+        state.is_long = not (down > 0 and up < down)
+        if state.is_long:
+            state.ep, state.sar = high[1], low[0]
+        else:
+            state.ep, state.sar = low[1], high[0]
+        state.high, state.low = high[1], low[1]
+        state.extend({"high": inputs["high"][1:], "low": inputs["low"][1:]})
+        return state
+
+    def extend(self, inputs):
+        values = []
+        for high, low in zip(
+            inputs["high"].tolist(), inputs["low"].tolist(), strict=True
+        ):
+            previous_high, previous_low = self.high, self.low
+            self.high, self.low = high, low
+            if self.is_long and low <= self.sar:
+                self.is_long = False
+                self.sar = max(self.ep, previous_high, high)
+                values.append(self.sar)
+                self.af, self.ep = self.acceleration, low
+                self._step()
+                self.sar = max(self.sar, previous_high, high)
+            elif not self.is_long and high >= self.sar:
+                self.is_long = True
+                self.sar = min(self.ep, previous_low, low)
+                values.append(self.sar)
+                self.af, self.ep = self.acceleration, high
+                self._step()
+                self.sar = min(self.sar, previous_low, low)
+            else:
+                values.append(self.sar)
+                if (
+                    self.is_long
+                    and high > self.ep
+                    or not self.is_long
+                    and low < self.ep
+                ):
+                    self.ep = high if self.is_long else low
+                    self.af = min(self.af + self.acceleration, self.maximum)
+                self._step()
+                if self.is_long:
+                    self.sar = min(self.sar, previous_low, low)
+                else:
+                    self.sar = max(self.sar, previous_high, high)
+        return (np.array(values),)
+
+    def _step(self):
+        # The bundled TA-Lib build contracts this update to a fused multiply-add.
+        self.sar = fma(self.af, self.ep - self.sar, self.sar)
+
+
+class OBVState(RecursiveState):
+    function = "OBV"
+    inputs = ("close", "volume")
+    outputs = ("obv",)
+
+    def __init__(self, value: float, close: float):
+        self.value = value
+        self.close = close
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        (output,) = outputs
+        if len(output) == 0:
+            return None
+        return cls(float(output[-1]), float(inputs["close"][-1]))
+
+    def extend(self, inputs):
+        values = []
+        for close, volume in zip(
+            inputs["close"].tolist(), inputs["volume"].tolist(), strict=True
+        ):
+            if close > self.close:
+                self.value += volume
+            elif close < self.close:
+                self.value -= volume
+            self.close = close
+            values.append(self.value)
+        return (np.array(values),)
+
+
+class ADState(RecursiveState):
+    function = "AD"
+    inputs = ("high", "low", "close", "volume")
+    outputs = ("ad",)
+
+    def __init__(self, value: float):
+        self.value = value
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        (output,) = outputs
+        if len(output) == 0:
+            return None
+        return cls(float(output[-1]))
+
+    def extend(self, inputs):
+        values = []
+        for high, low, close, volume in zip(
+            *(inputs[name].tolist() for name in self.inputs), strict=True
+        ):
+            spread = high - low
+            if spread > 0.0:
+                self.value += (((close - low) - (high - close)) / spread) * volume
+            values.append(self.value)
+        return (np.array(values),)
+
+
+RECURSIVE_STATES: dict[str, type[RecursiveState]] = {
+    state.function: state
+    for state in (
+        EMAState,
+        DEMAState,
+        TEMAState,
+        T3State,
+        KAMAState,
+        RSIState,
+        MACDState,
+        ATRState,
+        ADXState,
+        SARState,
+        OBVState,
+        ADState,
+    )
+}
+
+
+@functools.cache
+def _calibrate(cls: type[RecursiveState]) -> bool:
+    """Check that a state class reproduces the installed TA-Lib bit for bit."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=300))
+    # Repeated values exercise TA-Lib's equality and zero checks.
+    close[120:130] = close[119]
+    bars = {
+        "real": close,
+        "high": close + rng.random(300),
+        "low": close - rng.random(300),
+        "close": close,
+        "volume": rng.integers(1, 1000, 300).astype(float),
+    }
+    bars["high"][140:145] = bars["low"][140:145] = close[140:145]
+    bars["real0"] = close
+    bars["real1"] = 50 + np.cumsum(rng.normal(size=300))
+    inputs = {name: bars[name] for name in cls.inputs}
+    for params in ({}, *cls.calibration_params):
+        expected = abstract.Function(cls.function)(*inputs.values(), **params)
+        if isinstance(expected, np.ndarray):
+            expected = [expected]
+        head = {name: values[:200] for name, values in inputs.items()}
+        state = cls.from_history(
+            head, params, tuple(values[:200] for values in expected)
+        )
+        if state is None:
+            return False
+        tail = {name: values[200:] for name, values in inputs.items()}
+        if not all(
+            np.array_equal(actual, values[200:])
+            for actual, values in zip(state.extend(tail), expected, strict=True)
+        ):
+            return False
+    return True
+
+
+def extend(
+    function: str,
+    compute,
+    params: dict[str, Any],
+    inputs: dict[str, np.ndarray],
+    derived: DerivedResult,
+    states: dict[str, type["RecursiveState"]] = RECURSIVE_STATES,
+) -> DerivedResult | None:
+    """Extend a result computed on a prefix of ``inputs`` to all of them.
+
+    ``compute`` maps input arrays to a result. Indicators with a state in
+    ``states`` resume from it; this includes windowed indicators that TA-Lib
+    computes with running sums carried from the first bar, whose values a
+    recomputation of the tail would not reproduce. Other windowed indicators
+    recompute the last ``lookback + k`` bars. Returns None when the indicator
+    cannot be extended and has to be recomputed in full.
+    """
+    length = len(next(iter(inputs.values())))
+    appended = length - derived.length
+    if appended <= 0:
+        return None
+    state_class = states.get(function)
+    if state_class is None and function in WINDOWED_FUNCTIONS:
+        start = derived.length - lookback(function, params)
+        if start < 0:
+            return None
+        tail = compute({name: values[start:] for name, values in inputs.items()})
+        result = {
+            key: np.concatenate([derived.result[key], tail[key][-appended:]])
+            for key in derived.result
+        }
+        return DerivedResult(length, result)
+    if state_class is None or len(derived.result) != len(state_class.outputs):
+        return None
+    if not state_class.calibrated():
+        return None
+    state = derived.state
+    if state is None:
+        history = {name: values[: derived.length] for name, values in inputs.items()}
+        state = state_class.from_history(
+            history, params, tuple(derived.result.values())
+        )
+        if state is None:
+            return None
+    state = copy.deepcopy(state)
+    values = state.extend(
+        {name: values[derived.length :] for name, values in inputs.items()}
+    )
+    result = {
+        key: np.concatenate([output, appended])
+        for (key, output), appended in zip(derived.result.items(), values, strict=True)
+    }
+    return DerivedResult(length, result, state)
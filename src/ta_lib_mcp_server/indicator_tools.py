@@ -0,0 +1,820 @@
+import functools
+import inspect
+import os
+import typing
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from . import alignment, incremental, kernels
+from .bar_store import TIMESTAMP, BarStore
+from .batching import MicroBatcher
+from .cache import ResultCache
+from .datasets import DEFAULT_COLUMNS, Dataset, DatasetRegistry
+from .hashing import to_float64_array
+from .latest import latest
+from .results import ResultStore
+from .windows import STATES
+
+_DATASET_PARAMETERS = [
+    inspect.Parameter(
+        "dataset",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            str | None,
+            Field(
+                description="Name of a registered dataset to read omitted input "
+                "series from, instead of sending them inline"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "columns",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            dict[str, str] | None,
+            Field(
+                description="Maps input names to dataset column names. By default "
+                "'real' reads the 'close' column and every other input reads the "
+                "column of the same name"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "datasets",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            list[str] | None,
+            Field(
+                description="Names of registered datasets forming a panel: the "
+                "indicator is computed on each of them and every output is "
+                "returned as one row per dataset"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "offsets",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            list[int] | None,
+            Field(
+                description="Segment boundaries of input series concatenated from "
+                "several symbols, contracts or sessions: segment i spans positions "
+                "offsets[i] to offsets[i + 1], from 0 to the series length. Each "
+                "segment is computed separately, with its own lookback period, and "
+                "the outputs are concatenated in the same layout"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "symbol",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            str | None,
+            Field(
+                description="Symbol in the bar database to read omitted input "
+                "series from; the result covers the bars from start to end and "
+                "includes their timestamps"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "start",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            int | None,
+            Field(description="First timestamp (inclusive) of the symbol's bars"),
+        ],
+    ),
+    inspect.Parameter(
+        "end",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            int | None,
+            Field(description="Last timestamp (inclusive) of the symbol's bars"),
+        ],
+    ),
+    inspect.Parameter(
+        "timestamps",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            dict[str, list[int]] | None,
+            Field(
+                description="Strictly increasing timestamps of each inline input "
+                "series, by input name, for series that are not aligned bar for "
+                "bar, e.g. from different venues. The series are joined on their "
+                "timestamps (see join) and the result includes the joined "
+                "timestamps"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "join",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=None,
+        annotation=Annotated[
+            Literal["inner", "outer", "ffill"] | None,
+            Field(
+                description="How timestamped series are joined: inner (default) "
+                "keeps the timestamps of every series, outer those of any series "
+                "with NaN where a series has no bar, ffill those of any series "
+                "once all have started, carrying each series' last value forward"
+            ),
+        ],
+    ),
+    inspect.Parameter(
+        "latest_only",
+        inspect.Parameter.KEYWORD_ONLY,
+        default=False,
+        annotation=Annotated[
+            bool,
+            Field(
+                description="Return only the value of each output at the last "
+                "bar, as a number instead of a series (one per row of a panel), "
+                "computed by TA-Lib's streaming functions"
+            ),
+        ],
+    ),
+]
+
+
+def _is_series(annotation) -> bool:
+    if typing.get_origin(annotation) is Annotated:
+        annotation = typing.get_args(annotation)[0]
+    return annotation == list[float]
+
+
+def _dataset_signature(fn) -> tuple[inspect.Signature, list[str]]:
+    """Make the input series of ``fn`` optional and add the dataset parameters.
+
+    Input series also accept a panel of one row per symbol.
+    """
+    signature = inspect.signature(fn)
+    series = []
+    parameters = []
+    for parameter in signature.parameters.values():
+        if _is_series(parameter.annotation):
+            series.append(parameter.name)
+            metadata = typing.get_args(parameter.annotation)[1:]
+            parameter = parameter.replace(
+                annotation=Annotated[
+                    (list[float] | list[list[float]] | None, *metadata)
+                ],
+                default=None,
+            )
+        parameters.append(parameter)
+    return signature.replace(parameters=parameters + _DATASET_PARAMETERS), series
+
+
+def _segments(offsets: list[int], length: int) -> list[tuple[int, int]]:
+    """Return the non-empty segments delimited by CSR-style offsets."""
+    if len(offsets) < 2 or offsets[0] != 0 or offsets[-1] != length:
+        raise ValueError(
+            f"offsets must start at 0 and end at the series length {length}"
+        )
+    bounds = list(zip(offsets[:-1], offsets[1:], strict=True))
+    if any(stop < start for start, stop in bounds):
+        raise ValueError("offsets must be non-decreasing")
+    return [(start, stop) for start, stop in bounds if stop > start]
+
+
+def _split_panel(inputs: dict[str, np.ndarray]) -> list[dict[str, np.ndarray]]:
+    """Return the rows of 2D input series, one per symbol."""
+    shapes = {values.shape for values in inputs.values()}
+    shape = next(iter(shapes))
+    if len(shapes) > 1 or len(shape) != 2 or not shape[0]:
+        raise ValueError(
+            "Panel inputs must be passed as non-empty 2D series of the "
+            "same shape, one row per symbol"
+        )
+    return [
+        {input_name: values[i] for input_name, values in inputs.items()}
+        for i in range(shape[0])
+    ]
+
+
+def _params_model(fn, series: list[str]) -> type[BaseModel]:
+    """Build a model validating the non-series parameters of ``fn``."""
+    fields = {
+        parameter.name: (
+            parameter.annotation,
+            ... if parameter.default is inspect.Parameter.empty else parameter.default,
+        )
+        for parameter in inspect.signature(fn).parameters.values()
+        if parameter.name not in series
+    }
+    return create_model(
+        f"{fn.__name__}_params", __config__=ConfigDict(extra="forbid"), **fields
+    )
+
+
+@dataclass
+class Indicator:
+    """A registered indicator tool, callable directly on arrays."""
+
+    name: str
+    function: str
+    fn: Callable
+    series: list[str]
+    params: type[BaseModel]
+
+    def __call__(
+        self, inputs: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> dict[str, np.ndarray]:
+        validated = self.params.model_validate(params)
+        return self.fn(**dict(validated), **inputs)
+
+
+class IndicatorTools:
+    """Registers indicator tools on a FastMCP server.
+
+    The indicator modules call ``tool()`` exactly as they would on FastMCP. The
+    registered tool converts the input series to float64 arrays once, serves
+    repeated requests from the result cache, and routes the result through the
+    shared result store so that large outputs are returned as resource links
+    instead of inline JSON.
+
+    Input series may be omitted in favour of a ``dataset`` registered in the
+    dataset registry, in which case the stored columns and their precomputed
+    fingerprints are used. Results on a dataset are remembered with it, so once
+    bars are appended they are extended rather than recomputed where the
+    indicator allows it.
+
+    Alternatively the inputs are read from a ``symbol`` in the bar database,
+    restricted to a ``start``/``end`` time range. The bars the indicator needs
+    before its first output are read from before ``start`` and trimmed from the
+    result.
+
+    Series concatenated from several symbols or sessions can be computed
+    segment by segment by passing CSR-style ``offsets``, and inline series
+    that are not aligned bar for bar are joined on their ``timestamps``.
+
+    Screens over many symbols send a panel instead: 2D input series with one
+    row per symbol, or a list of ``datasets``. The rows are split across a
+    pool of ``panel_workers`` threads, which TA-Lib runs in parallel as it
+    releases the GIL, and each output is returned with one row per symbol.
+    The most common indicators are instead computed on a whole 2D panel at
+    once by the NumPy kernels in ``kernels``, where they reproduce TA-Lib.
+
+    With a ``batch_window``, concurrent calls on single inline series are
+    collected by a ``MicroBatcher`` and computed together as a panel.
+
+    With ``latest_only``, only the value of each output at the last bar is
+    computed, by ``talib.stream``, and returned.
+    """
+
+    def __init__(
+        self,
+        mcp,
+        results: ResultStore,
+        cache: ResultCache,
+        datasets: DatasetRegistry | None = None,
+        bars: BarStore | None = None,
+        panel_workers: int | None = None,
+        batch_window: float = 0.0,
+    ):
+        self.mcp = mcp
+        self.results = results
+        self.cache = cache
+        self.datasets = datasets if datasets is not None else DatasetRegistry()
+        self.bars = bars
+        # Registered indicators by TA-Lib function name, for server-side use.
+        self.indicators: dict[str, Indicator] = {}
+        self.panel_workers = panel_workers or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.panel_workers, thread_name_prefix="panel"
+        )
+        self.batcher = MicroBatcher(self, batch_window) if batch_window > 0 else None
+
+    def indicator(self, function: str) -> Indicator:
+        try:
+            return self.indicators[function.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown indicator function: {function!r}") from None
+
+    def named_series(
+        self, inputs: dict[str, list[float]] | None, dataset: str | None
+    ) -> tuple[dict[str, np.ndarray], dict[str, str]]:
+        """Collect named input series from a dataset and inline values.
+
+        Returns the arrays and the digests known for those read from the
+        dataset. Inline series take precedence over dataset columns.
+        """
+        series = {}
+        digests = {}
+        if dataset is not None:
+            stored = self.datasets.get(dataset)
+            for column in stored.columns:
+                series[column] = stored.column(column)
+                digests[column] = stored.digest(column)
+        for name, values in (inputs or {}).items():
+            series[name] = to_float64_array(values)
+            digests.pop(name, None)
+        return series, digests
+
+    def respond(self, name: str, key: str, compute: Callable[[], dict]):
+        """Serve a result from the cache, computing and caching it on a miss."""
+        entry = self.cache.get(key)
+        if entry is None:
+            entry = self.cache.put(key, compute())
+        return self.results.to_content(name, entry.result, entry.encoded, result_id=key)
+
+    def resolve_inputs(
+        self,
+        series: list[str],
+        arguments: dict,
+        dataset: str | None,
+        columns: dict[str, str] | None,
+    ):
+        """Return the input arrays of a call and the digests already known.
+
+        Also returns the dataset snapshot the inputs were read from and the
+        column read for each input, if any were.
+        """
+        inputs = {}
+        digests = {}
+        sources = {}
+        stored = self.datasets.get(dataset) if dataset is not None else None
+        for name in series:
+            value = arguments.pop(name, None)
+            if value is not None:
+                inputs[name] = to_float64_array(value)
+            elif stored is not None:
+                column = (columns or {}).get(name) or DEFAULT_COLUMNS.get(name, name)
+                inputs[name] = stored.column(column)
+                digests[name] = stored.digest(column)
+                sources[name] = column
+            else:
+                raise ValueError(f"Missing input series {name!r}: pass it or a dataset")
+        return inputs, digests, stored, sources
+
+    def compute(
+        self,
+        name: str,
+        function: str,
+        fn,
+        params: dict,
+        inputs: dict,
+        stored: Dataset | None,
+        sources: dict[str, str],
+    ):
+        """Run an indicator, extending its last result on the dataset if possible."""
+        if stored is None or len(sources) < len(inputs):
+            return fn(**params, **inputs)
+        if not all(stored.is_finite(column) for column in sources.values()):
+            return fn(**params, **inputs)
+        lineage = (
+            self.cache.make_key(name, params, {}),
+            tuple(sorted(sources.items())),
+        )
+        derived = stored.derived.get(lineage)
+        if derived is not None:
+            derived = incremental.extend(
+                function,
+                lambda tail: fn(**params, **tail),
+                params,
+                inputs,
+                derived,
+                STATES,
+            )
+        if derived is None:
+            derived = incremental.DerivedResult(stored.length, fn(**params, **inputs))
+        stored.derived.put(lineage, derived)
+        return derived.result
+
+    def call_range(
+        self,
+        name: str,
+        function: str,
+        fn,
+        series: list[str],
+        arguments: dict,
+        symbol: str,
+        start: int | None,
+        end: int | None,
+        columns: dict[str, str] | None,
+    ):
+        """Run an indicator on the bars of a symbol between two timestamps.
+
+        The values are those of the indicator on the symbol's whole history.
+        """
+        if self.bars is None:
+            raise ValueError(
+                "No bar database is configured; start the server with --db-path"
+            )
+        bars = self.bars.get(symbol)
+        # Functions computing each value from its window alone only need their
+        # lookback before the range; the others carry state or running sums
+        # from the first bar, so they start from it.
+        if (
+            function in incremental.WINDOWED_FUNCTIONS
+            and function not in incremental.RUNNING_SUM_FUNCTIONS
+        ):
+            warmup = incremental.lookback(function, arguments)
+        else:
+            warmup = len(bars.timestamps)
+        begin, first, stop = bars.window(start, end, warmup)
+        inputs = {}
+        for input_name in series:
+            if arguments.pop(input_name, None) is not None:
+                raise ValueError(f"{input_name!r} cannot be passed with a symbol")
+            column = (columns or {}).get(input_name) or DEFAULT_COLUMNS.get(
+                input_name, input_name
+            )
+            inputs[input_name] = bars.column(column)[begin:stop]
+        timestamps = bars.timestamps[first:stop]
+        key = self.cache.make_key(
+            name,
+            {**arguments, "warmup": first - begin},
+            {**inputs, TIMESTAMP: timestamps},
+        )
+
+        def compute():
+            result = fn(**arguments, **inputs)
+            return {
+                TIMESTAMP: timestamps,
+                **{
+                    output: values[first - begin :] for output, values in result.items()
+                },
+            }
+
+        return self.respond(name, key, compute)
+
+    def call_aligned(
+        self,
+        name: str,
+        fn,
+        arguments: dict,
+        inputs: dict[str, np.ndarray],
+        timestamps: dict[str, list[int]],
+        join: str,
+    ):
+        """Run an indicator on inline series joined on their timestamps."""
+        missing = sorted(set(inputs) - set(timestamps))
+        unknown = sorted(set(timestamps) - set(inputs))
+        if missing or unknown:
+            raise ValueError(
+                f"Pass timestamps for every input series; missing {missing}, "
+                f"unknown {unknown}"
+            )
+        if any(values.ndim != 1 for values in inputs.values()):
+            raise ValueError("timestamps cannot be combined with a panel")
+        joined, aligned = alignment.align(
+            [(timestamps[input_name], values) for input_name, values in inputs.items()],
+            join,
+        )
+        inputs = dict(zip(inputs, aligned, strict=True))
+        key = self.cache.make_key(
+            name, {**arguments, "join": join}, {**inputs, TIMESTAMP: joined}
+        )
+        return self.respond(
+            name, key, lambda: {TIMESTAMP: joined, **fn(**arguments, **inputs)}
+        )
+
+    def panel_rows(
+        self,
+        series: list[str],
+        arguments: dict,
+        datasets: list[str],
+        columns: dict[str, str] | None,
+    ):
+        """Return the rows of a panel of datasets and the digests of their inputs.
+
+        Each row holds the inputs read from one dataset together with that
+        dataset and the columns read, as ``resolve_inputs`` returns them.
+        """
+        if not datasets:
+            raise ValueError("A panel needs at least one dataset")
+        passed = [name for name in series if arguments.pop(name, None) is not None]
+        if passed:
+            raise ValueError(f"{passed} cannot be passed with datasets")
+        rows = []
+        digests = {}
+        for i, dataset in enumerate(datasets):
+            inputs, known, stored, sources = self.resolve_inputs(
+                series, {}, dataset, columns
+            )
+            rows.append((inputs, stored, sources))
+            digests.update({f"{name}/{i}": digest for name, digest in known.items()})
+        return rows, digests
+
+    def compute_rows(
+        self,
+        name: str,
+        function: str,
+        fn,
+        params: dict,
+        rows: list[tuple[dict, Dataset | None, dict[str, str]]],
+    ) -> list[dict]:
+        """Run an indicator on every row of a panel across the worker pool."""
+
+        def run(chunk):
+            return [
+                self.compute(name, function, fn, params, inputs, stored, sources)
+                for inputs, stored, sources in chunk
+            ]
+
+        size = -(-len(rows) // self.panel_workers)
+        chunks = [rows[i : i + size] for i in range(0, len(rows), size)]
+        if len(chunks) == 1:
+            return run(chunks[0])
+        return [row for chunk in self._pool.map(run, chunks) for row in chunk]
+
+    def compute_kernel(
+        self, function: str, params: dict, inputs: dict[str, np.ndarray]
+    ) -> dict[str, np.ndarray] | None:
+        """Run an indicator's NumPy kernel on 2D inputs, if it has a usable one."""
+        if function not in self.indicators:
+            return None
+        validated = self.indicators[function].params.model_validate(params)
+        return kernels.evaluate(function, inputs, dict(validated))
+
+    def compute_panel(
+        self,
+        name: str,
+        function: str,
+        fn,
+        params: dict,
+        rows: list[tuple[dict, Dataset | None, dict[str, str]]],
+    ):
+        """Run an indicator on a panel and return its outputs by row.
+
+        Each output is a 2D array with one row per panel row, or a list of
+        arrays when the rows differ in length.
+        """
+        results = self.compute_rows(name, function, fn, params, rows)
+        panel = {}
+        for output in results[0]:
+            values = [result[output] for result in results]
+            if len({len(row) for row in values}) == 1:
+                panel[output] = np.stack(values)
+            else:
+                panel[output] = values
+        return panel
+
+    def compute_segments(
+        self,
+        name: str,
+        function: str,
+        fn,
+        params: dict,
+        inputs: dict[str, np.ndarray],
+        offsets: list[int],
+    ):
+        """Run an indicator on each segment of concatenated series.
+
+        The outputs are concatenated in the layout of the inputs, so every
+        segment starts with its own lookback period.
+        """
+        length = len(next(iter(inputs.values())))
+        segments = _segments(offsets, length)
+        if not segments:
+            return fn(**params, **inputs)
+        rows = [
+            (
+                {
+                    input_name: values[start:stop]
+                    for input_name, values in inputs.items()
+                },
+                None,
+                {},
+            )
+            for start, stop in segments
+        ]
+        results = self.compute_rows(name, function, fn, params, rows)
+        return {
+            output: np.concatenate([result[output] for result in results])
+            for output in results[0]
+        }
+
+    def call_panel(
+        self,
+        name: str,
+        function: str,
+        fn,
+        series: list[str],
+        arguments: dict,
+        inputs: dict[str, np.ndarray] | None,
+        datasets: list[str] | None,
+        columns: dict[str, str] | None,
+    ):
+        """Run an indicator on a panel of 2D input series or of datasets."""
+        if datasets is not None:
+            rows, digests = self.panel_rows(series, arguments, datasets, columns)
+            keyed = {
+                f"{input_name}/{i}": values
+                for i, (row, _, _) in enumerate(rows)
+                for input_name, values in row.items()
+            }
+        else:
+            rows = [(row, None, {}) for row in _split_panel(inputs)]
+            keyed, digests = inputs, {}
+        key = self.cache.make_key(name, arguments, keyed, digests)
+
+        def compute():
+            if datasets is None:
+                panel = self.compute_kernel(function, arguments, inputs)
+                if panel is not None:
+                    return panel
+            return self.compute_panel(name, function, fn, arguments, rows)
+
+        return self.respond(name, key, compute)
+
+    def call_latest(
+        self,
+        name: str,
+        function: str,
+        fn,
+        series: list[str],
+        arguments: dict,
+        dataset: str | None,
+        datasets: list[str] | None,
+        columns: dict[str, str] | None,
+    ):
+        """Return the value of each output at the last bar, or of every row."""
+        if datasets is not None:
+            if dataset is not None:
+                raise ValueError("Pass datasets without a dataset or symbol")
+            rows, digests = self.panel_rows(series, arguments, datasets, columns)
+            rows = [inputs for inputs, _, _ in rows]
+            keyed = {
+                f"{input_name}/{i}": values
+                for i, row in enumerate(rows)
+                for input_name, values in row.items()
+            }
+            panel = True
+        else:
+            inputs, digests, _, sources = self.resolve_inputs(
+                series, arguments, dataset, columns
+            )
+            panel = any(values.ndim != 1 for values in inputs.values())
+            if panel and sources:
+                raise ValueError("A panel cannot be combined with a dataset")
+            rows = _split_panel(inputs) if panel else [inputs]
+            keyed = inputs
+        key = self.cache.make_key(
+            name, {**arguments, "latest_only": True}, keyed, digests
+        )
+
+        def compute():
+            values = [latest(function, fn, arguments, row) for row in rows]
+            if not panel:
+                return values[0]
+            return {output: [row[output] for row in values] for output in values[0]}
+
+        return self.respond(name, key, compute)
+
+    def tool(self, **tool_kwargs):
+        def decorator(fn):
+            name = tool_kwargs.get("name") or fn.__name__
+            function = tool_kwargs.get("title", "").removeprefix("Calculate ")
+            signature, series = _dataset_signature(fn)
+
+            @functools.wraps(fn)
+            def wrapper(
+                dataset=None,
+                columns=None,
+                datasets=None,
+                offsets=None,
+                symbol=None,
+                start=None,
+                end=None,
+                timestamps=None,
+                join=None,
+                latest_only=False,
+                **arguments,
+            ):
+                if latest_only:
+                    routed = (offsets, symbol, start, end, timestamps, join)
+                    if any(source is not None for source in routed):
+                        raise ValueError(
+                            "latest_only applies to inline series, a dataset or a panel"
+                        )
+                    return self.call_latest(
+                        name,
+                        function,
+                        fn,
+                        series,
+                        arguments,
+                        dataset,
+                        datasets,
+                        columns,
+                    )
+                if join is not None and timestamps is None:
+                    raise ValueError("join applies to series passed with timestamps")
+                if timestamps is not None:
+                    if any(
+                        source is not None
+                        for source in (dataset, datasets, offsets, symbol)
+                    ):
+                        raise ValueError("timestamps apply to inline series only")
+                    inputs, _, _, _ = self.resolve_inputs(series, arguments, None, None)
+                    return self.call_aligned(
+                        name, fn, arguments, inputs, timestamps, join or "inner"
+                    )
+                if offsets is not None and (datasets is not None or symbol is not None):
+                    raise ValueError(
+                        "offsets cannot be combined with datasets or a symbol"
+                    )
+                if datasets is not None:
+                    if dataset is not None or symbol is not None:
+                        raise ValueError("Pass datasets without a dataset or symbol")
+                    return self.call_panel(
+                        name, function, fn, series, arguments, None, datasets, columns
+                    )
+                if symbol is not None:
+                    if dataset is not None:
+                        raise ValueError("Pass either a dataset or a symbol, not both")
+                    return self.call_range(
+                        name,
+                        function,
+                        fn,
+                        series,
+                        arguments,
+                        symbol,
+                        start,
+                        end,
+                        columns,
+                    )
+                if start is not None or end is not None:
+                    raise ValueError("start and end select the bars of a symbol")
+                inputs, digests, stored, sources = self.resolve_inputs(
+                    series, arguments, dataset, columns
+                )
+                if any(values.ndim != 1 for values in inputs.values()):
+                    if sources:
+                        raise ValueError("A panel cannot be combined with a dataset")
+                    if offsets is not None:
+                        raise ValueError("offsets cannot be combined with a panel")
+                    return self.call_panel(
+                        name, function, fn, series, arguments, inputs, None, columns
+                    )
+                if offsets is not None:
+                    key = self.cache.make_key(
+                        name, {**arguments, "offsets": offsets}, inputs, digests
+                    )
+                    return self.respond(
+                        name,
+                        key,
+                        lambda: self.compute_segments(
+                            name, function, fn, arguments, inputs, offsets
+                        ),
+                    )
+                key = self.cache.make_key(name, arguments, inputs, digests)
+                return self.respond(
+                    name,
+                    key,
+                    lambda: self.compute(
+                        name, function, fn, arguments, inputs, stored, sources
+                    ),
+                )
+
+            @functools.wraps(fn)
+            async def batched(**kwargs):
+                # Only calls on inline series are batched; the wrapper's
+                # keyword parameters select every other source.
+                routed = ("dataset", "columns", "datasets", "offsets")
+                routed += ("symbol", "start", "end", "timestamps", "join")
+                if kwargs.get("latest_only") or any(
+                    kwargs.get(key) is not None for key in routed
+                ):
+                    return wrapper(**kwargs)
+                routed += ("latest_only",)
+                arguments = {
+                    key: value for key, value in kwargs.items() if key not in routed
+                }
+                inputs, _, _, _ = self.resolve_inputs(series, arguments, None, None)
+                if any(values.ndim != 1 for values in inputs.values()):
+                    return wrapper(**kwargs)
+                key = self.cache.make_key(name, arguments, inputs, {})
+                entry = self.cache.get(key)
+                if entry is None:
+                    result = await self.batcher.submit(
+                        name, function, fn, arguments, inputs
+                    )
+                    entry = self.cache.put(key, result)
+                return self.results.to_content(
+                    name, entry.result, entry.encoded, result_id=key
+                )
+
+            wrapper.__signature__ = signature
+            batched.__signature__ = signature
+            self.indicators[function] = Indicator(
+                name, function, fn, series, _params_model(fn, series)
+            )
+            self.mcp.tool(**tool_kwargs)(wrapper if self.batcher is None else batched)
+            return fn
+
+        return decorator
@@ -0,0 +1,298 @@
+import functools
+from collections.abc import Callable
+
+import numpy as np
+import talib
+
+# TA-Lib treats values closer to zero than this as zero.
+_ZERO = 1e-8
+
+# Beyond this many bars per row, TA-Lib's compiled loop outweighs the cost of
+# calling it once per row, and the kernels are slower: on 5000 symbols of 2000
+# bars, EMA takes 650 ms as a kernel and 35 ms row by row, SMA 197 ms and 34 ms.
+MAX_KERNEL_LENGTH = 64
+
+
+def _multiply_add(a, b, c):
+    return a * b + c
+
+
+# Veltkamp's constant 2**27 + 1 splits a double into two halves of 26 bits.
+_SPLIT = 134217729.0
+
+
+def _two_product(a, b):
+    """Return the rounded product and its exact rounding error (Dekker)."""
+    product = a * b
+    scaled = _SPLIT * a
+    a_high = scaled - (scaled - a)
+    a_low = a - a_high
+    scaled = _SPLIT * b
+    b_high = scaled - (scaled - b)
+    b_low = b - b_high
+    error = ((a_high * b_high - product) + a_high * b_low + a_low * b_high) + (
+        a_low * b_low
+    )
+    return product, error
+
+
+def _two_sum(a, b):
+    """Return the rounded sum and its exact rounding error (Knuth)."""
+    total = a + b
+    b_virtual = total - a
+    error = (a - (total - b_virtual)) + (b - b_virtual)
+    return total, error
+
+
+def _fused_multiply_add(a, b, c):
+    """Return ``a * b + c`` rounded once, as a fused multiply-add computes it.
+
+    This is Boldo and Melquiond's emulation: the exact product and sum are
+    split into rounded parts and errors, whose sum is rounded to odd so the
+    final rounding to nearest is correct.
+    """
+    product, product_error = _two_product(a, b)
+    high, low = _two_sum(c, product)
+    odd, error = _two_sum(low, product_error)
+    odd = np.array(odd, dtype=np.float64)
+    inexact = (error != 0) & ((odd.view(np.int64) & 1) == 0)
+    odd[inexact] = np.nextafter(odd[inexact], np.copysign(np.inf, error[inexact]))
+    return high + odd
+
+
+def _transpose(values: np.ndarray) -> np.ndarray:
+    """Switch a panel between symbol-major and time-major layout."""
+    return np.ascontiguousarray(values.T)
+
+
+def _sma(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    period = params["timeperiod"]
+    if period < 2:
+        return None
+    real = _transpose(inputs["real"])
+    out = np.full(real.shape, np.nan)
+    total = np.zeros(real.shape[1])
+    for t in range(min(period - 1, len(real))):
+        total += real[t]
+    for t in range(period - 1, len(real)):
+        total += real[t]
+        np.divide(total, period, out=out[t])
+        total -= real[t - period + 1]
+    return {"sma": _transpose(out)}
+
+
+def _ema(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    period = params["timeperiod"]
+    if period < 2:
+        return None
+    real = _transpose(inputs["real"])
+    out = np.full(real.shape, np.nan)
+    if len(real) >= period:
+        k = 2.0 / (period + 1)
+        total = np.zeros(real.shape[1])
+        for t in range(period):
+            total += real[t]
+        previous = total / period
+        out[period - 1] = previous
+        for t in range(period, len(real)):
+            previous = madd(real[t] - previous, k, previous)
+            out[t] = previous
+    return {"ema": _transpose(out)}
+
+
+def _rsi(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    period = params["timeperiod"]
+    if period < 2:
+        return None
+    real = _transpose(inputs["real"])
+    out = np.full(real.shape, np.nan)
+
+    def store(t: int) -> None:
+        total = gain + loss
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[t] = 100.0 * (gain / total)
+        out[t][np.abs(total) < _ZERO] = 0.0
+
+    if len(real) > period:
+        gain = np.zeros(real.shape[1])
+        loss = np.zeros(real.shape[1])
+        # Gains and losses are added to one total or the other, never both.
+        for t in range(1, period + 1):
+            change = real[t] - real[t - 1]
+            loss -= np.minimum(change, 0.0)
+            gain += np.maximum(change, 0.0)
+        # TA-Lib scales the averages by 1 / period rather than dividing them.
+        scale = 1.0 / period
+        loss *= scale
+        gain *= scale
+        store(period)
+        for t in range(period + 1, len(real)):
+            change = real[t] - real[t - 1]
+            loss = madd(loss, period - 1, -np.minimum(change, 0.0)) * scale
+            gain = madd(gain, period - 1, np.maximum(change, 0.0)) * scale
+            store(t)
+    return {"rsi": _transpose(out)}
+
+
+def _change(output: str, formula: Callable, guard: bool) -> Callable:
+    """Build a kernel comparing each value with the one ``timeperiod`` before.
+
+    With ``guard``, TA-Lib outputs zero where the earlier value is zero.
+    """
+
+    def kernel(
+        inputs: dict[str, np.ndarray], params: dict, madd: Callable
+    ) -> dict | None:
+        period = params["timeperiod"]
+        if period < 1:
+            return None
+        real = inputs["real"]
+        out = np.full(real.shape, np.nan)
+        if real.shape[1] > period:
+            current, previous = real[:, period:], real[:, :-period]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                out[:, period:] = formula(current, previous)
+            if guard:
+                out[:, period:][previous == 0.0] = 0.0
+        return {output: out}
+
+    return kernel
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Return TA-Lib's true range of a symbol-major panel, NaN at the first bar."""
+    out = np.full(high.shape, np.nan)
+    previous = close[:, :-1]
+    out[:, 1:] = np.maximum(
+        np.maximum(high[:, 1:] - low[:, 1:], np.abs(previous - high[:, 1:])),
+        np.abs(low[:, 1:] - previous),
+    )
+    return out
+
+
+def _trange(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    return {"trange": _true_range(inputs["high"], inputs["low"], inputs["close"])}
+
+
+def _atr(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    period = params["timeperiod"]
+    if period < 2:
+        return None
+    ranges = _transpose(_true_range(inputs["high"], inputs["low"], inputs["close"]))
+    out = np.full(ranges.shape, np.nan)
+    if len(ranges) > period:
+        total = np.zeros(ranges.shape[1])
+        for t in range(1, period + 1):
+            total += ranges[t]
+        average = total / period
+        out[period] = average
+        # Wilder's smoothing, weighting the previous average by (p - 1) / p.
+        weight = (period - 1) / period
+        for t in range(period + 1, len(ranges)):
+            average = madd(weight, average, ranges[t] * (1.0 - weight))
+            out[t] = average
+    return {"atr": _transpose(out)}
+
+
+def _obv(inputs: dict[str, np.ndarray], params: dict, madd: Callable) -> dict | None:
+    close, volume = inputs["close"], inputs["volume"]
+    # Multiplying by the sign of the change is exact, and cumsum adds along
+    # each row in order, as TA-Lib's running total does.
+    signed = np.empty(close.shape)
+    signed[:, :1] = volume[:, :1]
+    np.multiply(np.sign(np.diff(close, axis=1)), volume[:, 1:], out=signed[:, 1:])
+    return {"obv": np.cumsum(signed, axis=1)}
+
+
+# Kernels computing a whole panel at once, by TA-Lib function, each
+# returning None for parameters TA-Lib has to handle itself.
+KERNELS: dict[str, Callable[[dict[str, np.ndarray], dict, Callable], dict | None]] = {
+    "SMA": _sma,
+    "EMA": _ema,
+    "RSI": _rsi,
+    "MOM": _change("mom", lambda current, previous: current - previous, False),
+    "ROC": _change(
+        "roc", lambda current, previous: (current / previous - 1.0) * 100.0, True
+    ),
+    "ROCP": _change(
+        "rocp", lambda current, previous: (current - previous) / previous, True
+    ),
+    "ROCR": _change("rocr", lambda current, previous: current / previous, True),
+    "TRANGE": _trange,
+    "ATR": _atr,
+    "OBV": _obv,
+}
+
+# Parameters exercising each kernel when it is calibrated.
+_CALIBRATION_PARAMS = {
+    "SMA": [{"timeperiod": 2}, {"timeperiod": 30}],
+    "EMA": [{"timeperiod": 2}, {"timeperiod": 30}],
+    "RSI": [{"timeperiod": 2}, {"timeperiod": 14}],
+    "MOM": [{"timeperiod": 1}, {"timeperiod": 10}],
+    "ROC": [{"timeperiod": 1}, {"timeperiod": 10}],
+    "ROCP": [{"timeperiod": 1}, {"timeperiod": 10}],
+    "ROCR": [{"timeperiod": 1}, {"timeperiod": 10}],
+    "TRANGE": [{}],
+    "ATR": [{"timeperiod": 2}, {"timeperiod": 14}],
+    "OBV": [{}],
+}
+
+
+def _matches(function: str, madd: Callable) -> bool:
+    """Check that a kernel reproduces the installed TA-Lib bit for bit."""
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(size=(6, 400)), axis=1)
+    # Repeated and zero values exercise TA-Lib's equality and zero checks.
+    close[0, 100:110] = close[0, 99]
+    close[1, 200:210] = 0.0
+    bars = {
+        "high": close + rng.random(close.shape),
+        "low": close - rng.random(close.shape),
+        "close": close,
+        "volume": rng.integers(1, 1000, close.shape).astype(float),
+    }
+    for params in _CALIBRATION_PARAMS[function]:
+        result = KERNELS[function]({"real": close, **bars}, params, madd)
+        (actual,) = result.values()
+        for row in range(len(close)):
+            expected = talib.abstract.Function(function)(
+                {name: values[row] for name, values in bars.items()}, **params
+            )
+            if not np.array_equal(actual[row], expected, equal_nan=True):
+                return False
+    return True
+
+
+@functools.cache
+def arithmetic(function: str) -> Callable | None:
+    """Return the multiply-add with which a kernel reproduces TA-Lib, if any.
+
+    Depending on how TA-Lib was compiled, its multiply-adds are either
+    rounded after each operation or fused into one rounding.
+    """
+    for madd in (_multiply_add, _fused_multiply_add):
+        if _matches(function, madd):
+            return madd
+    return None
+
+
+def evaluate(
+    function: str, inputs: dict[str, np.ndarray], params: dict
+) -> dict[str, np.ndarray] | None:
+    """Compute an indicator on 2D inputs with one row per symbol at once.
+
+    Returns None if TA-Lib has to compute the rows: the function has no
+    kernel or no calibrated one, the parameters are outside the kernel's
+    range, the rows are longer than ``MAX_KERNEL_LENGTH``, or the inputs
+    contain NaN, which TA-Lib skips per row.
+    """
+    if function not in KERNELS:
+        return None
+    if next(iter(inputs.values())).shape[1] > MAX_KERNEL_LENGTH:
+        return None
+    if any(np.isnan(values).any() for values in inputs.values()):
+        return None
+    madd = arithmetic(function)
+    if madd is None:
+        return None
+    return KERNELS[function](inputs, params, madd)
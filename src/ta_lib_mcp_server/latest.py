@@ -0,0 +1,38 @@
+from typing import Any
+
+import numpy as np
+import talib
+from talib import stream
+
+from .incremental import STREAM_OBJECTS, talib_parameters
+
+
+def latest(
+    function: str,
+    fn,
+    params: dict[str, Any],
+    inputs: dict[str, np.ndarray],
+) -> dict[str, Any]:
+    """Return the value of each output of an indicator at the last bar.
+
+    ``talib.stream`` computes the value from the input arrays without
+    allocating the output series. ``fn``, the indicator's tool function,
+    names the outputs, and computes them in full when there are too few
+    bars for a value, when the last bar has a NaN input, which stream
+    objects may skip where the full series does not, or when this TA-Lib has
+    no stream objects, so that the result is the last value of the full
+    series in every case.
+    """
+    if not len(next(iter(inputs.values()))):
+        raise ValueError("latest_only needs at least one bar")
+    if not STREAM_OBJECTS or any(np.isnan(values[-1]) for values in inputs.values()):
+        return {name: values[-1] for name, values in fn(**params, **inputs).items()}
+    outputs = fn(**params, **{name: values[:0] for name, values in inputs.items()})
+    try:
+        value = getattr(stream, function)(
+            *inputs.values(), **talib_parameters(function, params)
+        ).value
+    except talib.InsufficientHistory:
+        return {name: values[-1] for name, values in fn(**params, **inputs).items()}
+    values = value if isinstance(value, tuple) else (value,)
+    return dict(zip(outputs, values, strict=True))
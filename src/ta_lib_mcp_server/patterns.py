@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .candles import PATTERN_INPUTS, CandleEngine
+from .indicator_tools import IndicatorTools
+
+# Below this many bars TA-Lib's per-pattern loops beat the shared features.
+ENGINE_MIN_BARS = 10_000
+
+
+def pattern_functions(indicators: IndicatorTools) -> list[str]:
+    """Return the registered candlestick pattern functions."""
+    return sorted(name for name in indicators.indicators if name.startswith("CDL"))
+
+
+def scan_patterns(
+    indicators: IndicatorTools,
+    series: dict[str, np.ndarray],
+    patterns: list[str] | None = None,
+    workers: int = 1,
+) -> dict[str, np.ndarray | list[str]]:
+    """Run candlestick patterns on the same bars and return their hits.
+
+    The result holds one row per non-zero pattern output, ordered by bar index
+    and then pattern name, as the columns ``index``, ``pattern`` and
+    ``signal``. On long series, patterns the ``CandleEngine`` supports are
+    evaluated on candle features shared between them and the others by TA-Lib.
+    With ``workers`` above one the patterns run in a thread pool.
+    """
+    available = pattern_functions(indicators)
+    if patterns is None:
+        patterns = available
+    else:
+        patterns = sorted({pattern.upper() for pattern in patterns})
+        unknown = sorted(set(patterns) - set(available))
+        if unknown:
+            raise ValueError(f"Unknown candlestick patterns: {unknown}")
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    missing = [name for name in PATTERN_INPUTS if name not in series]
+    if missing:
+        raise ValueError(f"Missing input series {missing}: pass them or a dataset")
+    inputs = {name: series[name] for name in PATTERN_INPUTS}
+    engine = None
+    if len(inputs["close"]) >= ENGINE_MIN_BARS:
+        engine = CandleEngine(inputs)
+
+    def run(pattern: str) -> tuple[np.ndarray, np.ndarray]:
+        indicator = indicators.indicator(pattern)
+        if engine is not None and CandleEngine.supports(pattern):
+            # The tools' own parameter defaults, as when TA-Lib computes it.
+            found = engine.hits(pattern, dict(indicator.params.model_validate({})))
+            if found is not None:
+                return found
+        output = indicator(inputs, {})["result"]
+        rows = np.flatnonzero(output)
+        return rows, output[rows]
+
+    if workers == 1 or len(patterns) == 1:
+        hits = [run(pattern) for pattern in patterns]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hits = list(executor.map(run, patterns))
+    index = np.concatenate([np.empty(0, dtype=np.intp), *(rows for rows, _ in hits)])
+    signal = np.concatenate(
+        [np.empty(0, dtype=np.int32), *(values for _, values in hits)]
+    )
+    which = np.repeat(np.arange(len(patterns)), [len(rows) for rows, _ in hits])
+    # Patterns are sorted by name, so a stable sort by index orders ties by name.
+    order = np.argsort(index, kind="stable")
+    return {
+        "index": index[order],
+        "pattern": [patterns[i] for i in which[order]],
+        "signal": signal[order].astype(np.int32),
+    }
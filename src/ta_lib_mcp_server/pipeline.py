@@ -0,0 +1,89 @@
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .datasets import DEFAULT_COLUMNS
+from .indicator_tools import IndicatorTools
+
+
+class PipelineStep(BaseModel):
+    """One indicator computation in a pipeline."""
+
+    name: str = Field(
+        description="Name under which later steps and the outputs refer to this "
+        "step's result; a step with several outputs exposes them as '<name>.<output>'"
+    )
+    function: str = Field(
+        description="TA-Lib function to apply, e.g. RSI, BBANDS or HT_DCPERIOD"
+    )
+    inputs: dict[str, str] = Field(
+        default_factory=dict,
+        description="Maps the function's inputs to pipeline inputs or earlier "
+        "step outputs. By default 'real' reads 'close' and every other input "
+        "reads the series of the same name",
+    )
+    params: dict[str, Any] = Field(
+        default_factory=dict, description="Parameters of the function"
+    )
+
+
+def run_pipeline(
+    indicators: IndicatorTools,
+    series: dict[str, np.ndarray],
+    steps: list[PipelineStep],
+    outputs: list[str] | None = None,
+) -> dict[str, np.ndarray]:
+    """Run steps in order on ndarrays and return the requested outputs.
+
+    Each step may read the pipeline inputs and the outputs of earlier steps.
+    Without ``outputs``, every output of the last step is returned.
+    """
+    if not steps:
+        raise ValueError("A pipeline needs at least one step")
+    values = dict(series)
+    produced: dict[str, list[str]] = {}
+    for step in steps:
+        if step.name in values or step.name in produced:
+            raise ValueError(f"Step name {step.name!r} is already in use")
+        indicator = indicators.indicator(step.function)
+        unknown = set(step.inputs) - set(indicator.series)
+        if unknown:
+            raise ValueError(
+                f"Step {step.name!r}: {step.function} has no inputs "
+                f"{sorted(unknown)}; its inputs are {indicator.series}"
+            )
+        inputs = {
+            name: _lookup(
+                values,
+                produced,
+                step.inputs.get(name) or DEFAULT_COLUMNS.get(name, name),
+            )
+            for name in indicator.series
+        }
+        try:
+            result = indicator(inputs, step.params)
+        except Exception as error:
+            raise ValueError(f"Step {step.name!r} failed: {error}") from error
+        if len(result) == 1:
+            values[step.name] = next(iter(result.values()))
+            produced[step.name] = [step.name]
+        else:
+            produced[step.name] = [f"{step.name}.{key}" for key in result]
+            for key, output in result.items():
+                values[f"{step.name}.{key}"] = output
+    if outputs is None:
+        outputs = produced[steps[-1].name]
+    return {name: _lookup(values, produced, name) for name in outputs}
+
+
+def _lookup(
+    values: dict[str, np.ndarray], produced: dict[str, list[str]], name: str
+) -> np.ndarray:
+    if name in values:
+        return values[name]
+    if name in produced:
+        raise ValueError(
+            f"Step {name!r} has several outputs; refer to one of {produced[name]}"
+        )
+    raise ValueError(f"Unknown series {name!r}; available: {sorted(values)}")
@@ -0,0 +1,223 @@
+import math
+import secrets
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+from mcp.types import ContentBlock, ResourceLink, TextContent
+from pydantic import Field
+
+from .encoding import encode_json
+
+RESULT_URI_SCHEME = "ta://results/"
+
+DEFAULT_INLINE_LIMIT = 256 * 1024
+DEFAULT_STORE_LIMIT = 256 * 1024 * 1024
+DEFAULT_PAGE_SIZE = 1000
+# Longer string outputs, such as encoded matrices, are left out of summaries.
+SUMMARY_STRING_LIMIT = 1024
+
+
+def _series_length(value: Any) -> int | None:
+    """Return the length of an output series, or None for scalar outputs."""
+    if isinstance(value, str | bytes | dict):
+        return None
+    try:
+        return len(value)
+    except TypeError:
+        return None
+
+
+def _last_value(value: Any) -> Any:
+    last = value[-1]
+    if _series_length(last) is not None:
+        # The last row of a panel.
+        return _last_value(last) if len(last) else None
+    if hasattr(last, "item"):
+        last = last.item()
+    if isinstance(last, float) and not math.isfinite(last):
+        return None
+    return last
+
+
+@dataclass
+class StoredResult:
+    """An encoded tool result held server-side and served as a resource."""
+
+    result_id: str
+    tool: str
+    result: dict[str, Any]
+    encoded: bytes
+
+    @property
+    def uri(self) -> str:
+        return f"{RESULT_URI_SCHEME}{self.result_id}"
+
+    @property
+    def length(self) -> int:
+        lengths = [_series_length(value) for value in self.result.values()]
+        return max((n for n in lengths if n is not None), default=0)
+
+    def summary(self, page_size: int) -> dict[str, Any]:
+        outputs = {}
+        for name, value in self.result.items():
+            length = _series_length(value)
+            if isinstance(value, str) and len(value) > SUMMARY_STRING_LIMIT:
+                outputs[name] = {"size": len(value)}
+            elif length is None:
+                outputs[name] = {"value": value}
+            else:
+                outputs[name] = {
+                    "length": length,
+                    "last": _last_value(value) if length else None,
+                }
+        return {
+            "uri": self.uri,
+            "tool": self.tool,
+            "size_bytes": len(self.encoded),
+            "length": self.length,
+            "page_size": page_size,
+            "pages": max(1, math.ceil(self.length / page_size)),
+            "page_uri_template": f"{self.uri}/pages/{{page}}",
+            "bytes_uri_template": f"{self.uri}/bytes/{{start}}/{{end}}",
+            "outputs": outputs,
+        }
+
+
+class ResultStore:
+    """Holds large tool results server-side so tools can return a resource link.
+
+    Results whose encoded size exceeds ``inline_limit`` bytes are kept in memory
+    (least recently used results are dropped once ``max_bytes`` is exceeded) and
+    exposed under ``ta://results/<id>``.
+    """
+
+    def __init__(
+        self,
+        inline_limit: int = DEFAULT_INLINE_LIMIT,
+        max_bytes: int = DEFAULT_STORE_LIMIT,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ):
+        self.inline_limit = inline_limit
+        self.max_bytes = max_bytes
+        self.page_size = page_size
+        self._results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def put(
+        self,
+        tool: str,
+        result: dict[str, Any],
+        encoded: bytes,
+        result_id: str | None = None,
+    ) -> StoredResult:
+        stored = StoredResult(result_id or secrets.token_hex(8), tool, result, encoded)
+        with self._lock:
+            if stored.result_id in self._results:
+                self._results.move_to_end(stored.result_id)
+                return self._results[stored.result_id]
+            self._results[stored.result_id] = stored
+            self._size += len(encoded)
+            while self._size > self.max_bytes and len(self._results) > 1:
+                _, evicted = self._results.popitem(last=False)
+                self._size -= len(evicted.encoded)
+        return stored
+
+    def get(self, result_id: str) -> StoredResult:
+        with self._lock:
+            try:
+                self._results.move_to_end(result_id)
+                return self._results[result_id]
+            except KeyError:
+                raise ValueError(f"Unknown or expired result: {result_id}") from None
+
+    def read_page(self, result_id: str, page: int) -> bytes:
+        stored = self.get(result_id)
+        start = page * self.page_size
+        if page < 0 or (page > 0 and start >= stored.length):
+            raise ValueError(f"Page {page} is out of range for result {result_id}")
+        stop = start + self.page_size
+        sliced = {
+            name: value[start:stop] if _series_length(value) is not None else value
+            for name, value in stored.result.items()
+        }
+        return encode_json({"page": page, "start": start, **sliced})
+
+    def read_bytes(self, result_id: str, start: int, end: int) -> bytes:
+        """Return the encoded result bytes in the half-open range [start, end)."""
+        stored = self.get(result_id)
+        if start < 0 or end < start:
+            raise ValueError(f"Invalid byte range {start}-{end}")
+        return stored.encoded[start:end]
+
+    def to_content(
+        self,
+        tool: str,
+        result: dict[str, Any],
+        encoded: bytes | None = None,
+        result_id: str | None = None,
+    ) -> list[ContentBlock]:
+        """Convert a tool result into content, offloading it if it is too large.
+
+        ``encoded`` may carry the already encoded result, and ``result_id`` a
+        content-derived identifier so repeated results share one resource.
+        """
+        if encoded is None:
+            encoded = encode_json(result)
+        if len(encoded) <= self.inline_limit:
+            return [TextContent(type="text", text=encoded.decode())]
+        stored = self.put(tool, result, encoded, result_id)
+        summary = stored.summary(self.page_size)
+        return [
+            TextContent(type="text", text=encode_json(summary).decode()),
+            ResourceLink(
+                type="resource_link",
+                uri=stored.uri,
+                name=f"{tool} result",
+                description=f"Full {tool} result ({len(encoded)} bytes of JSON)",
+                mimeType="application/json",
+                size=len(encoded),
+            ),
+        ]
+
+
+def register_result_resources(mcp, store: ResultStore):
+    """Register the resources serving offloaded tool results."""
+
+    @mcp.resource(
+        RESULT_URI_SCHEME + "{result_id}",
+        title="Tool result",
+        description="Full JSON of a tool result that was too large to inline",
+        mime_type="application/json",
+    )
+    def _result(
+        result_id: Annotated[str, Field(description="Result identifier")],
+    ) -> str:
+        return store.get(result_id).encoded.decode()
+
+    @mcp.resource(
+        RESULT_URI_SCHEME + "{result_id}/pages/{page}",
+        title="Tool result page",
+        description="One page of rows of a tool result, as JSON",
+        mime_type="application/json",
+    )
+    def _result_page(
+        result_id: Annotated[str, Field(description="Result identifier")],
+        page: Annotated[int, Field(description="Zero-based page number")],
+    ) -> str:
+        return store.read_page(result_id, page).decode()
+
+    @mcp.resource(
+        RESULT_URI_SCHEME + "{result_id}/bytes/{start}/{end}",
+        title="Tool result byte range",
+        description="The bytes [start, end) of a tool result's JSON encoding",
+        mime_type="application/octet-stream",
+    )
+    def _result_bytes(
+        result_id: Annotated[str, Field(description="Result identifier")],
+        start: Annotated[int, Field(description="First byte offset")],
+        end: Annotated[int, Field(description="End byte offset (exclusive)")],
+    ) -> bytes:
+        return store.read_bytes(result_id, start, end)
@@ -1,26 +1,85 @@
 from mcp.server.fastmcp import FastMCP
 
+from .bar_store import BarStore
+from .cache import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_DISK_CACHE_SIZE,
+    DiskCache,
+    ResultCache,
+)
+from .datasets import DEFAULT_RESIDENT_SIZE, DatasetRegistry
+from .indicator_tools import IndicatorTools
+from .results import DEFAULT_INLINE_LIMIT, ResultStore, register_result_resources
+from .tools.bar_management import register_bar_management
+from .tools.batch import register_batch
+from .tools.cache_management import register_cache_management
+from .tools.correlation import register_correlation
 from .tools.cycle_indicators import register_cycle_indicators
+from .tools.dataset_management import register_dataset_management
 from .tools.momentum_indicators import register_momentum_indicators
 from .tools.overlap_studies import register_overlap_studies
 from .tools.pattern_recognition import register_pattern_recognition
+from .tools.pattern_scan import register_pattern_scan
+from .tools.pipeline import register_pipeline
 from .tools.price_transform import register_price_transform
 from .tools.statistic_functions import register_statistic_functions
+from .tools.streams import register_streams
+from .tools.sweep import register_sweep
 from .tools.volatility_indicators import register_volatility_indicators
 from .tools.volume_indicators import register_volume_indicators
 
 
-def serve() -> None:
+def serve(
+    inline_limit: int = DEFAULT_INLINE_LIMIT,
+    cache_size: int = DEFAULT_CACHE_SIZE,
+    cache_ttl: float | None = DEFAULT_CACHE_TTL,
+    cache_dir: str | None = None,
+    disk_cache_size: int = DEFAULT_DISK_CACHE_SIZE,
+    dataset_dir: str | None = None,
+    dataset_memory: int = DEFAULT_RESIDENT_SIZE,
+    db_path: str | None = None,
+    panel_workers: int | None = None,
+    batch_window: float = 0.0,
+    transport: str = "stdio",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> None:
     # Initialize FastMCP server
-    mcp = FastMCP("ta-lib")
+    mcp = FastMCP("ta-lib", host=host, port=port)
+    results = ResultStore(inline_limit=inline_limit)
+    disk = DiskCache(cache_dir, max_bytes=disk_cache_size) if cache_dir else None
+    cache = ResultCache(max_bytes=cache_size, ttl=cache_ttl, disk=disk)
+    datasets = DatasetRegistry(dataset_dir, max_resident_bytes=dataset_memory)
+    bars = BarStore(db_path, max_resident_bytes=dataset_memory) if db_path else None
+    indicators = IndicatorTools(
+        mcp,
+        results,
+        cache,
+        datasets,
+        bars,
+        panel_workers=panel_workers,
+        batch_window=batch_window,
+    )
 
-    register_overlap_studies(mcp)
-    register_momentum_indicators(mcp)
-    register_volatility_indicators(mcp)
-    register_cycle_indicators(mcp)
-    register_price_transform(mcp)
-    register_pattern_recognition(mcp)
-    register_statistic_functions(mcp)
-    register_volume_indicators(mcp)
+    register_overlap_studies(indicators)
+    register_momentum_indicators(indicators)
+    register_volatility_indicators(indicators)
+    register_cycle_indicators(indicators)
+    register_price_transform(indicators)
+    register_pattern_recognition(indicators)
+    register_statistic_functions(indicators)
+    register_volume_indicators(indicators)
+    register_pipeline(mcp, indicators)
+    register_batch(mcp, indicators)
+    register_pattern_scan(mcp, indicators)
+    register_sweep(mcp, indicators)
+    register_correlation(mcp, indicators)
+    register_streams(mcp, indicators)
+    register_result_resources(mcp, results)
+    register_cache_management(mcp, cache)
+    register_dataset_management(mcp, datasets)
+    if bars is not None:
+        register_bar_management(mcp, bars)
 
-    mcp.run(transport="stdio")
+    mcp.run(transport=transport)
@@ -0,0 +1,228 @@
+import secrets
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from .datasets import DEFAULT_COLUMNS
+from .hashing import to_float64_array
+from .incremental import WINDOWED_FUNCTIONS, RecursiveState, lookback
+from .indicator_tools import Indicator, IndicatorTools
+from .windows import STATES
+
+# Open streams beyond this many are refused until others are closed.
+DEFAULT_MAX_STREAMS = 10_000
+
+# State classes that streams advance bar by bar, by function.
+STREAM_STATES: dict[str, type[RecursiveState]] = STATES
+
+# Functions that can be streamed: those with a state, and those whose values
+# only depend on a fixed number of past bars.
+STREAMABLE_FUNCTIONS = frozenset(STREAM_STATES) | WINDOWED_FUNCTIONS
+
+
+@dataclass
+class Stream:
+    """A live indicator that clients update a few bars at a time.
+
+    Until the indicator has its first value, the bars received are kept and
+    TA-Lib computes the new values from all of them. From then on only the
+    indicator's state is kept: the few numbers of a recursive indicator, or
+    the ring buffer and running sums of a windowed one, which each update
+    advances in O(1) per bar. Where there is no state that reproduces the
+    installed TA-Lib build with these parameters, windowed functions keep
+    their last ``window`` bars, on which TA-Lib computes the new values in
+    O(window) per update. That is exact for those computing each value from
+    its window alone, but running sums restarted on the window, as when a
+    state fails its calibration, can differ from a full recompute in the last
+    digits. Other functions keep every bar so TA-Lib recomputes them on each
+    update.
+    """
+
+    stream_id: str
+    indicator: Indicator
+    params: dict[str, Any]
+    # Input column read for each input series of the indicator.
+    columns: dict[str, str]
+    outputs: tuple[str, ...]
+    # Bars kept without a state, or None to keep them all.
+    window: int | None = None
+    length: int = 0
+    state: RecursiveState | None = field(default=None, repr=False)
+    history: dict[str, np.ndarray] | None = field(default=None, repr=False)
+    latest: dict[str, float] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def describe(self) -> dict:
+        return {
+            "stream": self.stream_id,
+            "function": self.indicator.function,
+            "params": self.params,
+            "columns": sorted(set(self.columns.values())),
+            "outputs": list(self.outputs),
+            "length": self.length,
+            "stateful": self.state is not None,
+            "buffered": self.buffered(),
+            "latest": self.latest,
+        }
+
+    def buffered(self) -> int:
+        """Return the number of bars the stream keeps."""
+        if self.history is None:
+            return 0
+        return len(next(iter(self.history.values())))
+
+    def update(self, bars: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+        """Append bars, keyed by input series, and return their output values."""
+        count = len(next(iter(bars.values())))
+        with self.lock:
+            if self.state is not None:
+                values = dict(zip(self.outputs, self.state.extend(bars), strict=True))
+            else:
+                values = self._recompute(
+                    {
+                        name: np.concatenate([self.history[name], bars[name]])
+                        for name in bars
+                    },
+                    count,
+                )
+            self.length += count
+            if count:
+                self.latest = {key: series[-1] for key, series in values.items()}
+            return values
+
+    def _recompute(
+        self, history: dict[str, np.ndarray], count: int
+    ) -> dict[str, np.ndarray]:
+        """Compute the last ``count`` values from all bars and keep the state.
+
+        The bars are kept instead while there is no state.
+        """
+        if len(next(iter(history.values()))) == 0:
+            return {key: np.empty(0) for key in self.outputs}
+        result = self.indicator(history, self.params)
+        state_class = STREAM_STATES.get(self.indicator.function)
+        if state_class is not None and state_class.calibrated():
+            self.state = state_class.from_history(
+                history, self.params, tuple(result.values())
+            )
+        if self.state is not None:
+            self.history = None
+        elif self.window is not None:
+            self.history = {
+                name: values[max(0, len(values) - self.window) :]
+                for name, values in history.items()
+            }
+        else:
+            self.history = history
+        return {key: values[len(values) - count :] for key, values in result.items()}
+
+
+class StreamRegistry:
+    """Open streams by identifier."""
+
+    def __init__(
+        self, indicators: IndicatorTools, max_streams: int = DEFAULT_MAX_STREAMS
+    ):
+        self.indicators = indicators
+        self.max_streams = max_streams
+        self._streams: dict[str, Stream] = {}
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        function: str,
+        params: dict[str, Any] | None,
+        series: dict[str, np.ndarray],
+    ) -> Stream:
+        """Open a stream of an indicator, starting from the bars in ``series``."""
+        indicator = self.indicators.indicator(function)
+        if indicator.function not in STREAMABLE_FUNCTIONS:
+            raise ValueError(
+                f"{indicator.function} cannot be streamed; it has no state "
+                "and its values depend on every past bar"
+            )
+        try:
+            validated = dict(indicator.params.model_validate(params or {}))
+        except ValueError as error:
+            raise ValueError(f"Invalid parameters {params}: {error}") from None
+        columns = {name: DEFAULT_COLUMNS.get(name, name) for name in indicator.series}
+        history = {name: np.empty(0) for name in indicator.series}
+        windowed = indicator.function in WINDOWED_FUNCTIONS
+        stream = Stream(
+            secrets.token_hex(8),
+            indicator,
+            validated,
+            columns,
+            tuple(indicator(history, validated)),
+            window=lookback(indicator.function, validated) if windowed else None,
+            history=history,
+        )
+        stream.update(_bars(stream, series, update=False))
+        with self._lock:
+            if len(self._streams) >= self.max_streams:
+                raise ValueError(
+                    f"{len(self._streams)} streams are open, the most allowed; "
+                    "close some first"
+                )
+            self._streams[stream.stream_id] = stream
+        return stream
+
+    def get(self, stream_id: str) -> Stream:
+        with self._lock:
+            try:
+                return self._streams[stream_id]
+            except KeyError:
+                raise ValueError(f"Unknown or closed stream: {stream_id}") from None
+
+    def update(
+        self, stream_id: str, series: dict[str, list[float]]
+    ) -> tuple[Stream, dict[str, np.ndarray]]:
+        stream = self.get(stream_id)
+        return stream, stream.update(_bars(stream, series, update=True))
+
+    def close(self, stream_id: str) -> Stream:
+        with self._lock:
+            try:
+                return self._streams.pop(stream_id)
+            except KeyError:
+                raise ValueError(f"Unknown or closed stream: {stream_id}") from None
+
+    def list(self) -> list[Stream]:
+        with self._lock:
+            return list(self._streams.values())
+
+
+def _bars(
+    stream: Stream, series: dict[str, Any], update: bool
+) -> dict[str, np.ndarray]:
+    """Return the stream's input series from bars keyed by column name.
+
+    A stream may be opened without bars, and from a dataset with more
+    columns than it reads.
+    """
+    if not series and not update:
+        return {name: np.empty(0) for name in stream.columns}
+    needed = set(stream.columns.values())
+    missing = sorted(needed - set(series))
+    unknown = sorted(set(series) - needed) if update else []
+    if missing or unknown:
+        raise ValueError(
+            f"{stream.indicator.function} streams take the columns "
+            f"{sorted(needed)}; missing {missing}, unknown {unknown}"
+        )
+    bars = {
+        name: to_float64_array(series[column])
+        for name, column in stream.columns.items()
+    }
+    if any(values.ndim != 1 for values in bars.values()):
+        raise ValueError("Each column holds the values of one series")
+    lengths = {len(values) for values in bars.values()}
+    if len(lengths) > 1:
+        raise ValueError("Every column needs the same number of bars")
+    if update and lengths == {0}:
+        raise ValueError("Pass at least one bar")
+    if not all(np.isfinite(values).all() for values in bars.values()):
+        raise ValueError("Stream bars must be finite")
+    return bars
@@ -0,0 +1,211 @@
+import base64
+import functools
+import itertools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import talib
+
+from .datasets import DEFAULT_COLUMNS
+from .indicator_tools import IndicatorTools
+from .results import DEFAULT_STORE_LIMIT
+from .tools.types import MA_TYPE_MAP
+
+# A sweep's matrix may use at most as much memory as the result store.
+MAX_SWEEP_VALUES = DEFAULT_STORE_LIMIT // 8
+
+
+def parameter_grid(grid: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Return every combination of the grid's values, the last varying fastest."""
+    names = list(grid)
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*grid.values())
+    ]
+
+
+def _bbands(
+    inputs: dict[str, np.ndarray], combos: list[dict]
+) -> list[dict[str, np.ndarray] | None]:
+    shared = {}
+    results = []
+    for combo in combos:
+        period, matype = combo["timeperiod"], combo["matype"]
+        width = combo["nbdevup"]
+        # TA-Lib computes asymmetric bands with a multiply-add it may fuse.
+        if period < 2 or combo["nbdevdn"] != width:
+            results.append(None)
+            continue
+        if (period, matype) not in shared:
+            shared[period, matype] = (
+                talib.MA(inputs["real"], period, MA_TYPE_MAP[matype]),
+                talib.STDDEV(inputs["real"], period, 1.0),
+            )
+        middle, deviation = shared[period, matype]
+        offset = deviation * width
+        results.append(
+            {
+                "upperband": middle + offset,
+                "middleband": middle,
+                "lowerband": middle - offset,
+            }
+        )
+    return results
+
+
+# Indicators whose combinations share work, each returning None for the
+# combinations TA-Lib has to compute itself.
+_SHARED: dict[str, Callable[[dict, list[dict]], list[dict | None]]] = {
+    "BBANDS": _bbands,
+}
+
+
+# Grids exercising each shared computation when it is calibrated. Every
+# width is paired with itself, as the shared bands are symmetric, and with
+# the others, which TA-Lib computes itself.
+_CALIBRATION_GRIDS = {
+    "BBANDS": {
+        "timeperiod": [2, 5, 20],
+        "nbdevup": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0],
+        "nbdevdn": [0.5, 1.0, 1.5, 2.0, 2.5, 3.0],
+    },
+}
+
+# The parameter whose values are calibrated separately, as the shared
+# computation only reproduces TA-Lib for some of them: TA-Lib rounds some
+# moving averages differently inside BBANDS than in MA.
+_CALIBRATED_BY = {"BBANDS": "matype"}
+
+
+@functools.cache
+def _calibrated(function: str, value: Any) -> bool:
+    """Check that a shared computation reproduces the installed TA-Lib.
+
+    ``value`` is the value of the function's ``_CALIBRATED_BY`` parameter.
+    """
+    rng = np.random.default_rng(0)
+    bars = {"close": 100 + np.cumsum(rng.normal(size=2000))}
+    name = _CALIBRATED_BY[function]
+    combos = parameter_grid({**_CALIBRATION_GRIDS[function], name: [value]})
+    results = _SHARED[function]({"real": bars["close"]}, combos)
+    for combo, result in zip(combos, results, strict=True):
+        if result is None:
+            continue
+        if "matype" in combo:
+            combo = {**combo, "matype": MA_TYPE_MAP[combo["matype"]]}
+        expected = talib.abstract.Function(function)(bars, **combo)
+        if isinstance(expected, np.ndarray):
+            expected = [expected]
+        if not all(
+            np.array_equal(actual, values, equal_nan=True)
+            for actual, values in zip(result.values(), expected, strict=True)
+        ):
+            return False
+    return True
+
+
+def run_sweep(
+    indicators: IndicatorTools,
+    series: dict[str, np.ndarray],
+    function: str,
+    grid: dict[str, list[Any]],
+    outputs: list[str] | None = None,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Compute an indicator for every combination of a parameter grid.
+
+    The outputs form one float64 matrix with a row per combination and output,
+    row ``c * len(outputs) + o`` holding output ``o`` of combination ``c``,
+    returned as base64 encoded little-endian bytes in row-major order under
+    ``values``. BBANDS combinations differing only in their band width share
+    the moving average and standard deviation, for the MA types where that
+    reproduces TA-Lib; the others are computed by TA-Lib, in a thread pool
+    when ``workers`` is above one.
+    """
+    indicator = indicators.indicator(function)
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    empty = sorted(name for name, values in grid.items() if not values)
+    if empty:
+        raise ValueError(f"Grid parameters need at least one value: {empty}")
+    combos = []
+    for combo in parameter_grid(grid):
+        try:
+            combos.append(dict(indicator.params.model_validate(combo)))
+        except ValueError as error:
+            raise ValueError(f"Invalid parameters {combo}: {error}") from None
+    inputs = {}
+    for name in indicator.series:
+        column = DEFAULT_COLUMNS.get(name, name)
+        if column not in series:
+            raise ValueError(
+                f"Missing input series {column!r}; available: {sorted(series)}"
+            )
+        inputs[name] = series[column]
+    length = len(next(iter(inputs.values()))) if inputs else 0
+
+    # The indicator names its outputs on empty series, so the sweep's size is
+    # checked before any combination is computed.
+    available = list(
+        indicator({name: values[:0] for name, values in inputs.items()}, combos[0])
+    )
+    if outputs is None:
+        outputs = available
+    unknown = [name for name in outputs if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown outputs {unknown}; available: {available}")
+    rows = len(combos) * len(outputs)
+    if rows * length > MAX_SWEEP_VALUES:
+        raise ValueError(
+            f"The sweep has {rows} rows of {length} values, more than the "
+            f"{MAX_SWEEP_VALUES} values allowed; narrow the grid or the series"
+        )
+
+    results: list[dict | None] = [None] * len(combos)
+    shared = _SHARED.get(indicator.function)
+    if shared is not None and not any(
+        np.isnan(values).any() for values in inputs.values()
+    ):
+        name = _CALIBRATED_BY[indicator.function]
+        calibrated = [
+            c
+            for c, combo in enumerate(combos)
+            if _calibrated(indicator.function, combo[name])
+        ]
+        for c, result in zip(
+            calibrated, shared(inputs, [combos[c] for c in calibrated]), strict=True
+        ):
+            results[c] = result
+    # Results are written into the matrix as they arrive, so at most the
+    # shared ones are held besides it.
+    matrix = np.empty((rows, length), dtype="<f8")
+
+    def store(c: int, result: dict[str, np.ndarray]) -> None:
+        for o, name in enumerate(outputs):
+            matrix[c * len(outputs) + o] = result[name]
+
+    def run(c: int) -> None:
+        store(c, indicator(inputs, combos[c]))
+
+    pending = []
+    for c, result in enumerate(results):
+        if result is None:
+            pending.append(c)
+        else:
+            store(c, result)
+    results.clear()
+    if workers == 1 or len(pending) <= 1:
+        for c in pending:
+            run(c)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run, pending))
+    return {
+        "function": indicator.function,
+        "params": combos,
+        "outputs": outputs,
+        "shape": [rows, length],
+        "values": base64.b64encode(matrix.tobytes()).decode(),
+    }
@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..bar_store import BarStore
+
+
+def register_bar_management(mcp, bars: BarStore):
+    """Register the bar database tools with the MCP server."""
+
+    @mcp.tool(
+        title="Store bars",
+        description="Insert timestamped bars of a symbol into the bar database, "
+        "replacing stored bars with the same timestamp. Indicator tools read them "
+        "with the 'symbol', 'start' and 'end' parameters",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+    )
+    def store_bars(
+        symbol: Annotated[str, Field(description="Symbol the bars belong to")],
+        timestamps: Annotated[
+            list[int], Field(description="Timestamp of each bar, e.g. epoch seconds")
+        ],
+        columns: Annotated[
+            dict[str, list[float]],
+            Field(
+                description="Values keyed by column name (e.g. open, high, low, "
+                "close, volume), one per timestamp"
+            ),
+        ],
+    ):
+        return bars.write(symbol, timestamps, columns).describe()
+
+    @mcp.tool(
+        title="List symbols",
+        description="List the symbols in the bar database with their time ranges",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def list_symbols():
+        return [bars.get(symbol).describe() for symbol in bars.symbols()]
+
+    @mcp.tool(
+        title="Delete symbol",
+        description="Delete every stored bar of a symbol from the bar database",
+        annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    )
+    def delete_symbol(
+        symbol: Annotated[str, Field(description="Symbol to delete")],
+    ):
+        return bars.delete(symbol).describe()
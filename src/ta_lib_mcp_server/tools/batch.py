@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..batch import BatchSpec, run_batch
+from ..indicator_tools import IndicatorTools
+
+
+def register_batch(mcp, indicators: IndicatorTools):
+    """Register the batch indicator tool with the MCP server."""
+
+    @mcp.tool(
+        title="Compute indicator batch",
+        description="Compute several indicators on the same OHLCV series in one "
+        "request, e.g. RSI, MACD, ADX, ADXR, PLUS_DI, MINUS_DI, ATR and NATR. "
+        "Intermediates shared by the indicators are computed once",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def batch_compute(
+        specs: Annotated[
+            list[BatchSpec],
+            Field(description="Indicators to compute, with their parameters"),
+        ],
+        inputs: Annotated[
+            dict[str, list[float]] | None,
+            Field(description="Named input series: open, high, low, close and volume"),
+        ] = None,
+        dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset whose columns are inputs"),
+        ] = None,
+    ):
+        series, digests = indicators.named_series(inputs, dataset)
+        key = indicators.cache.make_key(
+            "batch_compute",
+            {"indicators": [spec.model_dump() for spec in specs]},
+            series,
+            digests,
+        )
+        return indicators.respond(
+            "batch_compute",
+            key,
+            lambda: run_batch(indicators, series, specs),
+        )
@@ -0,0 +1,24 @@
+from mcp.types import ToolAnnotations
+
+from ..cache import ResultCache
+
+
+def register_cache_management(mcp, cache: ResultCache):
+    """Register the result cache management tools with the MCP server."""
+
+    @mcp.tool(
+        title="Get cache statistics",
+        description="Get the size, hit/miss counts and eviction counts of the indicator result cache",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def get_cache_stats():
+        return cache.stats()
+
+    @mcp.tool(
+        title="Clear cache",
+        description="Remove every entry from the indicator result cache",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+    )
+    def clear_cache():
+        cache.clear()
+        return cache.stats()
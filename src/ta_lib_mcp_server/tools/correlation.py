@@ -0,0 +1,244 @@
+from typing import Annotated, Literal
+
+import numpy as np
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from .. import alignment
+from ..bar_store import TIMESTAMP
+from ..correlation import run_beta, run_correlation
+from ..hashing import to_float64_array
+from ..indicator_tools import IndicatorTools
+
+
+def _panel(
+    indicators: IndicatorTools,
+    real: list[list[float]] | None,
+    symbols: list[str] | None,
+    datasets: list[str] | None,
+    column: str,
+) -> tuple[list[np.ndarray], list[str], dict[str, str]]:
+    """Return the rows of a panel, their names and the digests already known."""
+    if (real is None) == (datasets is None):
+        raise ValueError("Pass either real or datasets")
+    if datasets is not None:
+        if symbols is not None:
+            raise ValueError("Rows of datasets are named after the datasets")
+        stored = [indicators.datasets.get(name) for name in datasets]
+        rows = [dataset.column(column) for dataset in stored]
+        digests = {
+            f"real/{i}": dataset.digest(column) for i, dataset in enumerate(stored)
+        }
+        symbols = list(datasets)
+    else:
+        rows = [to_float64_array(values) for values in real]
+        digests = {}
+        if symbols is None:
+            symbols = [str(i) for i in range(len(rows))]
+    if not rows:
+        raise ValueError("The panel needs at least one series")
+    return rows, symbols, digests
+
+
+def _join(
+    rows: list[np.ndarray], timestamps: list[list[int]] | None, join: str
+) -> tuple[list[np.ndarray], np.ndarray | None]:
+    """Align the rows of a panel on their timestamps, if they have any.
+
+    Returns the aligned rows and their joined timestamps.
+    """
+    if timestamps is None:
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError(
+                "The series differ in length; pass their timestamps to align them"
+            )
+        return rows, None
+    if len(timestamps) != len(rows):
+        raise ValueError(
+            f"Got {len(timestamps)} timestamp lists for {len(rows)} series"
+        )
+    joined, rows = alignment.align(list(zip(timestamps, rows, strict=True)), join)
+    return rows, joined
+
+
+def _stamped(result: dict, joined: np.ndarray | None, rolling: bool) -> dict:
+    """Add the joined timestamps of the result, or that of its latest value."""
+    if joined is not None:
+        result[TIMESTAMP] = joined if rolling else joined[-1]
+    return result
+
+
+_TIMESTAMPS = Field(
+    description="Strictly increasing timestamps of each row, for rows that are "
+    "not aligned bar for bar; the rows are joined on them (see join) and the "
+    "result includes the joined timestamps"
+)
+
+# An outer join leaves NaN where a row has no bar, which no window of the
+# matrices can skip, so only joins giving every row a value are offered.
+_JOIN = Field(
+    description="How timestamped rows are joined: inner keeps the timestamps of "
+    "every row, ffill those of any row once all have started, carrying each "
+    "row's last value forward"
+)
+
+
+def register_correlation(mcp, indicators: IndicatorTools):
+    """Register the cross-sectional correlation and beta tools with the MCP server."""
+
+    @mcp.tool(
+        title="Correlation matrix",
+        description="Compute the N x N correlation (as TA-Lib CORREL computes it "
+        "for each pair) or population covariance matrix of a panel of symbols "
+        "over the last timeperiod bars, or with rolling=true over every window "
+        "as shape [bars, N, N] with NaN before the first full window. Optionally "
+        "lists the top_k pairs with the largest absolute latest value",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def correlation_matrix(
+        real: Annotated[
+            list[list[float]] | None,
+            Field(description="Series of equal length, one row per symbol"),
+        ] = None,
+        symbols: Annotated[
+            list[str] | None,
+            Field(description="Names of the rows of real; default their indices"),
+        ] = None,
+        datasets: Annotated[
+            list[str] | None,
+            Field(description="Registered datasets of equal length, instead of real"),
+        ] = None,
+        column: Annotated[
+            str, Field(description="Column read from each dataset")
+        ] = "close",
+        timeperiod: Annotated[
+            int, Field(description="Number of bars in each window", ge=2)
+        ] = 30,
+        method: Annotated[
+            Literal["correlation", "covariance"],
+            Field(description="Matrix to compute"),
+        ] = "correlation",
+        rolling: Annotated[
+            bool, Field(description="Return the matrix of every window")
+        ] = False,
+        top_k: Annotated[
+            int | None,
+            Field(description="Number of most strongly related pairs to list", ge=1),
+        ] = None,
+        encoding: Annotated[
+            Literal["json", "base64"],
+            Field(
+                description="json returns nested lists under matrix; base64 "
+                "returns little-endian float64 bytes in row-major order under "
+                "values, with the matrix shape under shape"
+            ),
+        ] = "json",
+        timestamps: Annotated[list[list[int]] | None, _TIMESTAMPS] = None,
+        join: Annotated[Literal["inner", "ffill"], _JOIN] = "inner",
+    ):
+        rows, symbols, digests = _panel(indicators, real, symbols, datasets, column)
+        rows, joined = _join(rows, timestamps, join)
+        if joined is not None:
+            digests = {}
+        params = {
+            "symbols": symbols,
+            "timeperiod": timeperiod,
+            "method": method,
+            "rolling": rolling,
+            "top_k": top_k,
+            "encoding": encoding,
+        }
+        key = indicators.cache.make_key(
+            "correlation_matrix",
+            {**params, "join": join if joined is not None else None},
+            {f"real/{i}": row for i, row in enumerate(rows)},
+            digests,
+        )
+        return indicators.respond(
+            "correlation_matrix",
+            key,
+            lambda: _stamped(
+                run_correlation(np.stack(rows), **params), joined, rolling
+            ),
+        )
+
+    @mcp.tool(
+        title="Beta panel",
+        description="Compute the beta of every symbol of a panel against one "
+        "benchmark, e.g. each index constituent against the index: the "
+        "covariance of their one-bar returns over timeperiod returns divided by "
+        "the benchmark's variance, as TA-Lib BETA(benchmark, symbol) computes "
+        "it. Returns the latest beta per symbol, or with rolling=true the full "
+        "beta series per symbol with NaN in the lookback period",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def beta_panel(
+        real: Annotated[
+            list[list[float]] | None,
+            Field(description="Prices of equal length, one row per symbol"),
+        ] = None,
+        symbols: Annotated[
+            list[str] | None,
+            Field(description="Names of the rows of real; default their indices"),
+        ] = None,
+        datasets: Annotated[
+            list[str] | None,
+            Field(description="Registered datasets of equal length, instead of real"),
+        ] = None,
+        column: Annotated[
+            str, Field(description="Column read from each dataset")
+        ] = "close",
+        benchmark: Annotated[
+            list[float] | None,
+            Field(description="Benchmark prices on the same bars as the panel"),
+        ] = None,
+        benchmark_dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset holding the benchmark, instead"),
+        ] = None,
+        timeperiod: Annotated[
+            int, Field(description="Number of returns in each window", ge=1)
+        ] = 5,
+        rolling: Annotated[
+            bool, Field(description="Return the full beta series of every symbol")
+        ] = False,
+        timestamps: Annotated[list[list[int]] | None, _TIMESTAMPS] = None,
+        benchmark_timestamps: Annotated[
+            list[int] | None,
+            Field(description="Timestamps of the benchmark, with timestamps"),
+        ] = None,
+        join: Annotated[Literal["inner", "ffill"], _JOIN] = "inner",
+    ):
+        rows, symbols, digests = _panel(indicators, real, symbols, datasets, column)
+        if (benchmark is None) == (benchmark_dataset is None):
+            raise ValueError("Pass either benchmark or benchmark_dataset")
+        if benchmark_dataset is not None:
+            stored = indicators.datasets.get(benchmark_dataset)
+            index = stored.column(column)
+            digests["benchmark"] = stored.digest(column)
+        else:
+            index = to_float64_array(benchmark)
+        if (timestamps is None) != (benchmark_timestamps is None):
+            raise ValueError("Pass timestamps for both the panel and the benchmark")
+        # The benchmark is joined with the rows, so every row shares its bars.
+        (*rows, index), joined = _join(
+            [*rows, index],
+            None if timestamps is None else [*timestamps, benchmark_timestamps],
+            join,
+        )
+        if joined is not None:
+            digests = {}
+        params = {"symbols": symbols, "timeperiod": timeperiod, "rolling": rolling}
+        key = indicators.cache.make_key(
+            "beta_panel",
+            {**params, "join": join if joined is not None else None},
+            {"benchmark": index, **{f"real/{i}": row for i, row in enumerate(rows)}},
+            digests,
+        )
+        return indicators.respond(
+            "beta_panel",
+            key,
+            lambda: _stamped(
+                run_beta(indicators, np.stack(rows), index, **params), joined, rolling
+            ),
+        )
@@ -11,42 +11,42 @@ common_tool_annotations = ToolAnnotations(readOnlyHint=True)
 def calculate_ht_dcperiod(
     real: Annotated[list[float], Field(description="Real values")],
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.HT_DCPERIOD(real_nparray)
-    return {"ht_dcperiod": result.tolist()}
+    return {"ht_dcperiod": result}
 
 
 def calculate_ht_dcphase(
     real: Annotated[list[float], Field(description="Real values")],
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.HT_DCPHASE(real_nparray)
-    return {"ht_dcphase": result.tolist()}
+    return {"ht_dcphase": result}
 
 
 def calculate_ht_phasor(
     real: Annotated[list[float], Field(description="Real values")],
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     inphase, quadrature = talib.HT_PHASOR(real_nparray)
-    return {"inphase": inphase.tolist(), "quadrature": quadrature.tolist()}
+    return {"inphase": inphase, "quadrature": quadrature}
 
 
 def calculate_ht_sine(
     real: Annotated[list[float], Field(description="Real values")],
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     sine, leadsine = talib.HT_SINE(real_nparray)
-    return {"sine": sine.tolist(), "leadsine": leadsine.tolist()}
+    return {"sine": sine, "leadsine": leadsine}
 
 
 def calculate_ht_trendmode(
     real: Annotated[list[float], Field(description="Real values")],
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.HT_TRENDMODE(real_nparray)
     # Type ignore needed due to incorrect type signature in TA-Lib
-    return {"ht_trendmode": result.tolist()}  # type: ignore
+    return {"ht_trendmode": result}  # type: ignore
 
 
 def register_cycle_indicators(mcp):
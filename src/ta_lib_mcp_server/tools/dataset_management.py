@@ -0,0 +1,118 @@
+from typing import Annotated
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..datasets import DatasetRegistry
+from ..uploads import UploadManager
+
+
+def register_dataset_management(mcp, datasets: DatasetRegistry):
+    """Register the dataset registry tools with the MCP server."""
+    uploads = UploadManager(datasets)
+
+    @mcp.tool(
+        title="Register dataset",
+        description="Store named price/volume columns (e.g. open, high, low, close, "
+        "volume) under a handle that indicator tools accept as 'dataset' in place "
+        "of inline series. Registering an existing name replaces it",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+    )
+    def register_dataset(
+        name: Annotated[str, Field(description="Handle to register the dataset as")],
+        columns: Annotated[
+            dict[str, list[float]],
+            Field(description="Equal-length series keyed by column name"),
+        ],
+    ):
+        return datasets.register(name, columns).describe()
+
+    @mcp.tool(
+        title="Append bars",
+        description="Append new bars to every column of a registered dataset. "
+        "Indicator results already computed on the dataset are extended to the "
+        "new bars instead of being recomputed where possible",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=False),
+    )
+    def append_bars(
+        name: Annotated[str, Field(description="Handle of the dataset to extend")],
+        columns: Annotated[
+            dict[str, list[float]],
+            Field(description="New values for each of the dataset's columns"),
+        ],
+    ):
+        return datasets.append(name, columns).describe()
+
+    @mcp.tool(
+        title="Drop dataset",
+        description="Remove a registered dataset and free its memory",
+        annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    )
+    def drop_dataset(
+        name: Annotated[str, Field(description="Handle of the dataset to remove")],
+    ):
+        return datasets.drop(name).describe()
+
+    @mcp.tool(
+        title="List datasets",
+        description="List the registered datasets with their lengths and columns",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def list_datasets():
+        return [dataset.describe() for dataset in datasets.list()]
+
+    @mcp.tool(
+        title="Begin dataset upload",
+        description="Start a multi-part upload of a dataset too large for one "
+        "message. Send its values with upload_chunk, in any order, then call "
+        "commit_upload",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    def begin_upload(
+        name: Annotated[str, Field(description="Handle to register the dataset as")],
+        columns: Annotated[list[str], Field(description="Names of the columns")],
+        length: Annotated[int, Field(description="Number of values in each column")],
+    ):
+        return uploads.begin(name, columns, length).describe()
+
+    @mcp.tool(
+        title="Upload chunk",
+        description="Write a run of values of one column of an upload, starting "
+        "at an offset. Pass the values either as a list or, more compactly, as "
+        "base64 encoded little-endian float64 bytes",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=True),
+    )
+    def upload_chunk(
+        upload_id: Annotated[str, Field(description="Id returned by begin_upload")],
+        column: Annotated[str, Field(description="Column the values belong to")],
+        offset: Annotated[int, Field(description="Index of the first value")] = 0,
+        values: Annotated[
+            list[float] | None, Field(description="Values as a list")
+        ] = None,
+        data: Annotated[
+            str | None,
+            Field(description="Values as base64 encoded little-endian float64 bytes"),
+        ] = None,
+    ):
+        upload = uploads.write(upload_id, column, offset, values, data)
+        return {"upload_id": upload.upload_id, "missing": upload.missing()}
+
+    @mcp.tool(
+        title="Commit dataset upload",
+        description="Register an upload as a dataset once every value has been sent",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    def commit_upload(
+        upload_id: Annotated[str, Field(description="Id returned by begin_upload")],
+    ):
+        return uploads.commit(upload_id).describe()
+
+    @mcp.tool(
+        title="Abort dataset upload",
+        description="Discard an upload and the values sent so far",
+        annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    )
+    def abort_upload(
+        upload_id: Annotated[str, Field(description="Id returned by begin_upload")],
+    ):
+        return uploads.abort(upload_id).describe()
@@ -20,16 +20,16 @@ def calculate_macd(
     signalperiod: Annotated[
         int, Field(description="Period for signal line EMA")
     ] = 9,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MACD (Moving Average Convergence/Divergence)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     macd, macdsignal, macdhist = talib.MACD(
         real_nparray, fastperiod, slowperiod, signalperiod
     )
     return {
-        "macd": macd.tolist(),
-        "macdsignal": macdsignal.tolist(),
-        "macdhist": macdhist.tolist(),
+        "macd": macd,
+        "macdsignal": macdsignal,
+        "macdhist": macdhist,
     }
 
 
@@ -41,11 +41,11 @@ def calculate_rsi(
     timeperiod: Annotated[
         int, Field(description="Number of periods for RSI calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the RSI (Relative Strength Index)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.RSI(real_nparray, timeperiod)
-    return {"rsi": result.tolist()}
+    return {"rsi": result}
 
 
 def calculate_stochrsi(
@@ -68,9 +68,9 @@ def calculate_stochrsi(
         MAType,
         Field(description="Moving average type for %D calculation"),
     ] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the STOCHRSI (Stochastic Relative Strength Index)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     fastk, fastd = talib.STOCHRSI(
         real_nparray,
         timeperiod,
@@ -78,7 +78,7 @@ def calculate_stochrsi(
         fastd_period,
         MA_TYPE_MAP[fastd_matype],
     )
-    return {"fastk": fastk.tolist(), "fastd": fastd.tolist()}
+    return {"fastk": fastk, "fastd": fastd}
 
 
 def calculate_adx(
@@ -88,13 +88,13 @@ def calculate_adx(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ADX (Average Directional Movement Index)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.ADX(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"adx": result.tolist()}
+    return {"adx": result}
 
 
 def calculate_adxr(
@@ -104,13 +104,13 @@ def calculate_adxr(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ADXR (Average Directional Movement Index Rating)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.ADXR(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"adxr": result.tolist()}
+    return {"adxr": result}
 
 
 def calculate_apo(
@@ -118,11 +118,11 @@ def calculate_apo(
     fastperiod: Annotated[int, Field(description="Fast period")] = 12,
     slowperiod: Annotated[int, Field(description="Slow period")] = 26,
     matype: Annotated[MAType, Field(description="Moving average type")] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the APO (Absolute Price Oscillator)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.APO(real_nparray, fastperiod, slowperiod, MA_TYPE_MAP[matype])
-    return {"apo": result.tolist()}
+    return {"apo": result}
 
 
 def calculate_aroon(
@@ -131,12 +131,12 @@ def calculate_aroon(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the AROON."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     aroondown, aroonup = talib.AROON(high_nparray, low_nparray, timeperiod)
-    return {"aroondown": aroondown.tolist(), "aroonup": aroonup.tolist()}
+    return {"aroondown": aroondown, "aroonup": aroonup}
 
 
 def calculate_aroonosc(
@@ -145,12 +145,12 @@ def calculate_aroonosc(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the AROONOSC (Aroon Oscillator)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.AROONOSC(high_nparray, low_nparray, timeperiod)
-    return {"aroonosc": result.tolist()}
+    return {"aroonosc": result}
 
 
 def calculate_bop(
@@ -158,14 +158,14 @@ def calculate_bop(
     high: Annotated[list[float], Field(description="High prices")],
     low: Annotated[list[float], Field(description="Low prices")],
     close: Annotated[list[float], Field(description="Close prices")],
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the BOP (Balance Of Power)."""
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.BOP(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"bop": result.tolist()}
+    return {"bop": result}
 
 
 def calculate_cci(
@@ -175,13 +175,13 @@ def calculate_cci(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the CCI (Commodity Channel Index)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CCI(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"cci": result.tolist()}
+    return {"cci": result}
 
 
 def calculate_cmo(
@@ -189,11 +189,11 @@ def calculate_cmo(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the CMO (Chande Momentum Oscillator)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.CMO(real_nparray, timeperiod)
-    return {"cmo": result.tolist()}
+    return {"cmo": result}
 
 
 def calculate_dx(
@@ -203,13 +203,13 @@ def calculate_dx(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the DX (Directional Movement Index)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.DX(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"dx": result.tolist()}
+    return {"dx": result}
 
 
 def calculate_macdext(
@@ -220,9 +220,9 @@ def calculate_macdext(
     slowmatype: Annotated[MAType, Field(description="Slow MA type")] = "SMA",
     signalperiod: Annotated[int, Field(description="Signal period")] = 9,
     signalmatype: Annotated[MAType, Field(description="Signal MA type")] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MACDEXT (MACD with controllable MA type)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     macd, macdsignal, macdhist = talib.MACDEXT(
         real_nparray,
         fastperiod,
@@ -233,23 +233,23 @@ def calculate_macdext(
         MA_TYPE_MAP[signalmatype],
     )
     return {
-        "macd": macd.tolist(),
-        "macdsignal": macdsignal.tolist(),
-        "macdhist": macdhist.tolist(),
+        "macd": macd,
+        "macdsignal": macdsignal,
+        "macdhist": macdhist,
     }
 
 
 def calculate_macdfix(
     real: Annotated[list[float], Field(description="Real values")],
     signalperiod: Annotated[int, Field(description="Signal period")] = 9,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MACDFIX (Moving Average Convergence/Divergence Fix 12/26)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     macd, macdsignal, macdhist = talib.MACDFIX(real_nparray, signalperiod)
     return {
-        "macd": macd.tolist(),
-        "macdsignal": macdsignal.tolist(),
-        "macdhist": macdhist.tolist(),
+        "macd": macd,
+        "macdsignal": macdsignal,
+        "macdhist": macdhist,
     }
 
 
@@ -261,16 +261,16 @@ def calculate_mfi(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MFI (Money Flow Index)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
-    volume_nparray = np.array(volume, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
+    volume_nparray = np.asarray(volume, dtype=np.float64)
     result = talib.MFI(
         high_nparray, low_nparray, close_nparray, volume_nparray, timeperiod
     )
-    return {"mfi": result.tolist()}
+    return {"mfi": result}
 
 
 def calculate_minus_di(
@@ -280,13 +280,13 @@ def calculate_minus_di(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MINUS_DI (Minus Directional Indicator)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.MINUS_DI(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"minus_di": result.tolist()}
+    return {"minus_di": result}
 
 
 def calculate_minus_dm(
@@ -295,12 +295,12 @@ def calculate_minus_dm(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MINUS_DM (Minus Directional Movement)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.MINUS_DM(high_nparray, low_nparray, timeperiod)
-    return {"minus_dm": result.tolist()}
+    return {"minus_dm": result}
 
 
 def calculate_mom(
@@ -308,11 +308,11 @@ def calculate_mom(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 10,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MOM (Momentum)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.MOM(real_nparray, timeperiod)
-    return {"mom": result.tolist()}
+    return {"mom": result}
 
 
 def calculate_plus_di(
@@ -322,13 +322,13 @@ def calculate_plus_di(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the PLUS_DI (Plus Directional Indicator)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.PLUS_DI(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"plus_di": result.tolist()}
+    return {"plus_di": result}
 
 
 def calculate_plus_dm(
@@ -337,12 +337,12 @@ def calculate_plus_dm(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the PLUS_DM (Plus Directional Movement)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.PLUS_DM(high_nparray, low_nparray, timeperiod)
-    return {"plus_dm": result.tolist()}
+    return {"plus_dm": result}
 
 
 def calculate_ppo(
@@ -350,11 +350,11 @@ def calculate_ppo(
     fastperiod: Annotated[int, Field(description="Fast period")] = 12,
     slowperiod: Annotated[int, Field(description="Slow period")] = 26,
     matype: Annotated[MAType, Field(description="Moving average type")] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the PPO (Percentage Price Oscillator)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.PPO(real_nparray, fastperiod, slowperiod, MA_TYPE_MAP[matype])
-    return {"ppo": result.tolist()}
+    return {"ppo": result}
 
 
 def calculate_roc(
@@ -362,11 +362,11 @@ def calculate_roc(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 10,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ROC (Rate of change : ((price/prevPrice)-1)*100)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.ROC(real_nparray, timeperiod)
-    return {"roc": result.tolist()}
+    return {"roc": result}
 
 
 def calculate_rocp(
@@ -374,11 +374,11 @@ def calculate_rocp(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 10,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ROCP (Rate of change Percentage: (price-prevPrice)/prevPrice)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.ROCP(real_nparray, timeperiod)
-    return {"rocp": result.tolist()}
+    return {"rocp": result}
 
 
 def calculate_rocr(
@@ -386,11 +386,11 @@ def calculate_rocr(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 10,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ROCR (Rate of change ratio: (price/prevPrice))."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.ROCR(real_nparray, timeperiod)
-    return {"rocr": result.tolist()}
+    return {"rocr": result}
 
 
 def calculate_rocr100(
@@ -398,11 +398,11 @@ def calculate_rocr100(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 10,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ROCR100 (Rate of change ratio 100 scale: (price/prevPrice)*100)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.ROCR100(real_nparray, timeperiod)
-    return {"rocr100": result.tolist()}
+    return {"rocr100": result}
 
 
 def calculate_stoch(
@@ -414,11 +414,11 @@ def calculate_stoch(
     slowk_matype: Annotated[MAType, Field(description="Slow K MA type")] = "SMA",
     slowd_period: Annotated[int, Field(description="Slow D period")] = 3,
     slowd_matype: Annotated[MAType, Field(description="Slow D MA type")] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the STOCH (Stochastic)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     slowk, slowd = talib.STOCH(
         high_nparray,
         low_nparray,
@@ -429,7 +429,7 @@ def calculate_stoch(
         slowd_period,
         MA_TYPE_MAP[slowd_matype],
     )
-    return {"slowk": slowk.tolist(), "slowd": slowd.tolist()}
+    return {"slowk": slowk, "slowd": slowd}
 
 
 def calculate_stochf(
@@ -439,11 +439,11 @@ def calculate_stochf(
     fastk_period: Annotated[int, Field(description="Fast K period")] = 5,
     fastd_period: Annotated[int, Field(description="Fast D period")] = 3,
     fastd_matype: Annotated[MAType, Field(description="Fast D MA type")] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the STOCHF (Stochastic Fast)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     fastk, fastd = talib.STOCHF(
         high_nparray,
         low_nparray,
@@ -452,7 +452,7 @@ def calculate_stochf(
         fastd_period,
         MA_TYPE_MAP[fastd_matype],
     )
-    return {"fastk": fastk.tolist(), "fastd": fastd.tolist()}
+    return {"fastk": fastk, "fastd": fastd}
 
 
 def calculate_trix(
@@ -460,11 +460,11 @@ def calculate_trix(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the TRIX (1-day Rate-Of-Change (ROC) of a Triple Smooth EMA)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.TRIX(real_nparray, timeperiod)
-    return {"trix": result.tolist()}
+    return {"trix": result}
 
 
 def calculate_ultosc(
@@ -474,11 +474,11 @@ def calculate_ultosc(
     timeperiod1: Annotated[int, Field(description="First time period")] = 7,
     timeperiod2: Annotated[int, Field(description="Second time period")] = 14,
     timeperiod3: Annotated[int, Field(description="Third time period")] = 28,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the ULTOSC (Ultimate Oscillator)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.ULTOSC(
         high_nparray,
         low_nparray,
@@ -487,7 +487,7 @@ def calculate_ultosc(
         timeperiod2,
         timeperiod3,
     )
-    return {"ultosc": result.tolist()}
+    return {"ultosc": result}
 
 
 def calculate_willr(
@@ -497,13 +497,13 @@ def calculate_willr(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the WILLR (Williams' %R)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.WILLR(high_nparray, low_nparray, close_nparray, timeperiod)
-    return {"willr": result.tolist()}
+    return {"willr": result}
 
 
 def register_momentum_indicators(mcp):
@@ -27,16 +27,16 @@ def calculate_bbands(
         MAType,
         Field(description="Moving average type for calculation"),
     ] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the BBANDS (Bollinger Bands)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     upperband, middleband, lowerband = talib.BBANDS(
         real_nparray, timeperiod, nbdevup, nbdevdn, MA_TYPE_MAP[matype]
     )
     return {
-        "upperband": upperband.tolist(),
-        "middleband": middleband.tolist(),
-        "lowerband": lowerband.tolist(),
+        "upperband": upperband,
+        "middleband": middleband,
+        "lowerband": lowerband,
     }
 
 
@@ -47,12 +47,12 @@ def calculate_dema(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the DEMA (Double Exponential Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.DEMA(real_nparray, timeperiod)
     return {
-        "dema": result.tolist(),
+        "dema": result,
     }
 
 
@@ -63,12 +63,12 @@ def calculate_ema(
     timeperiod: Annotated[
         int, Field(description="Number of periods for EMA calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the EMA (Exponential Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.EMA(real_nparray, timeperiod)
     return {
-        "ema": result.tolist(),
+        "ema": result,
     }
 
 
@@ -76,12 +76,12 @@ def calculate_ht_trendline(
     real: Annotated[
         list[float], Field(description="Array of real values for calculation")
     ],
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the HT_TRENDLINE (Hilbert Transform - Instantaneous Trendline)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.HT_TRENDLINE(real_nparray)
     return {
-        "ht_trendline": result.tolist(),
+        "ht_trendline": result,
     }
 
 
@@ -92,12 +92,12 @@ def calculate_kama(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the KAMA (Kaufman Adaptive Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.KAMA(real_nparray, timeperiod)
     return {
-        "kama": result.tolist(),
+        "kama": result,
     }
 
 
@@ -112,12 +112,12 @@ def calculate_ma(
         MAType,
         Field(description="Moving average type for calculation"),
     ] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MA (Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.MA(real_nparray, timeperiod, MA_TYPE_MAP[matype])
     return {
-        "ma": result.tolist(),
+        "ma": result,
     }
 
 
@@ -134,13 +134,13 @@ def calculate_mama(
     slowlimit: Annotated[
         float, Field(description="Slow limit for the adaptive moving average calculation")
     ] = 0,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MAMA (MESA Adaptive Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     mama, fama = talib.MAMA(real_nparray, fastlimit, slowlimit)
     return {
-        "mama": mama.tolist(),
-        "fama": fama.tolist(),
+        "mama": mama,
+        "fama": fama,
     }
 
 
@@ -162,16 +162,16 @@ def calculate_mavp(
         MAType,
         Field(description="Moving average type for calculation"),
     ] = "SMA",
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MAVP (Moving Average with Variable Period)."""
-    real_nparray = np.array(real, dtype=np.float64)
-    periods_nparray = np.array(periods, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
+    periods_nparray = np.asarray(periods, dtype=np.float64)
     # Type ignore needed due to incorrect type signature in TA-Lib
     result = talib.MAVP(
         real_nparray, periods_nparray, minperiod, maxperiod, MA_TYPE_MAP[matype]
     )  # type: ignore
     return {
-        "mavp": result.tolist(),
+        "mavp": result,
     }
 
 
@@ -182,12 +182,12 @@ def calculate_midpoint(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MIDPOINT (MidPoint over period)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.MIDPOINT(real_nparray, timeperiod)
     return {
-        "midpoint": result.tolist(),
+        "midpoint": result,
     }
 
 
@@ -197,13 +197,13 @@ def calculate_midprice(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 14,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the MIDPRICE (Midpoint Price over period)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.MIDPRICE(high_nparray, low_nparray, timeperiod)
     return {
-        "midprice": result.tolist(),
+        "midprice": result,
     }
 
 
@@ -217,13 +217,13 @@ def calculate_sar(
     maximum: Annotated[
         float, Field(description="Maximum value for the acceleration factor")
     ] = 0,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the SAR (Parabolic SAR)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.SAR(high_nparray, low_nparray, acceleration, maximum)
     return {
-        "sar": result.tolist(),
+        "sar": result,
     }
 
 
@@ -252,10 +252,10 @@ def calculate_sarext(
     accelerationmaxshort: Annotated[
         float, Field(description="Maximum acceleration factor for short positions")
     ] = 0,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the SAREXT (Parabolic SAR - Extended)."""
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.SAREXT(
         high_nparray,
         low_nparray,
@@ -269,7 +269,7 @@ def calculate_sarext(
         accelerationmaxshort,
     )
     return {
-        "sarext": result.tolist(),
+        "sarext": result,
     }
 
 
@@ -280,12 +280,12 @@ def calculate_sma(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the SMA (Simple Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.SMA(real_nparray, timeperiod)
     return {
-        "sma": result.tolist(),
+        "sma": result,
     }
 
 
@@ -302,12 +302,12 @@ def calculate_t3(
             description="Volume factor for T3 calculation (typically between 0 and 1)"
         ),
     ] = 0,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the T3 (Triple Exponential Moving Average (T3))."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.T3(real_nparray, timeperiod, vfactor)
     return {
-        "t3": result.tolist(),
+        "t3": result,
     }
 
 
@@ -318,12 +318,12 @@ def calculate_tema(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the TEMA (Triple Exponential Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.TEMA(real_nparray, timeperiod)
     return {
-        "tema": result.tolist(),
+        "tema": result,
     }
 
 
@@ -334,12 +334,12 @@ def calculate_trima(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the TRIMA (Triangular Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.TRIMA(real_nparray, timeperiod)
     return {
-        "trima": result.tolist(),
+        "trima": result,
     }
 
 
@@ -350,12 +350,12 @@ def calculate_wma(
     timeperiod: Annotated[
         int, Field(description="Number of periods for calculation")
     ] = 30,
-) -> dict[str, list[float]]:
+) -> dict[str, np.ndarray]:
     """Calculate the WMA (Weighted Moving Average)."""
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.WMA(real_nparray, timeperiod)
     return {
-        "wma": result.tolist(),
+        "wma": result,
     }
 
 
@@ -14,12 +14,12 @@ def calculate_cdl2crows(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL2CROWS(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3blackcrows(
@@ -28,14 +28,14 @@ def calculate_cdl3blackcrows(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3BLACKCROWS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3inside(
@@ -44,14 +44,14 @@ def calculate_cdl3inside(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3INSIDE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3linestrike(
@@ -60,14 +60,14 @@ def calculate_cdl3linestrike(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3LINESTRIKE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3outside(
@@ -76,14 +76,14 @@ def calculate_cdl3outside(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3OUTSIDE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3starsinsouth(
@@ -92,14 +92,14 @@ def calculate_cdl3starsinsouth(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3STARSINSOUTH(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdl3whitesoldiers(
@@ -108,14 +108,14 @@ def calculate_cdl3whitesoldiers(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDL3WHITESOLDIERS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlabandonedbaby(
@@ -125,14 +125,14 @@ def calculate_cdlabandonedbaby(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLABANDONEDBABY(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdladvanceblock(
@@ -141,14 +141,14 @@ def calculate_cdladvanceblock(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLADVANCEBLOCK(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlbelthold(
@@ -157,14 +157,14 @@ def calculate_cdlbelthold(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLBELTHOLD(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlbreakaway(
@@ -173,14 +173,14 @@ def calculate_cdlbreakaway(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLBREAKAWAY(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlclosingmarubozu(
@@ -189,14 +189,14 @@ def calculate_cdlclosingmarubozu(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLCLOSINGMARUBOZU(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlconcealbabyswall(
@@ -205,14 +205,14 @@ def calculate_cdlconcealbabyswall(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLCONCEALBABYSWALL(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlcounterattack(
@@ -221,14 +221,14 @@ def calculate_cdlcounterattack(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLCOUNTERATTACK(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdldarkcloudcover(
@@ -238,14 +238,14 @@ def calculate_cdldarkcloudcover(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLDARKCLOUDCOVER(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdldoji(
@@ -254,12 +254,12 @@ def calculate_cdldoji(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLDOJI(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdldojistar(
@@ -268,14 +268,14 @@ def calculate_cdldojistar(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLDOJISTAR(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdldragonflydoji(
@@ -284,14 +284,14 @@ def calculate_cdldragonflydoji(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLDRAGONFLYDOJI(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlengulfing(
@@ -300,14 +300,14 @@ def calculate_cdlengulfing(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLENGULFING(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdleveningdojistar(
@@ -317,14 +317,14 @@ def calculate_cdleveningdojistar(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLEVENINGDOJISTAR(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdleveningstar(
@@ -334,14 +334,14 @@ def calculate_cdleveningstar(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLEVENINGSTAR(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlgapsidesidewhite(
@@ -350,14 +350,14 @@ def calculate_cdlgapsidesidewhite(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLGAPSIDESIDEWHITE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlgravestonedoji(
@@ -366,14 +366,14 @@ def calculate_cdlgravestonedoji(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLGRAVESTONEDOJI(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhammer(
@@ -382,12 +382,12 @@ def calculate_cdlhammer(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHAMMER(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhangingman(
@@ -396,14 +396,14 @@ def calculate_cdlhangingman(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHANGINGMAN(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlharami(
@@ -412,12 +412,12 @@ def calculate_cdlharami(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHARAMI(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlharamicross(
@@ -426,14 +426,14 @@ def calculate_cdlharamicross(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHARAMICROSS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhighwave(
@@ -442,14 +442,14 @@ def calculate_cdlhighwave(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHIGHWAVE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhikkake(
@@ -458,14 +458,14 @@ def calculate_cdlhikkake(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHIKKAKE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhikkakemod(
@@ -474,14 +474,14 @@ def calculate_cdlhikkakemod(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHIKKAKEMOD(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlhomingpigeon(
@@ -490,14 +490,14 @@ def calculate_cdlhomingpigeon(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLHOMINGPIGEON(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlidentical3crows(
@@ -506,14 +506,14 @@ def calculate_cdlidentical3crows(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLIDENTICAL3CROWS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlinneck(
@@ -522,12 +522,12 @@ def calculate_cdlinneck(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLINNECK(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlinvertedhammer(
@@ -536,14 +536,14 @@ def calculate_cdlinvertedhammer(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLINVERTEDHAMMER(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlkicking(
@@ -552,14 +552,14 @@ def calculate_cdlkicking(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLKICKING(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlkickingbylength(
@@ -568,14 +568,14 @@ def calculate_cdlkickingbylength(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLKICKINGBYLENGTH(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlladderbottom(
@@ -584,14 +584,14 @@ def calculate_cdlladderbottom(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLLADDERBOTTOM(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdllongleggeddoji(
@@ -600,14 +600,14 @@ def calculate_cdllongleggeddoji(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLLONGLEGGEDDOJI(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdllongline(
@@ -616,14 +616,14 @@ def calculate_cdllongline(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLLONGLINE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlmarubozu(
@@ -632,14 +632,14 @@ def calculate_cdlmarubozu(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLMARUBOZU(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlmatchinglow(
@@ -648,14 +648,14 @@ def calculate_cdlmatchinglow(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLMATCHINGLOW(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlmathold(
@@ -665,14 +665,14 @@ def calculate_cdlmathold(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLMATHOLD(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlmorningdojistar(
@@ -682,14 +682,14 @@ def calculate_cdlmorningdojistar(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLMORNINGDOJISTAR(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlmorningstar(
@@ -699,14 +699,14 @@ def calculate_cdlmorningstar(
     close: list[float],
     penetration: float = 0,
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLMORNINGSTAR(
         open_nparray, high_nparray, low_nparray, close_nparray, penetration
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlonneck(
@@ -715,12 +715,12 @@ def calculate_cdlonneck(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLONNECK(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlpiercing(
@@ -729,14 +729,14 @@ def calculate_cdlpiercing(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLPIERCING(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlrickshawman(
@@ -745,14 +745,14 @@ def calculate_cdlrickshawman(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLRICKSHAWMAN(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlrisefall3methods(
@@ -761,14 +761,14 @@ def calculate_cdlrisefall3methods(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLRISEFALL3METHODS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlseparatinglines(
@@ -777,14 +777,14 @@ def calculate_cdlseparatinglines(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSEPARATINGLINES(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlshootingstar(
@@ -793,14 +793,14 @@ def calculate_cdlshootingstar(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSHOOTINGSTAR(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlshortline(
@@ -809,14 +809,14 @@ def calculate_cdlshortline(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSHORTLINE(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlspinningtop(
@@ -825,14 +825,14 @@ def calculate_cdlspinningtop(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSPINNINGTOP(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlstalledpattern(
@@ -841,14 +841,14 @@ def calculate_cdlstalledpattern(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSTALLEDPATTERN(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlsticksandwich(
@@ -857,14 +857,14 @@ def calculate_cdlsticksandwich(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLSTICKSANDWICH(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdltakuri(
@@ -873,12 +873,12 @@ def calculate_cdltakuri(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLTAKURI(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdltasukigap(
@@ -887,14 +887,14 @@ def calculate_cdltasukigap(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLTASUKIGAP(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlthrusting(
@@ -903,14 +903,14 @@ def calculate_cdlthrusting(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLTHRUSTING(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdltristar(
@@ -919,14 +919,14 @@ def calculate_cdltristar(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLTRISTAR(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlunique3river(
@@ -935,14 +935,14 @@ def calculate_cdlunique3river(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLUNIQUE3RIVER(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlupsidegap2crows(
@@ -951,14 +951,14 @@ def calculate_cdlupsidegap2crows(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLUPSIDEGAP2CROWS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def calculate_cdlxsidegap3methods(
@@ -967,14 +967,14 @@ def calculate_cdlxsidegap3methods(
     low: list[float],
     close: list[float],
 ) -> dict:
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.CDLXSIDEGAP3METHODS(
         open_nparray, high_nparray, low_nparray, close_nparray
     )
-    return {"result": result.tolist()}
+    return {"result": result}
 
 
 def register_pattern_recognition(mcp):
@@ -0,0 +1,57 @@
+from typing import Annotated
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..candles import PATTERN_INPUTS
+from ..indicator_tools import IndicatorTools
+from ..patterns import scan_patterns
+
+
+def register_pattern_scan(mcp, indicators: IndicatorTools):
+    """Register the candlestick pattern scan tool with the MCP server."""
+
+    @mcp.tool(
+        title="Scan candlestick patterns",
+        description="Run every candlestick pattern (CDL*) function, or a chosen "
+        "subset, on the same OHLC bars and return only the hits as rows of bar "
+        "index, pattern and signal (100 bullish, -100 bearish, 200/-200 confirmed)",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def scan_candlestick_patterns(
+        open: Annotated[list[float] | None, Field(description="Open prices")] = None,
+        high: Annotated[list[float] | None, Field(description="High prices")] = None,
+        low: Annotated[list[float] | None, Field(description="Low prices")] = None,
+        close: Annotated[list[float] | None, Field(description="Close prices")] = None,
+        dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset to read omitted OHLC series from"),
+        ] = None,
+        patterns: Annotated[
+            list[str] | None,
+            Field(description="Pattern functions to run, e.g. CDLDOJI; default all"),
+        ] = None,
+        workers: Annotated[
+            int, Field(description="Number of threads to run the patterns on", ge=1)
+        ] = 1,
+    ):
+        inline = dict(zip(PATTERN_INPUTS, (open, high, low, close), strict=True))
+        series, digests = indicators.named_series(
+            {name: values for name, values in inline.items() if values is not None},
+            dataset,
+        )
+        key = indicators.cache.make_key(
+            "scan_candlestick_patterns",
+            {
+                "patterns": sorted({pattern.upper() for pattern in patterns})
+                if patterns is not None
+                else None
+            },
+            {name: series[name] for name in PATTERN_INPUTS if name in series},
+            digests,
+        )
+        return indicators.respond(
+            "scan_candlestick_patterns",
+            key,
+            lambda: scan_patterns(indicators, series, patterns, workers),
+        )
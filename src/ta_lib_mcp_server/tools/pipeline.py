@@ -0,0 +1,51 @@
+from typing import Annotated
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..indicator_tools import IndicatorTools
+from ..pipeline import PipelineStep, run_pipeline
+
+
+def register_pipeline(mcp, indicators: IndicatorTools):
+    """Register the indicator pipeline tool with the MCP server."""
+
+    @mcp.tool(
+        title="Run indicator pipeline",
+        description="Run a chain of indicators server-side, feeding the outputs "
+        "of earlier steps into later ones (e.g. RSI of OBV, BBANDS on ATR, MAVP "
+        "with HT_DCPERIOD periods), and return only the requested outputs",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def pipeline(
+        steps: Annotated[
+            list[PipelineStep], Field(description="Steps, run in the given order")
+        ],
+        inputs: Annotated[
+            dict[str, list[float]] | None,
+            Field(description="Named input series, e.g. close and volume"),
+        ] = None,
+        dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset whose columns are inputs"),
+        ] = None,
+        outputs: Annotated[
+            list[str] | None,
+            Field(
+                description="Step outputs to return; defaults to every output of "
+                "the last step"
+            ),
+        ] = None,
+    ):
+        series, digests = indicators.named_series(inputs, dataset)
+        key = indicators.cache.make_key(
+            "pipeline",
+            {"steps": [step.model_dump() for step in steps], "outputs": outputs},
+            series,
+            digests,
+        )
+        return indicators.respond(
+            "pipeline",
+            key,
+            lambda: run_pipeline(indicators, series, steps, outputs),
+        )
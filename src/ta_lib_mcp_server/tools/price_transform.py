@@ -14,22 +14,22 @@ def calculate_avgprice(
     low: Annotated[list[float], Field(description="Low prices")],
     close: Annotated[list[float], Field(description="Close prices")],
 ):
-    open_nparray = np.array(open, dtype=np.float64)
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    open_nparray = np.asarray(open, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.AVGPRICE(open_nparray, high_nparray, low_nparray, close_nparray)
-    return {"avgprice": result.tolist()}
+    return {"avgprice": result}
 
 
 def calculate_medprice(
     high: Annotated[list[float], Field(description="High prices")],
     low: Annotated[list[float], Field(description="Low prices")],
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
     result = talib.MEDPRICE(high_nparray, low_nparray)
-    return {"medprice": result.tolist()}
+    return {"medprice": result}
 
 
 def calculate_typprice(
@@ -37,11 +37,11 @@ def calculate_typprice(
     low: Annotated[list[float], Field(description="Low prices")],
     close: Annotated[list[float], Field(description="Close prices")],
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.TYPPRICE(high_nparray, low_nparray, close_nparray)
-    return {"typprice": result.tolist()}
+    return {"typprice": result}
 
 
 def calculate_wclprice(
@@ -49,11 +49,11 @@ def calculate_wclprice(
     low: Annotated[list[float], Field(description="Low prices")],
     close: Annotated[list[float], Field(description="Close prices")],
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.WCLPRICE(high_nparray, low_nparray, close_nparray)
-    return {"wclprice": result.tolist()}
+    return {"wclprice": result}
 
 
 def register_price_transform(mcp):
@@ -13,10 +13,10 @@ def calculate_beta(
     real1: Annotated[list[float], Field(description="Second real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 5,
 ):
-    real0_nparray = np.array(real0, dtype=np.float64)
-    real1_nparray = np.array(real1, dtype=np.float64)
+    real0_nparray = np.asarray(real0, dtype=np.float64)
+    real1_nparray = np.asarray(real1, dtype=np.float64)
     result = talib.BETA(real0_nparray, real1_nparray, timeperiod)
-    return {"beta": result.tolist()}
+    return {"beta": result}
 
 
 def calculate_correl(
@@ -24,46 +24,46 @@ def calculate_correl(
     real1: Annotated[list[float], Field(description="Second real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 30,
 ):
-    real0_nparray = np.array(real0, dtype=np.float64)
-    real1_nparray = np.array(real1, dtype=np.float64)
+    real0_nparray = np.asarray(real0, dtype=np.float64)
+    real1_nparray = np.asarray(real1, dtype=np.float64)
     result = talib.CORREL(real0_nparray, real1_nparray, timeperiod)
-    return {"correl": result.tolist()}
+    return {"correl": result}
 
 
 def calculate_linearreg(
     real: Annotated[list[float], Field(description="Real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 14,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.LINEARREG(real_nparray, timeperiod)
-    return {"linearreg": result.tolist()}
+    return {"linearreg": result}
 
 
 def calculate_linearreg_angle(
     real: Annotated[list[float], Field(description="Real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 14,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.LINEARREG_ANGLE(real_nparray, timeperiod)
-    return {"linearreg_angle": result.tolist()}
+    return {"linearreg_angle": result}
 
 
 def calculate_linearreg_intercept(
     real: Annotated[list[float], Field(description="Real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 14,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.LINEARREG_INTERCEPT(real_nparray, timeperiod)
-    return {"linearreg_intercept": result.tolist()}
+    return {"linearreg_intercept": result}
 
 
 def calculate_linearreg_slope(
     real: Annotated[list[float], Field(description="Real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 14,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.LINEARREG_SLOPE(real_nparray, timeperiod)
-    return {"linearreg_slope": result.tolist()}
+    return {"linearreg_slope": result}
 
 
 def calculate_stddev(
@@ -71,18 +71,18 @@ def calculate_stddev(
     timeperiod: Annotated[int, Field(description="Time period")] = 5,
     nbdev: Annotated[int, Field(description="Number of deviations")] = 1,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.STDDEV(real_nparray, timeperiod, nbdev)
-    return {"stddev": result.tolist()}
+    return {"stddev": result}
 
 
 def calculate_tsf(
     real: Annotated[list[float], Field(description="Real data series")],
     timeperiod: Annotated[int, Field(description="Time period")] = 14,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.TSF(real_nparray, timeperiod)
-    return {"tsf": result.tolist()}
+    return {"tsf": result}
 
 
 def calculate_var(
@@ -90,9 +90,9 @@ def calculate_var(
     timeperiod: Annotated[int, Field(description="Time period")] = 5,
     nbdev: Annotated[int, Field(description="Number of deviations")] = 1,
 ):
-    real_nparray = np.array(real, dtype=np.float64)
+    real_nparray = np.asarray(real, dtype=np.float64)
     result = talib.VAR(real_nparray, timeperiod, nbdev)
-    return {"var": result.tolist()}
+    return {"var": result}
 
 
 def register_statistic_functions(mcp):
@@ -0,0 +1,102 @@
+from typing import Annotated, Any
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..incremental import STREAM_OBJECTS
+from ..indicator_tools import IndicatorTools
+from ..streams import STREAM_STATES, StreamRegistry
+from ..windows import TalibStreamState
+
+# Functions streamed in O(1), leaving out those needing TA-Lib stream objects
+# when this TA-Lib has none.
+_CONSTANT_TIME = sorted(
+    function
+    for function, state in STREAM_STATES.items()
+    if STREAM_OBJECTS or not issubclass(state, TalibStreamState)
+)
+
+
+def register_streams(mcp, indicators: IndicatorTools):
+    """Register the streaming session tools with the MCP server."""
+    streams = StreamRegistry(indicators)
+
+    @mcp.tool(
+        title="Open stream",
+        description="Open a streaming session of an indicator for live updates "
+        "one or a few bars at a time, optionally starting from the bars of "
+        "inline inputs or a dataset. The server keeps the indicator's state, "
+        "so each update costs O(1) per bar for "
+        + ", ".join(_CONSTANT_TIME)
+        + ". Other indicators whose values depend on a fixed number of past "
+        "bars, such as MOM, ROC or the candlestick patterns, keep those bars "
+        "and are computed on them",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=False),
+    )
+    def open_stream(
+        function: Annotated[str, Field(description="TA-Lib function, e.g. EMA")],
+        params: Annotated[
+            dict[str, Any] | None,
+            Field(description="Parameters of the indicator; default its defaults"),
+        ] = None,
+        inputs: Annotated[
+            dict[str, list[float]] | None,
+            Field(
+                description="Bars to start from, keyed by column: open, high, "
+                "low, close and volume"
+            ),
+        ] = None,
+        dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset whose bars to start from"),
+        ] = None,
+    ):
+        series, _ = indicators.named_series(inputs, dataset)
+        stream = streams.open(function, params, series)
+        return indicators.results.to_content("open_stream", stream.describe())
+
+    @mcp.tool(
+        title="Update stream",
+        description="Append bars to a stream and return the indicator's values "
+        "for them, keyed by output",
+        annotations=ToolAnnotations(readOnlyHint=False, idempotentHint=False),
+    )
+    def update_stream(
+        stream: Annotated[str, Field(description="Identifier of the stream")],
+        bars: Annotated[
+            dict[str, list[float]],
+            Field(
+                description="New bars keyed by the stream's columns, e.g. "
+                '{"close": [101.5]}'
+            ),
+        ],
+    ):
+        opened, values = streams.update(stream, bars)
+        return indicators.results.to_content(
+            "update_stream",
+            {"stream": opened.stream_id, "length": opened.length, **values},
+        )
+
+    @mcp.tool(
+        title="Close stream",
+        description="Close a stream and free its state",
+        annotations=ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+    )
+    def close_stream(
+        stream: Annotated[str, Field(description="Identifier of the stream")],
+    ):
+        return indicators.results.to_content(
+            "close_stream", streams.close(stream).describe()
+        )
+
+    @mcp.tool(
+        title="List streams",
+        description="List the open streams with their functions, parameters, "
+        "lengths and latest values",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def list_streams():
+        return indicators.results.to_content(
+            "list_streams",
+            {"streams": [stream.describe() for stream in streams.list()]},
+        )
@@ -0,0 +1,61 @@
+from typing import Annotated, Any
+
+from mcp.types import ToolAnnotations
+from pydantic import Field
+
+from ..indicator_tools import IndicatorTools
+from ..sweep import run_sweep
+
+
+def register_sweep(mcp, indicators: IndicatorTools):
+    """Register the parameter sweep tool with the MCP server."""
+
+    @mcp.tool(
+        title="Sweep indicator parameters",
+        description="Compute one indicator for every combination of a parameter "
+        "grid, e.g. SMA for timeperiod 5 to 200 or BBANDS over timeperiod and "
+        "nbdevup/nbdevdn. Returns the combinations and one float64 matrix of "
+        "shape [combinations * outputs, bars] as base64 encoded little-endian "
+        "bytes in row-major order; row c * len(outputs) + o is output o of "
+        "combination c, with NaN in the lookback period",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    def sweep(
+        function: Annotated[str, Field(description="TA-Lib function, e.g. SMA")],
+        grid: Annotated[
+            dict[str, list[Any]],
+            Field(
+                description="Values to try for each parameter, e.g. "
+                '{"timeperiod": [10, 20, 50]}; omitted parameters keep their '
+                "defaults"
+            ),
+        ],
+        inputs: Annotated[
+            dict[str, list[float]] | None,
+            Field(description="Named input series: open, high, low, close and volume"),
+        ] = None,
+        dataset: Annotated[
+            str | None,
+            Field(description="Registered dataset whose columns are inputs"),
+        ] = None,
+        outputs: Annotated[
+            list[str] | None,
+            Field(description="Outputs to return, e.g. ['upperband']; default all"),
+        ] = None,
+        workers: Annotated[
+            int,
+            Field(description="Number of threads computing the combinations", ge=1),
+        ] = 1,
+    ):
+        series, digests = indicators.named_series(inputs, dataset)
+        key = indicators.cache.make_key(
+            "sweep",
+            {"function": function.upper(), "grid": grid, "outputs": outputs},
+            series,
+            digests,
+        )
+        return indicators.respond(
+            "sweep",
+            key,
+            lambda: run_sweep(indicators, series, function, grid, outputs, workers),
+        )
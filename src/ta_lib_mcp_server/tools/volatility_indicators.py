@@ -14,12 +14,12 @@ def calculate_atr(
     close: Annotated[list[float], Field(description="List of close prices")],
     timeperiod: Annotated[int, Field(description="Number of periods")] = 14,
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.ATR(high_nparray, low_nparray, close_nparray, timeperiod)
     return {
-        "atr": result.tolist(),
+        "atr": result,
     }
 
 
@@ -29,12 +29,12 @@ def calculate_natr(
     close: Annotated[list[float], Field(description="List of close prices")],
     timeperiod: Annotated[int, Field(description="Number of periods")] = 14,
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.NATR(high_nparray, low_nparray, close_nparray, timeperiod)
     return {
-        "natr": result.tolist(),
+        "natr": result,
     }
 
 
@@ -43,12 +43,12 @@ def calculate_trange(
     low: Annotated[list[float], Field(description="List of low prices")],
     close: Annotated[list[float], Field(description="List of close prices")],
 ):
-    high_nparray = np.array(high, dtype=np.float64)
-    low_nparray = np.array(low, dtype=np.float64)
-    close_nparray = np.array(close, dtype=np.float64)
+    high_nparray = np.asarray(high, dtype=np.float64)
+    low_nparray = np.asarray(low, dtype=np.float64)
+    close_nparray = np.asarray(close, dtype=np.float64)
     result = talib.TRANGE(high_nparray, low_nparray, close_nparray)
     return {
-        "trange": result.tolist(),
+        "trange": result,
     }
 
 
@@ -11,7 +11,7 @@ common_tool_annotations = ToolAnnotations(readOnlyHint=True)
 
 def to_np_array(data):
     """Convert a list of floats to a numpy array of type float64."""
-    return np.array(data, dtype=np.float64)
+    return np.asarray(data, dtype=np.float64)
 
 
 def calculate_ad(
@@ -25,7 +25,7 @@ def calculate_ad(
     close_nparray = to_np_array(close)
     volume_nparray = to_np_array(volume)
     result = talib.AD(high_nparray, low_nparray, close_nparray, volume_nparray)
-    return {"ad": result.tolist()}
+    return {"ad": result}
 
 
 def calculate_adosc(
@@ -48,7 +48,7 @@ def calculate_adosc(
         fastperiod,
         slowperiod,
     )
-    return {"adosc": result.tolist()}
+    return {"adosc": result}
 
 
 def calculate_obv(
@@ -58,7 +58,7 @@ def calculate_obv(
     close_nparray = to_np_array(close)
     volume_nparray = to_np_array(volume)
     result = talib.OBV(close_nparray, volume_nparray)
-    return {"obv": result.tolist()}
+    return {"obv": result}
 
 
 def register_volume_indicators(mcp):
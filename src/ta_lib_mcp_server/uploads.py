@@ -0,0 +1,150 @@
+import base64
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .datasets import Dataset, DatasetRegistry
+
+DEFAULT_MAX_UPLOADS = 16
+
+
+@dataclass
+class Upload:
+    """A dataset being received in chunks into preallocated columns."""
+
+    upload_id: str
+    name: str
+    length: int
+    columns: dict[str, np.ndarray]
+    # Which values of each column have been received so far.
+    received: dict[str, np.ndarray]
+    staging: Path | None = None
+
+    def missing(self) -> dict[str, int]:
+        return {
+            column: int(self.length - np.count_nonzero(mask))
+            for column, mask in self.received.items()
+            if not mask.all()
+        }
+
+    def describe(self) -> dict:
+        return {
+            "upload_id": self.upload_id,
+            "dataset": self.name,
+            "length": self.length,
+            "columns": sorted(self.columns),
+            "missing": self.missing(),
+        }
+
+
+class UploadManager:
+    """Multi-part uploads of datasets too large for a single message.
+
+    ``begin`` preallocates the columns, in the dataset store's staging area when
+    datasets are stored on disk, so chunks are written straight into their final
+    place. Chunks may arrive in any order and concurrently. ``commit`` registers
+    the dataset once every value has been received.
+    """
+
+    def __init__(
+        self, datasets: DatasetRegistry, max_uploads: int = DEFAULT_MAX_UPLOADS
+    ):
+        self.datasets = datasets
+        self.max_uploads = max_uploads
+        self._uploads: dict[str, Upload] = {}
+        self._lock = threading.Lock()
+
+    def begin(self, name: str, columns: list[str], length: int) -> Upload:
+        self.datasets.check_names(name, columns)
+        if length <= 0:
+            raise ValueError("An upload needs a positive length")
+        if len(set(columns)) != len(columns):
+            raise ValueError("Column names must be unique")
+        with self._lock:
+            if len(self._uploads) >= self.max_uploads:
+                raise ValueError(
+                    f"Too many uploads in progress ({self.max_uploads}); "
+                    "commit or abort one first"
+                )
+            staging = None
+            if self.datasets.store is not None:
+                staging, arrays = self.datasets.store.allocate(columns, length)
+            else:
+                arrays = {column: np.empty(length) for column in columns}
+            upload = Upload(
+                uuid.uuid4().hex,
+                name,
+                length,
+                arrays,
+                {column: np.zeros(length, dtype=bool) for column in columns},
+                staging,
+            )
+            self._uploads[upload.upload_id] = upload
+        return upload
+
+    def write(
+        self,
+        upload_id: str,
+        column: str,
+        offset: int,
+        values: list[float] | None = None,
+        data: str | None = None,
+    ) -> Upload:
+        """Write one chunk given as a list of values or base64 float64 bytes."""
+        if (values is None) == (data is None):
+            raise ValueError("Pass exactly one of values and data")
+        if data is not None:
+            try:
+                chunk = np.frombuffer(base64.b64decode(data, validate=True), "<f8")
+            except ValueError as error:
+                raise ValueError(
+                    f"data must be base64 encoded little-endian float64 values: {error}"
+                ) from None
+        else:
+            chunk = np.asarray(values, dtype=np.float64)
+        upload = self._get(upload_id)
+        if column not in upload.columns:
+            raise ValueError(
+                f"Upload has no column {column!r}; columns: {sorted(upload.columns)}"
+            )
+        if offset < 0 or offset + len(chunk) > upload.length:
+            raise ValueError(
+                f"Chunk of {len(chunk)} values at offset {offset} exceeds the "
+                f"upload length {upload.length}"
+            )
+        upload.columns[column][offset : offset + len(chunk)] = chunk
+        upload.received[column][offset : offset + len(chunk)] = True
+        return upload
+
+    def commit(self, upload_id: str) -> Dataset:
+        upload = self._get(upload_id)
+        missing = upload.missing()
+        if missing:
+            raise ValueError(f"Upload is incomplete; values missing: {missing}")
+        with self._lock:
+            if self._uploads.pop(upload_id, None) is None:
+                raise ValueError(f"Unknown upload: {upload_id!r}")
+        if upload.staging is None:
+            return self.datasets.register(upload.name, upload.columns)
+        for values in upload.columns.values():
+            values.flush()
+        return self.datasets.install(upload.name, upload.staging)
+
+    def abort(self, upload_id: str) -> Upload:
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+        if upload is None:
+            raise ValueError(f"Unknown upload: {upload_id!r}")
+        if upload.staging is not None:
+            self.datasets.store.discard(upload.staging)
+        return upload
+
+    def _get(self, upload_id: str) -> Upload:
+        with self._lock:
+            try:
+                return self._uploads[upload_id]
+            except KeyError:
+                raise ValueError(f"Unknown upload: {upload_id!r}") from None
@@ -0,0 +1,510 @@
+import collections
+import math
+from typing import Any
+
+import numpy as np
+import talib
+from talib import MA_Type, stream
+
+from .incremental import (
+    RECURSIVE_STATES,
+    STREAM_OBJECTS,
+    RecursiveState,
+    RSIState,
+    _is_zero,
+    lookback,
+    talib_parameters,
+)
+from .tools.types import MA_TYPE_MAP
+
+
+def _ma_type(value: str | int) -> int:
+    return MA_TYPE_MAP[value] if isinstance(value, str) else value
+
+
+class _Extreme:
+    """Highest (or lowest) value over the last ``size`` bars, with its position.
+
+    A monotonic deque: each bar is pushed and popped at most once, so updates
+    cost amortized O(1) whatever the window. Of equal values the latest is
+    kept, as TA-Lib does when it tracks the position of an extreme.
+    """
+
+    def __init__(self, size: int, highest: bool):
+        self.size = size
+        self.sign = 1.0 if highest else -1.0
+        self.bars: collections.deque[tuple[int, float]] = collections.deque()
+
+    def push(self, index: int, value: float) -> tuple[int, float]:
+        bars = self.bars
+        key = self.sign * value
+        while bars and self.sign * bars[-1][1] <= key:
+            bars.pop()
+        bars.append((index, value))
+        if bars[0][0] <= index - self.size:
+            bars.popleft()
+        return bars[0]
+
+
+class WindowState(RecursiveState):
+    """Resumable state of a rolling-window TA-Lib indicator.
+
+    TA-Lib computes these indicators from the extremes of each window, or
+    with running sums carried from the first bar. The states keep monotonic
+    deques of the extremes, or the same running sums and a ring buffer of the
+    window's bars, so each appended bar costs O(1) or amortized O(1) whatever
+    the window length. The history is replayed once to rebuild the sums
+    exactly.
+    """
+
+    # Default parameters, which TA-Lib also applies to omitted ones.
+    defaults: dict[str, Any] = {}
+
+    def __init__(self, params: dict[str, Any]):
+        raise NotImplementedError
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        params = {**cls.defaults, **params}
+        length = len(next(iter(inputs.values())))
+        if not cls.supports(params) or length <= lookback(cls.function, params):
+            return None
+        state = cls(params)
+        state.extend(inputs)
+        return state
+
+    @classmethod
+    def supports(cls, params: dict[str, Any]) -> bool:
+        """Return whether the state reproduces TA-Lib with these parameters."""
+        return params.get("timeperiod", 2) >= 2
+
+    def step(self, *bar: float) -> tuple[float, ...]:
+        """Advance over one bar and return its output values, NaN until ready."""
+        raise NotImplementedError
+
+    def extend(self, inputs):
+        columns = [inputs[name].tolist() for name in self.inputs]
+        values = [self.step(*bar) for bar in zip(*columns, strict=True)]
+        if not values:
+            return tuple(np.empty(0) for _ in self.outputs)
+        return tuple(np.array(output) for output in zip(*values, strict=True))
+
+
+class SMAState(WindowState):
+    function = "SMA"
+    inputs = ("real",)
+    outputs = ("sma",)
+    defaults = {"timeperiod": 30}
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, params):
+        self.timeperiod = params["timeperiod"]
+        self.window = collections.deque(maxlen=self.timeperiod)
+        self.total = 0.0
+
+    def average(self, price: float) -> float:
+        self.window.append(price)
+        self.total += price
+        if len(self.window) < self.timeperiod:
+            return math.nan
+        value = self.total / self.timeperiod
+        self.total -= self.window[0]
+        return value
+
+    def step(self, price):
+        return (self.average(price),)
+
+
+class TRIMAState(WindowState):
+    function = "TRIMA"
+    inputs = ("real",)
+    outputs = ("trima",)
+    defaults = {"timeperiod": 30}
+    calibration_params = ({"timeperiod": 2}, {"timeperiod": 9})
+
+    def __init__(self, params):
+        self.timeperiod = params["timeperiod"]
+        half = self.timeperiod >> 1
+        self.odd = self.timeperiod % 2 == 1
+        self.factor = 1.0 / ((half + 1) * (half + 1) if self.odd else half * (half + 1))
+        # The bar entering the falling half of the weights, counted from the
+        # bar leaving the window.
+        self.middle = self.timeperiod - half
+        # The window, and the bar that just left it.
+        self.window = collections.deque(maxlen=self.timeperiod + 1)
+        self.numerator = self.falling = self.rising = 0.0
+        self.ready = False
+
+    def step(self, price):
+        self.window.append(price)
+        if not self.ready:
+            if len(self.window) < self.timeperiod:
+                return (math.nan,)
+            self.ready = True
+            window = list(self.window)
+            for value in reversed(window[: self.middle]):
+                self.falling += value
+                self.numerator += self.falling
+            for value in window[self.middle :]:
+                self.rising += value
+                self.numerator += self.rising
+            return (self.numerator * self.factor,)
+        middle = self.window[self.middle]
+        self.numerator -= self.falling
+        self.falling -= self.window[0]
+        self.falling += middle
+        if self.odd:
+            self.numerator += self.rising
+            self.rising -= middle
+        else:
+            self.rising -= middle
+            self.numerator += self.rising
+        self.rising += price
+        self.numerator += price
+        return (self.numerator * self.factor,)
+
+
+class MIDPOINTState(WindowState):
+    function = "MIDPOINT"
+    inputs = ("real",)
+    outputs = ("midpoint",)
+    defaults = {"timeperiod": 14}
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, params):
+        self.timeperiod = params["timeperiod"]
+        self.index = 0
+        self.highest = _Extreme(self.timeperiod, highest=True)
+        self.lowest = _Extreme(self.timeperiod, highest=False)
+
+    def step(self, price):
+        index = self.index
+        self.index += 1
+        _, highest = self.highest.push(index, price)
+        _, lowest = self.lowest.push(index, price)
+        if self.index < self.timeperiod:
+            return (math.nan,)
+        return ((highest + lowest) / 2.0,)
+
+
+class MIDPRICEState(MIDPOINTState):
+    function = "MIDPRICE"
+    inputs = ("high", "low")
+    outputs = ("midprice",)
+
+    def step(self, high, low):
+        index = self.index
+        self.index += 1
+        _, highest = self.highest.push(index, high)
+        _, lowest = self.lowest.push(index, low)
+        if self.index < self.timeperiod:
+            return (math.nan,)
+        return ((highest + lowest) / 2.0,)
+
+
+class WILLRState(MIDPOINTState):
+    function = "WILLR"
+    inputs = ("high", "low", "close")
+    outputs = ("willr",)
+
+    def step(self, high, low, close):
+        index = self.index
+        self.index += 1
+        _, highest = self.highest.push(index, high)
+        _, lowest = self.lowest.push(index, low)
+        if self.index < self.timeperiod:
+            return (math.nan,)
+        spread = highest - lowest
+        return ((highest - close) / spread * -100.0 if spread != 0.0 else 0.0,)
+
+
+class AROONState(WindowState):
+    function = "AROON"
+    inputs = ("high", "low")
+    outputs = ("aroondown", "aroonup")
+    defaults = {"timeperiod": 14}
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, params):
+        self.timeperiod = params["timeperiod"]
+        self.factor = 100.0 / self.timeperiod
+        self.index = 0
+        # The window spans the current bar and timeperiod bars before it.
+        self.highest = _Extreme(self.timeperiod + 1, highest=True)
+        self.lowest = _Extreme(self.timeperiod + 1, highest=False)
+
+    def positions(self, high: float, low: float) -> tuple[int, int] | None:
+        """Return how many bars ago the window's low and high were."""
+        index = self.index
+        self.index += 1
+        highest, _ = self.highest.push(index, high)
+        lowest, _ = self.lowest.push(index, low)
+        if index < self.timeperiod:
+            return None
+        return index - lowest, index - highest
+
+    def step(self, high, low):
+        ages = self.positions(high, low)
+        if ages is None:
+            return (math.nan, math.nan)
+        return tuple(self.factor * (self.timeperiod - age) for age in ages)
+
+
+class AROONOSCState(AROONState):
+    function = "AROONOSC"
+    outputs = ("aroonosc",)
+
+    def step(self, high, low):
+        ages = self.positions(high, low)
+        if ages is None:
+            return (math.nan,)
+        since_low, since_high = ages
+        return (self.factor * (since_low - since_high),)
+
+
+class STOCHFState(WindowState):
+    function = "STOCHF"
+    inputs = ("high", "low", "close")
+    outputs = ("fastk", "fastd")
+    defaults = {"fastk_period": 5, "fastd_period": 3, "fastd_matype": MA_Type.SMA}
+    calibration_params = ({"fastk_period": 1, "fastd_period": 1},)
+
+    def __init__(self, params):
+        self.fastk_period = params["fastk_period"]
+        self.index = 0
+        self.highest = _Extreme(self.fastk_period, highest=True)
+        self.lowest = _Extreme(self.fastk_period, highest=False)
+        self.fastd = SMAState({"timeperiod": params["fastd_period"]})
+
+    @classmethod
+    def supports(cls, params):
+        return all(
+            _ma_type(value) == MA_Type.SMA
+            for name, value in params.items()
+            if name.endswith("_matype")
+        )
+
+    def fastk(self, high: float, low: float, close: float) -> float:
+        index = self.index
+        self.index += 1
+        _, highest = self.highest.push(index, high)
+        _, lowest = self.lowest.push(index, low)
+        if self.index < self.fastk_period:
+            return math.nan
+        spread = highest - lowest
+        return 0.0 if _is_zero(spread) else (close - lowest) / spread * 100.0
+
+    def step(self, high, low, close):
+        # TA-Lib omits %K values before the first %D.
+        fastk = self.fastk(high, low, close)
+        if math.isnan(fastk):
+            return (math.nan, math.nan)
+        fastd = self.fastd.average(fastk)
+        if math.isnan(fastd):
+            return (math.nan, math.nan)
+        return fastk, fastd
+
+
+class STOCHState(STOCHFState):
+    function = "STOCH"
+    outputs = ("slowk", "slowd")
+    defaults = {
+        "fastk_period": 5,
+        "slowk_period": 3,
+        "slowk_matype": MA_Type.SMA,
+        "slowd_period": 3,
+        "slowd_matype": MA_Type.SMA,
+    }
+    calibration_params = (
+        {"fastk_period": 1, "slowk_period": 1, "slowd_period": 1},
+        {"fastk_period": 14, "slowk_period": 5, "slowd_period": 2},
+    )
+
+    def __init__(self, params):
+        self.fastk_period = params["fastk_period"]
+        self.index = 0
+        self.highest = _Extreme(self.fastk_period, highest=True)
+        self.lowest = _Extreme(self.fastk_period, highest=False)
+        self.slowk = SMAState({"timeperiod": params["slowk_period"]})
+        self.slowd = SMAState({"timeperiod": params["slowd_period"]})
+
+    def step(self, high, low, close):
+        fastk = self.fastk(high, low, close)
+        if math.isnan(fastk):
+            return (math.nan, math.nan)
+        slowk = self.slowk.average(fastk)
+        if math.isnan(slowk):
+            return (math.nan, math.nan)
+        slowd = self.slowd.average(slowk)
+        if math.isnan(slowd):
+            return (math.nan, math.nan)
+        return slowk, slowd
+
+
+class STOCHRSIState(STOCHFState):
+    function = "STOCHRSI"
+    inputs = ("real",)
+    defaults = {
+        "timeperiod": 14,
+        "fastk_period": 5,
+        "fastd_period": 3,
+        "fastd_matype": MA_Type.SMA,
+    }
+    calibration_params = ({"timeperiod": 5, "fastk_period": 3, "fastd_period": 1},)
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.timeperiod = params["timeperiod"]
+        self.rsi: RSIState | None = None
+        self.bars: list[float] = []
+
+    @classmethod
+    def supports(cls, params):
+        return params["timeperiod"] >= 2 and super().supports(params)
+
+    def step(self, price):
+        # TA-Lib applies STOCHF to the RSI from its first value on.
+        if self.rsi is None:
+            self.bars.append(price)
+            if len(self.bars) <= self.timeperiod:
+                return (math.nan, math.nan)
+            real = np.array(self.bars)
+            self.rsi = RSIState.from_history(
+                {"real": real}, {"timeperiod": self.timeperiod}, ()
+            )
+            self.bars = []
+            (rsi,) = talib.RSI(real, self.timeperiod)[-1:]
+        else:
+            ((rsi,),) = self.rsi.extend({"real": np.array([price])})
+        return super().step(rsi, rsi, rsi)
+
+
+class TalibStreamState(WindowState):
+    """State held by a stream object of TA-Lib's own streaming API.
+
+    This TA-Lib build computes these indicators with running sums whose
+    rounding a Python replay does not reproduce, and its stream objects carry
+    the same sums. Opening one replays the history once in C, and each update
+    then advances the sums in O(1). TA-Lib releases without stream objects
+    leave these indicators to be recomputed.
+    """
+
+    calibration_params = ({"timeperiod": 2},)
+
+    def __init__(self, opened):
+        self.stream = opened
+
+    @classmethod
+    def calibrated(cls) -> bool:
+        return STREAM_OBJECTS and super().calibrated()
+
+    @classmethod
+    def from_history(cls, inputs, params, outputs):
+        try:
+            opened = getattr(stream, cls.function)(
+                *(inputs[name] for name in cls.inputs),
+                **talib_parameters(cls.function, params),
+            )
+        except talib.InsufficientHistory:
+            return None
+        return cls(opened)
+
+    def __deepcopy__(self, memo):
+        return type(self)(self.stream.copy())
+
+    def step(self, *bar):
+        return (self.stream.update(*bar),)
+
+
+class CCIState(TalibStreamState):
+    function = "CCI"
+    inputs = ("high", "low", "close")
+    outputs = ("cci",)
+
+
+class WMAState(TalibStreamState):
+    function = "WMA"
+    inputs = ("real",)
+    outputs = ("wma",)
+
+
+class VARState(TalibStreamState):
+    function = "VAR"
+    inputs = ("real",)
+    outputs = ("var",)
+    calibration_params = ({"timeperiod": 1}, {"timeperiod": 20, "nbdev": 2.0})
+
+
+class STDDEVState(VARState):
+    function = "STDDEV"
+    outputs = ("stddev",)
+    calibration_params = ({"timeperiod": 2}, {"timeperiod": 20, "nbdev": 2.0})
+
+
+class LINEARREGState(TalibStreamState):
+    function = "LINEARREG"
+    inputs = ("real",)
+    outputs = ("linearreg",)
+
+
+class LINEARREG_ANGLEState(LINEARREGState):
+    function = "LINEARREG_ANGLE"
+    outputs = ("linearreg_angle",)
+
+
+class LINEARREG_INTERCEPTState(LINEARREGState):
+    function = "LINEARREG_INTERCEPT"
+    outputs = ("linearreg_intercept",)
+
+
+class LINEARREG_SLOPEState(LINEARREGState):
+    function = "LINEARREG_SLOPE"
+    outputs = ("linearreg_slope",)
+
+
+class TSFState(LINEARREGState):
+    function = "TSF"
+    outputs = ("tsf",)
+
+
+class CORRELState(TalibStreamState):
+    function = "CORREL"
+    inputs = ("real0", "real1")
+    outputs = ("correl",)
+
+
+class BETAState(CORRELState):
+    function = "BETA"
+    outputs = ("beta",)
+    calibration_params = ({"timeperiod": 1}, {"timeperiod": 14})
+
+
+WINDOW_STATES: dict[str, type[WindowState]] = {
+    state.function: state
+    for state in (
+        SMAState,
+        TRIMAState,
+        MIDPOINTState,
+        MIDPRICEState,
+        WILLRState,
+        AROONState,
+        AROONOSCState,
+        STOCHFState,
+        STOCHState,
+        STOCHRSIState,
+        CCIState,
+        WMAState,
+        VARState,
+        STDDEVState,
+        LINEARREGState,
+        LINEARREG_ANGLEState,
+        LINEARREG_INTERCEPTState,
+        LINEARREG_SLOPEState,
+        TSFState,
+        CORRELState,
+        BETAState,
+    )
+}
+
+# State classes of every indicator that can be resumed, by function.
+STATES: dict[str, type[RecursiveState]] = {**RECURSIVE_STATES, **WINDOW_STATES}
@@ -0,0 +1,213 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server import alignment
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools.correlation import register_correlation
+from src.ta_lib_mcp_server.tools.statistic_functions import (
+    register_statistic_functions,
+)
+
+
+def make_server():
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache(), DatasetRegistry())
+    register_statistic_functions(indicators)
+    register_correlation(mcp, indicators)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestAlignment:
+    """Tests for joining series on their timestamps."""
+
+    left = ([1, 2, 4, 5, 7], np.array([10.0, 20.0, 40.0, 50.0, 70.0]))
+    right = ([2, 3, 4, 7, 8], np.array([0.2, 0.3, 0.4, 0.7, 0.8]))
+
+    def test_joins(self):
+        """Inner, outer and ffill joins keep the expected timestamps and values."""
+        joined, (left, right) = alignment.align([self.left, self.right], "inner")
+        np.testing.assert_array_equal(joined, [2, 4, 7])
+        np.testing.assert_array_equal(left, [20.0, 40.0, 70.0])
+        np.testing.assert_array_equal(right, [0.2, 0.4, 0.7])
+
+        joined, (left, right) = alignment.align([self.left, self.right], "outer")
+        np.testing.assert_array_equal(joined, [1, 2, 3, 4, 5, 7, 8])
+        np.testing.assert_array_equal(
+            left, [10.0, 20.0, np.nan, 40.0, 50.0, 70.0, np.nan]
+        )
+        np.testing.assert_array_equal(right, [np.nan, 0.2, 0.3, 0.4, np.nan, 0.7, 0.8])
+
+        joined, (left, right) = alignment.align([self.left, self.right], "ffill")
+        np.testing.assert_array_equal(joined, [2, 3, 4, 5, 7, 8])
+        np.testing.assert_array_equal(left, [20.0, 20.0, 40.0, 50.0, 70.0, 70.0])
+        np.testing.assert_array_equal(right, [0.2, 0.3, 0.4, 0.4, 0.7, 0.8])
+
+        empty = ([], np.array([]))
+        for how in alignment.JOINS:
+            joined, aligned = alignment.align([self.left, empty], how)
+            assert len(joined) == (5 if how == "outer" else 0)
+            assert all(len(values) == len(joined) for values in aligned)
+
+    def test_statistics_on_timestamped_series(self):
+        """Statistic tools join their inputs before computing."""
+        mcp = make_server()
+        rng = np.random.default_rng(5)
+        stamps = np.arange(300) * 60
+        first = np.sort(rng.choice(stamps, 250, replace=False))
+        second = np.sort(rng.choice(stamps, 250, replace=False))
+        prices = 100 + np.cumsum(rng.normal(size=(2, 300)), axis=1)
+        real0 = prices[0][np.searchsorted(stamps, first)]
+        real1 = prices[1][np.searchsorted(stamps, second)]
+        result = call(
+            mcp,
+            "_calculate_correl",
+            {
+                "real0": real0.tolist(),
+                "real1": real1.tolist(),
+                "timestamps": {"real0": first.tolist(), "real1": second.tolist()},
+                "timeperiod": 10,
+            },
+        )
+        common = np.intersect1d(first, second)
+        np.testing.assert_array_equal(result["timestamp"], common)
+        index = np.searchsorted(stamps, common)
+        np.testing.assert_array_equal(
+            as_array(result["correl"]),
+            talib.CORREL(prices[0][index], prices[1][index], 10),
+        )
+
+        result = call(
+            mcp,
+            "_calculate_beta",
+            {
+                "real0": real0.tolist(),
+                "real1": real1.tolist(),
+                "timestamps": {"real0": first.tolist(), "real1": second.tolist()},
+                "join": "ffill",
+            },
+        )
+        joined, (benchmark, symbol) = alignment.align(
+            [(first, real0), (second, real1)], "ffill"
+        )
+        np.testing.assert_array_equal(result["timestamp"], joined)
+        np.testing.assert_array_equal(
+            as_array(result["beta"]), talib.BETA(benchmark, symbol)
+        )
+
+    def test_panels_on_timestamped_series(self):
+        """Panel tools join their rows, and the benchmark, on timestamps."""
+        mcp = make_server()
+        rng = np.random.default_rng(9)
+        rows = [100 + np.cumsum(rng.normal(size=n)) for n in (80, 90, 100)]
+        timestamps = [np.arange(100 - len(row), 100) * 10 for row in rows]
+        result = call(
+            mcp,
+            "correlation_matrix",
+            {
+                "real": [row.tolist() for row in rows],
+                "timestamps": [stamps.tolist() for stamps in timestamps],
+                "timeperiod": 20,
+            },
+        )
+        assert result["timestamp"] == 990
+        tails = [row[-80:] for row in rows]
+        assert result["matrix"][0][2] == pytest.approx(
+            talib.CORREL(tails[0], tails[2], 20)[-1], abs=1e-9
+        )
+
+        result = call(
+            mcp,
+            "beta_panel",
+            {
+                "real": [row.tolist() for row in rows[:2]],
+                "timestamps": [stamps.tolist() for stamps in timestamps[:2]],
+                "benchmark": rows[2].tolist(),
+                "benchmark_timestamps": timestamps[2].tolist(),
+                "rolling": True,
+            },
+        )
+        assert result["timestamp"] == timestamps[0].tolist()
+        np.testing.assert_array_equal(
+            as_array(result["beta"][1]), talib.BETA(rows[2][-80:], rows[1][-80:])
+        )
+
+    def test_invalid_requests(self):
+        """Bad timestamps, mixed sources and outer-joined panels are errors."""
+        mcp = make_server()
+        real = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        stamps = [1, 2, 3, 4, 5, 6]
+        for name, arguments in (
+            ("_calculate_correl", {"real0": real, "real1": real, "join": "outer"}),
+            (
+                "_calculate_correl",
+                {"real0": real, "real1": real, "timestamps": {"real0": stamps}},
+            ),
+            (
+                "_calculate_correl",
+                {
+                    "real0": real,
+                    "real1": real,
+                    "timestamps": {"real0": stamps, "real1": stamps[::-1]},
+                },
+            ),
+            (
+                "_calculate_correl",
+                {
+                    "real0": real,
+                    "real1": real,
+                    "timestamps": {"real0": stamps, "real1": stamps[:-1]},
+                },
+            ),
+            (
+                "_calculate_correl",
+                {
+                    "real0": real,
+                    "real1": real,
+                    "offsets": [0, 6],
+                    "timestamps": {"real0": stamps, "real1": stamps},
+                },
+            ),
+            (
+                "beta_panel",
+                {"real": [real], "benchmark": real, "timestamps": [stamps]},
+            ),
+            (
+                "correlation_matrix",
+                {
+                    "real": [real, real[1:]],
+                    "timestamps": [stamps, stamps[2:] + [7]],
+                    "timeperiod": 2,
+                    "join": "outer",
+                },
+            ),
+            (
+                "beta_panel",
+                {
+                    "real": [real],
+                    "benchmark": real[1:],
+                    "timestamps": [stamps],
+                    "benchmark_timestamps": stamps[2:] + [7],
+                    "join": "outer",
+                },
+            ),
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, name, arguments)
@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.bar_store import BarStore
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import overlap_studies
+from src.ta_lib_mcp_server.tools.bar_management import register_bar_management
+
+
+def make_server(bars):
+    mcp = FastMCP("test")
+    overlap_studies.register_overlap_studies(
+        IndicatorTools(mcp, ResultStore(), ResultCache(), bars=bars)
+    )
+    register_bar_management(mcp, bars)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestBarStore:
+    """Tests for the time-indexed OHLCV bar database."""
+
+    timestamps = list(range(1000, 1100, 2))
+    close = [100.0 + (index % 7) - index / 10 for index in range(50)]
+
+    def test_write_merges_by_timestamp(self, tmp_path):
+        """Writes are merged in timestamp order, later bars replacing earlier."""
+        store = BarStore(str(tmp_path / "bars.db"))
+        store.write("AAPL", [30, 10], {"close": [3.0, 1.0]})
+        store.write("AAPL", [20, 30], {"close": [2.0, 4.0]})
+        bars = BarStore(str(tmp_path / "bars.db")).get("AAPL")
+        np.testing.assert_array_equal(bars.timestamps, [10, 20, 30])
+        np.testing.assert_array_equal(bars.column("close"), [1.0, 2.0, 4.0])
+        with pytest.raises(ValueError, match="must have the columns"):
+            store.write("AAPL", [40], {"open": [1.0]})
+
+    def test_window(self, tmp_path):
+        """Ranges are located by binary search and extended by the warmup."""
+        store = BarStore(str(tmp_path / "bars.db"))
+        bars = store.write("AAPL", self.timestamps, {"close": self.close})
+        assert bars.window(1010, 1020, warmup=3) == (2, 5, 11)
+        assert bars.window(1009, 1021, warmup=10) == (0, 5, 11)
+        assert bars.window(None, None) == (0, 0, 50)
+        with pytest.raises(ValueError, match="no bars"):
+            bars.window(2000, None)
+
+    def test_indicator_on_range(self, tmp_path):
+        """An indicator on a range matches the full series with warmup bars."""
+        mcp = make_server(BarStore(str(tmp_path / "bars.db")))
+        call(
+            mcp,
+            "store_bars",
+            {
+                "symbol": "AAPL",
+                "timestamps": self.timestamps,
+                "columns": {"close": self.close},
+            },
+        )
+        result = call(
+            mcp,
+            "_sma",
+            {"symbol": "AAPL", "start": 1040, "end": 1060, "timeperiod": 5},
+        )
+        assert result["timestamp"] == list(range(1040, 1061, 2))
+        expected = talib.SMA(np.array(self.close), 5)[20:31]
+        np.testing.assert_allclose(result["sma"], expected)
+
+        # Recursive indicators start from the first bar, not the warmup.
+        for name, function in (("_ema", talib.EMA), ("_kama", talib.KAMA)):
+            result = call(
+                mcp,
+                name,
+                {"symbol": "AAPL", "start": 1040, "end": 1060, "timeperiod": 5},
+            )
+            expected = function(np.array(self.close), 5)[20:31]
+            np.testing.assert_array_equal(result[name[1:]], expected)
+
+    def test_range_equals_full_history(self, tmp_path):
+        """Running sums start from the first bar, windows read their lookback."""
+        mcp = make_server(BarStore(str(tmp_path / "bars.db")))
+        rng = np.random.default_rng(5)
+        close = 100 + np.cumsum(rng.normal(size=3000))
+        call(
+            mcp,
+            "store_bars",
+            {
+                "symbol": "AAPL",
+                "timestamps": list(range(3000)),
+                "columns": {"close": close.tolist()},
+            },
+        )
+        for name, function in (
+            ("_sma", talib.SMA),
+            ("_wma", talib.WMA),
+            ("_trima", talib.TRIMA),
+            ("_midpoint", talib.MIDPOINT),
+        ):
+            result = call(
+                mcp,
+                name,
+                {"symbol": "AAPL", "start": 2500, "end": 2999, "timeperiod": 30},
+            )
+            np.testing.assert_array_equal(
+                result[name[1:]], function(close, 30)[2500:], err_msg=name
+            )
+
+    def test_errors(self, tmp_path):
+        """Symbols need a database and cannot be mixed with inline series."""
+        mcp = make_server(BarStore(str(tmp_path / "bars.db")))
+        with pytest.raises(ToolError, match="Unknown symbol"):
+            call(mcp, "_sma", {"symbol": "MSFT"})
+        no_database = FastMCP("test")
+        overlap_studies.register_overlap_studies(
+            IndicatorTools(no_database, ResultStore(), ResultCache())
+        )
+        with pytest.raises(ToolError, match="--db-path"):
+            call(no_database, "_sma", {"symbol": "AAPL"})
+        with pytest.raises(ToolError, match="symbol"):
+            call(no_database, "_sma", {"real": self.close, "start": 1000})
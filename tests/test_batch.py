@@ -0,0 +1,156 @@
+import asyncio
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import (
+    momentum_indicators,
+    overlap_studies,
+    volatility_indicators,
+)
+from src.ta_lib_mcp_server.tools.batch import register_batch
+
+
+def make_server():
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache())
+    overlap_studies.register_overlap_studies(indicators)
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    register_batch(mcp, indicators)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestBatchCompute:
+    """Tests for computing several indicators in one request."""
+
+    rng = np.random.default_rng(5)
+    close = 100 + np.cumsum(rng.normal(size=300))
+    high = close + rng.random(300)
+    low = close - rng.random(300)
+    inputs = {"close": close.tolist(), "high": high.tolist(), "low": low.tolist()}
+
+    def test_matches_separate_calls(self):
+        """Shared and derived results are identical to direct TA-Lib calls."""
+        specs = [
+            {"function": "RSI", "params": {"timeperiod": 14}},
+            {"function": "MACD", "params": {"fastperiod": 12, "slowperiod": 26}},
+            {"function": "EMA", "params": {"timeperiod": 26}},
+            {"function": "ADX"},
+            {"function": "ADXR", "params": {"timeperiod": 10}},
+            {"function": "PLUS_DI"},
+            {"function": "MINUS_DI"},
+            {"function": "DX"},
+            {"function": "ATR"},
+            {"function": "NATR"},
+            {"function": "APO", "params": {"matype": "EMA"}, "name": "apo"},
+            {"function": "PPO", "params": {"slowperiod": 5, "fastperiod": 20}},
+        ]
+        result = call(
+            make_server(), "batch_compute", {"inputs": self.inputs, "specs": specs}
+        )
+        h, lo, c = self.high, self.low, self.close
+        macd, signal, hist = talib.MACD(c, 12, 26, 9)
+        expected = {
+            "rsi_14": talib.RSI(c, 14),
+            "macd_12_26.macd": macd,
+            "macd_12_26.macdsignal": signal,
+            "macd_12_26.macdhist": hist,
+            "ema_26": talib.EMA(c, 26),
+            "adx": talib.ADX(h, lo, c),
+            "adxr_10": talib.ADXR(h, lo, c, 10),
+            "plus_di": talib.PLUS_DI(h, lo, c),
+            "minus_di": talib.MINUS_DI(h, lo, c),
+            "dx": talib.DX(h, lo, c),
+            "atr": talib.ATR(h, lo, c),
+            "natr": talib.NATR(h, lo, c),
+            "apo": talib.APO(c, 12, 26, talib.MA_Type.EMA),
+            "ppo_5_20": talib.PPO(c, 20, 5, talib.MA_Type.SMA),
+        }
+        assert set(result) == set(expected)
+        for name, values in expected.items():
+            np.testing.assert_array_equal(as_array(result[name]), values, err_msg=name)
+
+    def test_intermediates_are_shared(self):
+        """Derived indicators do not call their own TA-Lib functions."""
+        specs = [
+            {"function": "ATR"},
+            {"function": "NATR"},
+            {"function": "ADX"},
+            {"function": "ADXR"},
+            {"function": "MACD"},
+            {"function": "PPO", "params": {"matype": "EMA"}},
+        ]
+        with (
+            mock.patch.object(talib, "NATR", side_effect=AssertionError),
+            mock.patch.object(talib, "ADXR", side_effect=AssertionError),
+            mock.patch.object(talib, "MACD", side_effect=AssertionError),
+            mock.patch.object(talib, "PPO", side_effect=AssertionError),
+        ):
+            result = call(
+                make_server(), "batch_compute", {"inputs": self.inputs, "specs": specs}
+            )
+        assert sorted(result) == [
+            "adx",
+            "adxr",
+            "atr",
+            "macd.macd",
+            "macd.macdhist",
+            "macd.macdsignal",
+            "natr",
+            "ppo_EMA",
+        ]
+
+    def test_short_series(self):
+        """Derived indicators of series too short for a value are all NaN."""
+        inputs = {name: values[:10] for name, values in self.inputs.items()}
+        result = call(
+            make_server(),
+            "batch_compute",
+            {
+                "inputs": inputs,
+                "specs": [{"function": "ADX"}, {"function": "ADXR"}],
+            },
+        )
+        h, lo, c = (np.array(inputs[name]) for name in ("high", "low", "close"))
+        np.testing.assert_array_equal(as_array(result["adxr"]), talib.ADXR(h, lo, c))
+        assert np.isnan(as_array(result["adxr"])).all()
+
+    def test_errors(self):
+        """Repeated names, unknown functions and missing series are rejected."""
+        mcp = make_server()
+        cases = [
+            ([{"function": "RSI"}, {"function": "RSI"}], "repeated"),
+            ([{"function": "NOPE"}], "Unknown indicator function"),
+            ([{"function": "OBV"}], "Unknown indicator function"),
+            ([{"function": "RSI", "params": {"period": 3}}], "period"),
+        ]
+        for specs, message in cases:
+            with pytest.raises(ToolError, match=message):
+                call(mcp, "batch_compute", {"inputs": self.inputs, "specs": specs})
+        with pytest.raises(ToolError, match="'high'"):
+            call(
+                mcp,
+                "batch_compute",
+                {
+                    "inputs": {"close": self.inputs["close"]},
+                    "specs": [{"function": "ATR"}],
+                },
+            )
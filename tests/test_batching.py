@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import momentum_indicators, volatility_indicators
+
+
+def make_server(batch_window=0.05):
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(
+        mcp, ResultStore(), ResultCache(), batch_window=batch_window
+    )
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    return mcp, indicators
+
+
+async def call_all(mcp, calls):
+    contents = await asyncio.gather(
+        *(mcp.call_tool(name, arguments) for name, arguments in calls),
+        return_exceptions=True,
+    )
+    return [
+        content if isinstance(content, Exception) else json.loads(content[0].text)
+        for content in contents
+    ]
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestBatching:
+    """Tests for computing concurrent single-series calls as one panel."""
+
+    rng = np.random.default_rng(21)
+    close = 100 + np.cumsum(rng.normal(size=(11, 55)), axis=1)
+    # Eight series of one length, then others of different lengths.
+    series = [*close[:8, :40], close[8, :30], close[9], close[10]]
+
+    def test_concurrent_calls_share_a_batch(self):
+        """Concurrent calls with equal parameters are computed in one batch."""
+        mcp, indicators = make_server()
+        batches = []
+        panels = []
+        compute_rows = indicators.compute_rows
+        compute_kernel = indicators.compute_kernel
+
+        def counting(name, function, fn, params, rows):
+            batches.append(len(rows))
+            return compute_rows(name, function, fn, params, rows)
+
+        def counting_kernel(function, params, inputs):
+            panels.append(len(inputs["real"]))
+            return compute_kernel(function, params, inputs)
+
+        indicators.compute_rows = counting
+        indicators.compute_kernel = counting_kernel
+        calls = [("_rsi", {"real": close.tolist()}) for close in self.series]
+        calls.append(("_rsi", {"real": self.series[0].tolist(), "timeperiod": 5}))
+        results = asyncio.run(call_all(mcp, calls))
+        for result, close in zip(results, self.series, strict=False):
+            np.testing.assert_array_equal(as_array(result["rsi"]), talib.RSI(close))
+        np.testing.assert_array_equal(
+            as_array(results[-1]["rsi"]), talib.RSI(self.series[0], 5)
+        )
+        # Two groups of parameters, each computed once: rows of equal
+        # length by the RSI kernel, the one of 30 bars and the call with
+        # other parameters by TA-Lib.
+        assert sorted(panels) == [2, 8]
+        assert batches == [1, 1]
+
+    def test_errors_reach_their_caller(self):
+        """An invalid call fails alone, without failing the rest of its batch."""
+        mcp, _ = make_server()
+        close = self.series[0]
+        calls = [
+            (
+                "_calculate_atr",
+                {
+                    "high": close.tolist(),
+                    "low": close.tolist(),
+                    "close": close.tolist(),
+                },
+            ),
+            (
+                "_calculate_atr",
+                {
+                    "high": close.tolist(),
+                    "low": close[:-3].tolist(),
+                    "close": close.tolist(),
+                },
+            ),
+        ]
+        valid, invalid = asyncio.run(call_all(mcp, calls))
+        np.testing.assert_array_equal(
+            as_array(valid["atr"]), talib.ATR(close, close, close)
+        )
+        assert isinstance(invalid, ToolError)
+
+    def test_cached_and_routed_calls(self):
+        """Repeated calls come from the cache, and 2D inputs bypass the batcher."""
+        mcp, _ = make_server()
+        close = self.series[0]
+        first, second, panel = asyncio.run(
+            call_all(
+                mcp,
+                [
+                    ("_rsi", {"real": close.tolist()}),
+                    ("_rsi", {"real": close.tolist()}),
+                    ("_rsi", {"real": [close.tolist()] * 2}),
+                ],
+            )
+        )
+        assert first == second
+        assert panel["rsi"] == [first["rsi"]] * 2
+        with pytest.raises(ToolError):
+            asyncio.run(mcp.call_tool("_rsi", {"real": close.tolist(), "start": 1}))
@@ -0,0 +1,109 @@
+import asyncio
+import json
+from unittest import mock
+
+import numpy as np
+from mcp.server.fastmcp import FastMCP
+
+from src.ta_lib_mcp_server.cache import DiskCache, ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import overlap_studies
+from src.ta_lib_mcp_server.tools.cache_management import register_cache_management
+
+
+def make_server(cache):
+    mcp = FastMCP("test")
+    overlap_studies.register_overlap_studies(IndicatorTools(mcp, ResultStore(), cache))
+    register_cache_management(mcp, cache)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestResultCache:
+    """Tests for the content-addressed indicator result cache."""
+
+    prices = [10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0]
+
+    def test_hit_skips_talib(self):
+        """A repeated request is served from the cache without calling TA-Lib."""
+        mcp = make_server(ResultCache())
+        first = call(mcp, "_sma", {"real": self.prices, "timeperiod": 3})
+        with mock.patch.object(overlap_studies.talib, "SMA") as sma:
+            second = call(mcp, "_sma", {"real": self.prices, "timeperiod": 3})
+        sma.assert_not_called()
+        assert first == second
+        stats = call(mcp, "get_cache_stats", {})
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_key_depends_on_params_and_inputs(self):
+        """Different parameters, MA types or input data get distinct keys."""
+        inputs = {"real": np.array(self.prices)}
+        params = {"timeperiod": 5, "nbdevup": 2, "nbdevdn": 2, "matype": "SMA"}
+        key = ResultCache.make_key("_bbands", params, inputs)
+        assert key == ResultCache.make_key(
+            "_bbands", {**params, "nbdevup": 2.0}, inputs
+        )
+        assert key != ResultCache.make_key(
+            "_bbands", {**params, "matype": "EMA"}, inputs
+        )
+        assert key != ResultCache.make_key(
+            "_bbands", params, {"real": np.array(self.prices[::-1])}
+        )
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted past the byte limit."""
+        cache = ResultCache(max_bytes=250)
+        cache.put("a", {"x": np.zeros(8)})
+        cache.put("b", {"x": np.zeros(8)})
+        assert cache.get("a") is not None
+        cache.put("c", {"x": np.zeros(8)})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries older than the TTL are discarded."""
+        cache = ResultCache(ttl=0)
+        cache.put("a", {"x": np.zeros(8)})
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_clear_cache_tool(self):
+        """The clear_cache tool empties the cache."""
+        mcp = make_server(ResultCache())
+        call(mcp, "_sma", {"real": self.prices})
+        stats = call(mcp, "clear_cache", {})
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+
+    def test_disk_cache_survives_restart(self, tmp_path):
+        """A new process with the same cache directory hits warm results."""
+        first = make_server(ResultCache(disk=DiskCache(str(tmp_path))))
+        expected = call(first, "_sma", {"real": self.prices, "timeperiod": 3})
+
+        cache = ResultCache(disk=DiskCache(str(tmp_path)))
+        second = make_server(cache)
+        with mock.patch.object(overlap_studies.talib, "SMA") as sma:
+            assert call(second, "_sma", {"real": self.prices, "timeperiod": 3}) == (
+                expected
+            )
+        sma.assert_not_called()
+        assert cache.stats()["disk_hits"] == 1
+
+    def test_disk_cache_eviction(self, tmp_path):
+        """The least recently read entries are deleted past the byte limit."""
+        disk = DiskCache(str(tmp_path), max_bytes=20)
+        disk.put("a", b"0123456789")
+        disk.put("b", b"0123456789")
+        assert disk.get("a") is not None
+        disk.put("c", b"0123456789")
+        assert disk.get("b") is None
+        assert disk.get("a") is not None
+        assert disk.stats() == {"entries": 2, "bytes": 20, "max_bytes": 20}
@@ -0,0 +1,75 @@
+from unittest import mock
+
+import numpy as np
+import talib
+
+from src.ta_lib_mcp_server import patterns
+from src.ta_lib_mcp_server.candles import PATTERNS, CandleEngine
+
+
+def make_bars(size, seed):
+    """Random bars mixing long, short and doji bodies and shadowless candles."""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=size))
+    open = close + rng.normal(size=size) * rng.choice([0.01, 0.3, 2.0], size=size)
+    shadow = rng.choice([0, 0.01, 1], size=size)
+    return {
+        "open": open,
+        "high": np.maximum(open, close) + rng.random(size) * shadow,
+        "low": np.minimum(open, close) - rng.random(size) * shadow[::-1],
+        "close": close,
+    }
+
+
+class TestCandleEngine:
+    """Tests for candlestick patterns evaluated on shared candle features."""
+
+    def test_patterns_match_talib(self):
+        """Every supported pattern reproduces TA-Lib bit for bit."""
+        bars = make_bars(20000, 1)
+        engine = CandleEngine(bars)
+        for pattern in PATTERNS:
+            assert CandleEngine.supports(pattern)
+            for params in ({"penetration": 0.0}, {"penetration": 0.5}, {}):
+                if "penetration" not in talib.abstract.Function(pattern).parameters:
+                    params = {}
+                expected = getattr(talib, pattern)(*bars.values(), **params)
+                np.testing.assert_array_equal(
+                    engine.evaluate(pattern, params), expected, err_msg=pattern
+                )
+
+    def test_leading_nan_and_short_series(self):
+        """Leading NaN bars are skipped and short series are handled as TA-Lib."""
+        bars = make_bars(500, 2)
+        for values in bars.values():
+            values[:7] = np.nan
+        bars["close"][3] = 1.0
+        short = make_bars(12, 3)
+        for pattern in PATTERNS:
+            expected = getattr(talib, pattern)(*bars.values())
+            np.testing.assert_array_equal(
+                CandleEngine(bars).evaluate(pattern, {}), expected, err_msg=pattern
+            )
+            for size in (5, 12):
+                head = {name: values[:size] for name, values in short.items()}
+                np.testing.assert_array_equal(
+                    CandleEngine(head).evaluate(pattern, {}),
+                    getattr(talib, pattern)(*head.values()),
+                    err_msg=pattern,
+                )
+
+    def test_scan_uses_engine(self):
+        """A scan on a long series returns TA-Lib's hits without calling it."""
+        bars = make_bars(patterns.ENGINE_MIN_BARS, 4)
+        indicators = mock.Mock(indicators=dict.fromkeys(PATTERNS))
+        indicators.indicator.return_value.params.model_validate.return_value = {}
+        result = patterns.scan_patterns(indicators, bars, ["CDLDOJI", "CDLHARAMI"])
+        doji = talib.CDLDOJI(*bars.values())
+        harami = talib.CDLHARAMI(*bars.values())
+        expected = sorted(
+            [(int(i), "CDLDOJI", int(doji[i])) for i in np.flatnonzero(doji)]
+            + [(int(i), "CDLHARAMI", int(harami[i])) for i in np.flatnonzero(harami)]
+        )
+        rows = zip(result["index"], result["pattern"], result["signal"], strict=True)
+        assert [(int(i), p, int(s)) for i, p, s in rows] == expected
+        indicators.indicator.return_value.assert_not_called()
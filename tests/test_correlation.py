@@ -0,0 +1,181 @@
+import asyncio
+import base64
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server import correlation
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools.correlation import register_correlation
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server():
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache(), datasets)
+    register_correlation(mcp, indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestCorrelation:
+    """Tests for the cross-sectional correlation and covariance matrix."""
+
+    rng = np.random.default_rng(17)
+    panel = 100 + np.cumsum(rng.normal(size=(6, 400)), axis=1)
+    panel[5, 300:] = panel[5, 299]
+
+    def test_matches_correl_for_every_pair(self):
+        """Latest and rolling matrices equal TA-Lib's CORREL pair by pair."""
+        for period in (5, 30, 400):
+            latest = correlation.latest_matrix(self.panel, period, "correlation")
+            rolling = correlation.rolling_matrix(self.panel, period, "correlation")
+            for i in range(len(self.panel)):
+                for j in range(len(self.panel)):
+                    expected = talib.CORREL(self.panel[i], self.panel[j], period)
+                    np.testing.assert_allclose(
+                        rolling[:, i, j], expected, rtol=0, atol=1e-9
+                    )
+                    assert latest[i, j] == pytest.approx(expected[-1], abs=1e-9)
+
+    def test_covariance(self):
+        """Covariances are population covariances over each window."""
+        rolling = correlation.rolling_matrix(self.panel, 20, "covariance")
+        for t in (19, 200, 399):
+            window = self.panel[:, t - 19 : t + 1]
+            np.testing.assert_allclose(
+                rolling[t], np.cov(window, bias=True), rtol=1e-9, atol=1e-9
+            )
+        np.testing.assert_allclose(
+            correlation.latest_matrix(self.panel, 20, "covariance"), rolling[-1]
+        )
+
+    def test_tool_outputs(self):
+        """The tool returns named matrices, top pairs and binary encodings."""
+        mcp = make_server()
+        symbols = list("ABCDEF")
+        result = call(
+            mcp,
+            "correlation_matrix",
+            {"real": self.panel.tolist(), "symbols": symbols, "top_k": 3},
+        )
+        latest = correlation.latest_matrix(self.panel, 30, "correlation")
+        np.testing.assert_allclose(np.array(result["matrix"]), latest)
+        assert result["shape"] == [6, 6]
+        values = [abs(pair["value"]) for pair in result["pairs"]]
+        assert values == sorted(values, reverse=True)
+        first, second = result["pairs"][0]["symbols"]
+        assert values[0] == pytest.approx(
+            abs(latest[symbols.index(first), symbols.index(second)])
+        )
+
+        for i, row in enumerate(self.panel):
+            call(
+                mcp,
+                "register_dataset",
+                {"name": f"S{i}", "columns": {"close": row.tolist()}},
+            )
+        result = call(
+            mcp,
+            "correlation_matrix",
+            {
+                "datasets": ["S0", "S1", "S2"],
+                "timeperiod": 10,
+                "method": "covariance",
+                "rolling": True,
+                "encoding": "base64",
+            },
+        )
+        assert result["symbols"] == ["S0", "S1", "S2"]
+        assert result["shape"] == [400, 3, 3]
+        matrices = np.frombuffer(base64.b64decode(result["values"]), "<f8")
+        np.testing.assert_allclose(
+            matrices.reshape(result["shape"]),
+            correlation.rolling_matrix(self.panel[:3], 10, "covariance"),
+        )
+
+    def test_invalid_requests(self):
+        """Ragged panels, NaN, short series and ambiguous sources are errors."""
+        mcp = make_server()
+        with_nan = self.panel.copy()
+        with_nan[1, 5] = np.nan
+        for arguments in (
+            {"real": [[1.0, 2.0, 3.0], [1.0, 2.0]], "timeperiod": 2},
+            {"real": with_nan.tolist()},
+            {"real": self.panel[:, :10].tolist()},
+            {"real": self.panel[:1].tolist()},
+            {"real": self.panel.tolist(), "symbols": ["A"]},
+            {},
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, "correlation_matrix", arguments)
+
+
+class TestBeta:
+    """Tests for the beta of a panel of symbols against one benchmark."""
+
+    rng = np.random.default_rng(23)
+    index = 100 + np.cumsum(rng.normal(size=300))
+    panel = 50 + np.cumsum(rng.normal(size=(5, 300)), axis=1)
+    panel[2, 100:120] = 0.0
+
+    def test_latest_and_rolling_match_talib(self):
+        """Latest and rolling betas equal TA-Lib's BETA(benchmark, symbol)."""
+        mcp = make_server()
+        for period in (2, 5, 60):
+            arguments = {
+                "real": self.panel.tolist(),
+                "benchmark": self.index.tolist(),
+                "timeperiod": period,
+            }
+            latest = call(mcp, "beta_panel", arguments)["beta"]
+            rolling = call(mcp, "beta_panel", {**arguments, "rolling": True})["beta"]
+            for i, row in enumerate(self.panel):
+                expected = talib.BETA(self.index, row, period)
+                np.testing.assert_array_equal(
+                    np.array(rolling[i], dtype=float), expected
+                )
+                assert latest[i] == pytest.approx(expected[-1], rel=1e-9)
+
+    def test_datasets_and_constant_benchmark(self):
+        """Datasets name the rows, and a flat benchmark gives a beta of zero."""
+        mcp = make_server()
+        flat = self.index.copy()
+        flat[-10:] = flat[-11]
+        for name, values in (("A", self.panel[0]), ("B", self.panel[1]), ("I", flat)):
+            call(
+                mcp,
+                "register_dataset",
+                {"name": name, "columns": {"close": values.tolist()}},
+            )
+        result = call(
+            mcp,
+            "beta_panel",
+            {"datasets": ["A", "B"], "benchmark_dataset": "I", "timeperiod": 9},
+        )
+        assert result["symbols"] == ["A", "B"]
+        assert result["beta"] == [0.0, 0.0]
+
+    def test_invalid_requests(self):
+        """A missing or misaligned benchmark and too short series are errors."""
+        mcp = make_server()
+        for arguments in (
+            {"real": self.panel.tolist()},
+            {"real": self.panel.tolist(), "benchmark": self.index[:-1].tolist()},
+            {"real": self.panel[:, :5].tolist(), "benchmark": self.index[:5].tolist()},
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, "beta_panel", arguments)
@@ -0,0 +1,362 @@
+import asyncio
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from talib import abstract
+
+from src.ta_lib_mcp_server import incremental, windows
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import overlap_studies, volatility_indicators
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server():
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache(), datasets)
+    overlap_studies.register_overlap_studies(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestDatasets:
+    """Tests for referencing registered datasets from indicator tools."""
+
+    close = [10.0, 11.5, 11.0, 12.5, 13.0, 12.0, 14.0, 15.5, 15.0, 16.0]
+    high = [value + 1.0 for value in close]
+    low = [value - 1.0 for value in close]
+
+    def register(self, mcp):
+        return call(
+            mcp,
+            "register_dataset",
+            {
+                "name": "AAPL_1m",
+                "columns": {"close": self.close, "high": self.high, "low": self.low},
+            },
+        )
+
+    def test_register_and_list(self):
+        """Registering returns a handle describing the stored columns."""
+        mcp = make_server()
+        handle = self.register(mcp)
+        assert handle["dataset"] == "AAPL_1m"
+        assert handle["length"] == len(self.close)
+        assert handle["columns"] == ["close", "high", "low"]
+        assert call(mcp, "list_datasets", {}) == handle
+
+    def test_dataset_matches_inline(self):
+        """An indicator reads the same values from a dataset as sent inline."""
+        mcp = make_server()
+        self.register(mcp)
+        inline = call(mcp, "_sma", {"real": self.close, "timeperiod": 3})
+        stored = call(mcp, "_sma", {"dataset": "AAPL_1m", "timeperiod": 3})
+        assert stored == inline
+        atr = call(mcp, "_calculate_atr", {"dataset": "AAPL_1m", "timeperiod": 3})
+        expected = talib.ATR(
+            np.array(self.high), np.array(self.low), np.array(self.close), 3
+        )
+        np.testing.assert_allclose(
+            np.array(atr["atr"], dtype=float), expected, equal_nan=True
+        )
+
+    def test_column_mapping(self):
+        """The columns argument selects which column feeds an input."""
+        mcp = make_server()
+        self.register(mcp)
+        result = call(
+            mcp,
+            "_sma",
+            {"dataset": "AAPL_1m", "columns": {"real": "high"}, "timeperiod": 3},
+        )
+        assert result == call(mcp, "_sma", {"real": self.high, "timeperiod": 3})
+
+    def test_errors(self):
+        """Missing inputs, unknown datasets and uneven columns are rejected."""
+        mcp = make_server()
+        with pytest.raises(ToolError, match="Missing input series"):
+            call(mcp, "_sma", {"timeperiod": 3})
+        with pytest.raises(ToolError, match="Unknown dataset"):
+            call(mcp, "_sma", {"dataset": "missing"})
+        with pytest.raises(ToolError, match="equal lengths"):
+            call(
+                mcp,
+                "register_dataset",
+                {"name": "bad", "columns": {"close": [1.0, 2.0], "high": [1.0]}},
+            )
+
+    def test_drop(self):
+        """A dropped dataset can no longer be referenced."""
+        mcp = make_server()
+        self.register(mcp)
+        call(mcp, "drop_dataset", {"name": "AAPL_1m"})
+        assert asyncio.run(mcp.call_tool("list_datasets", {})) == []
+        with pytest.raises(ToolError, match="Unknown dataset"):
+            call(mcp, "_sma", {"dataset": "AAPL_1m"})
+
+
+class TestAppendBars:
+    """Tests for extending dataset results when bars are appended."""
+
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(size=120))
+    high = close + rng.random(120)
+    low = close - rng.random(120)
+    open = close + rng.normal(scale=0.3, size=120)
+    volume = rng.integers(1, 1000, 120).astype(float)
+
+    def bars(self, start, stop):
+        return {
+            name: getattr(self, name)[start:stop].tolist()
+            for name in ("open", "high", "low", "close")
+        }
+
+    def test_append_matches_full_recompute(self):
+        """Results on an extended dataset equal those on the whole series."""
+        mcp = make_server()
+        call(mcp, "register_dataset", {"name": "bars", "columns": self.bars(0, 100)})
+        calls = {
+            "_ema": ({"timeperiod": 10}, talib.EMA(self.close, 10)),
+            "_sma": ({"timeperiod": 10}, talib.SMA(self.close, 10)),
+            "_midpoint": ({"timeperiod": 7}, talib.MIDPOINT(self.close, 7)),
+            "_sar": (
+                {"acceleration": 0.02, "maximum": 0.2},
+                talib.SAR(self.high, self.low, 0.02, 0.2),
+            ),
+        }
+        for name, (params, _) in calls.items():
+            call(mcp, name, {"dataset": "bars", **params})
+        handle = call(
+            mcp, "append_bars", {"name": "bars", "columns": self.bars(100, 120)}
+        )
+        assert handle["length"] == 120
+        with mock.patch.object(overlap_studies.talib, "SAR") as sar:
+            result = call(mcp, "_sar", {"dataset": "bars", **calls["_sar"][0]})
+        sar.assert_not_called()
+        np.testing.assert_array_equal(
+            np.array(result["sar"], dtype=float), calls["_sar"][1]
+        )
+        for name, (params, expected) in calls.items():
+            result = call(mcp, name, {"dataset": "bars", **params})
+            values = np.array(next(iter(result.values())), dtype=float)
+            np.testing.assert_array_equal(values, expected, err_msg=name)
+
+    def test_derived_results_are_bounded(self):
+        """Results kept for extension are evicted beyond the registry's budget."""
+        mcp = FastMCP("test")
+        datasets = DatasetRegistry(max_derived_bytes=2 * 100 * 8)
+        indicators = IndicatorTools(mcp, ResultStore(), ResultCache(0), datasets)
+        overlap_studies.register_overlap_studies(indicators)
+        register_dataset_management(mcp, datasets)
+        call(mcp, "register_dataset", {"name": "bars", "columns": self.bars(0, 100)})
+        periods = (5, 10, 20)
+        for timeperiod in periods:
+            call(mcp, "_sma", {"dataset": "bars", "timeperiod": timeperiod})
+        derived = datasets.get("bars").derived
+        assert len(derived) == 2
+        assert derived.nbytes == 2 * 100 * 8
+        call(mcp, "append_bars", {"name": "bars", "columns": self.bars(100, 120)})
+        for timeperiod in periods:
+            result = call(mcp, "_sma", {"dataset": "bars", "timeperiod": timeperiod})
+            np.testing.assert_array_equal(
+                np.array(result["sma"], dtype=float), talib.SMA(self.close, timeperiod)
+            )
+
+    def test_append_validates_columns(self):
+        """Appended bars must cover every column with equal lengths."""
+        mcp = make_server()
+        call(mcp, "register_dataset", {"name": "bars", "columns": self.bars(0, 10)})
+        with pytest.raises(ToolError, match="exactly the columns"):
+            call(mcp, "append_bars", {"name": "bars", "columns": {"close": [1.0]}})
+
+    def test_recursive_states_are_exact(self):
+        """Recursive indicators resume bit-identically to a full TA-Lib run."""
+        inputs = {
+            "real": self.close,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
+        for function, state_class in incremental.RECURSIVE_STATES.items():
+            series = {name: inputs[name] for name in state_class.inputs}
+            expected = abstract.Function(function)(*series.values())
+            if isinstance(expected, np.ndarray):
+                expected = [expected]
+            expected = dict(zip(state_class.outputs, expected, strict=True))
+            derived = incremental.DerivedResult(
+                90, {key: values[:90] for key, values in expected.items()}
+            )
+            for stop in (100, 101, 120):
+                prefix = {name: values[:stop] for name, values in series.items()}
+                derived = incremental.extend(function, None, {}, prefix, derived)
+                for key, values in expected.items():
+                    np.testing.assert_array_equal(
+                        derived.result[key], values[:stop], err_msg=function
+                    )
+
+    def test_window_states_are_exact(self):
+        """Windowed indicators with running sums resume from their state."""
+        rng = np.random.default_rng(8)
+        close = 100 + np.cumsum(rng.normal(size=1100))
+        inputs = {
+            "real": close,
+            "high": close + rng.random(1100),
+            "low": close - rng.random(1100),
+            "close": close,
+        }
+        for function, params in (("SMA", {"timeperiod": 30}), ("CCI", {})):
+            state_class = windows.STATES[function]
+            series = {name: inputs[name] for name in state_class.inputs}
+            expected = abstract.Function(function)(*series.values(), **params)
+            derived = incremental.DerivedResult(100, {"value": expected[:100]})
+            for stop in range(107, 1101, 7):
+                prefix = {name: values[:stop] for name, values in series.items()}
+                derived = incremental.extend(
+                    function, None, params, prefix, derived, windows.STATES
+                )
+                assert derived.state is not None
+                np.testing.assert_array_equal(
+                    derived.result["value"], expected[:stop], err_msg=function
+                )
+
+    def test_stream_states_need_stream_objects(self):
+        """Without TA-Lib stream objects, their indicators are recomputed."""
+        expected = talib.WMA(self.close, 10)
+        derived = incremental.DerivedResult(100, {"wma": expected[:100]})
+        with mock.patch.object(windows, "STREAM_OBJECTS", False):
+            extended = incremental.extend(
+                "WMA",
+                None,
+                {"timeperiod": 10},
+                {"real": self.close},
+                derived,
+                windows.STATES,
+            )
+        assert extended is None
+
+    def test_states_from_short_history(self):
+        """States built on the first values resume exactly, bar by bar."""
+        rng = np.random.default_rng(3)
+        close = 100 + np.cumsum(rng.normal(size=80))
+        for function, params in (
+            ("RSI", {"timeperiod": 5}),
+            ("RSI", {"timeperiod": 14}),
+            ("STOCHRSI", {"timeperiod": 14, "fastk_period": 5, "fastd_period": 3}),
+        ):
+            expected = abstract.Function(function)(close, **params)
+            expected = [expected] if isinstance(expected, np.ndarray) else expected
+            start = incremental.lookback(function, params) + 1
+            derived = incremental.DerivedResult(
+                start, {str(i): values[:start] for i, values in enumerate(expected)}
+            )
+            for stop in range(start + 1, len(close) + 1):
+                derived = incremental.extend(
+                    function,
+                    None,
+                    params,
+                    {"real": close[:stop]},
+                    derived,
+                    windows.STATES,
+                )
+                assert derived.state is not None
+                for i, values in enumerate(expected):
+                    np.testing.assert_array_equal(
+                        derived.result[str(i)], values[:stop], err_msg=function
+                    )
+
+    def test_windowed_functions_recompute_tail(self):
+        """Windowed indicators recompute only the last lookback + k bars."""
+        inputs = {"open": self.open, "high": self.high, "low": self.low}
+        for function in sorted(incremental.WINDOWED_FUNCTIONS):
+            indicator = abstract.Function(function)
+            names = [
+                name
+                for group in indicator.input_names.values()
+                for name in ([group] if isinstance(group, str) else group)
+            ]
+            series = {name: inputs.get(name, self.close) for name in names}
+            tails = []
+
+            def compute(tail, indicator=indicator, tails=tails):
+                tails.append(len(next(iter(tail.values()))))
+                outputs = indicator(*tail.values())
+                if not isinstance(outputs, list):
+                    outputs = [outputs]
+                return {str(index): values for index, values in enumerate(outputs)}
+
+            full = compute(series)
+            derived = incremental.DerivedResult(
+                100, {key: values[:100] for key, values in full.items()}
+            )
+            extended = incremental.extend(function, compute, {}, series, derived)
+            assert tails[-1] == indicator.lookback + 20, function
+            for key, values in full.items():
+                np.testing.assert_allclose(
+                    extended.result[key], values, rtol=1e-9, equal_nan=True
+                )
+
+
+class TestDatasetStore:
+    """Tests for datasets stored as memory-mapped column files."""
+
+    close = [float(value) for value in range(1, 41)]
+
+    def test_survives_restart(self, tmp_path):
+        """A stored dataset is remapped by a new registry with the same data."""
+        registry = DatasetRegistry(str(tmp_path))
+        registry.register("AAPL_1m", {"close": self.close[:30]})
+        registry.append("AAPL_1m", {"close": self.close[30:]})
+        digest = registry.get("AAPL_1m").digest("close")
+
+        reopened = DatasetRegistry(str(tmp_path))
+        dataset = reopened.get("AAPL_1m")
+        assert isinstance(dataset.column("close"), np.memmap)
+        np.testing.assert_array_equal(dataset.column("close"), self.close)
+        assert dataset.digest("close") == digest
+        assert [item.name for item in reopened.list()] == ["AAPL_1m"]
+
+    def test_indicator_on_stored_dataset(self, tmp_path):
+        """Indicator tools compute on memory-mapped columns."""
+        mcp = FastMCP("test")
+        datasets = DatasetRegistry(str(tmp_path))
+        overlap_studies.register_overlap_studies(
+            IndicatorTools(mcp, ResultStore(), ResultCache(), datasets)
+        )
+        datasets.register("AAPL_1m", {"close": self.close})
+        result = call(mcp, "_sma", {"dataset": "AAPL_1m", "timeperiod": 5})
+        assert result["sma"][-1] == pytest.approx(38.0)
+
+    def test_resident_budget_evicts_cold_mappings(self, tmp_path):
+        """The least recently used mappings are closed beyond the budget."""
+        registry = DatasetRegistry(str(tmp_path), max_resident_bytes=700)
+        for name in ("a", "b", "c"):
+            registry.register(name, {"close": self.close})
+        registry.get("b")
+        registry.register("d", {"close": self.close})
+        assert list(registry._datasets) == ["b", "d"]
+        assert registry.evictions == 2
+        np.testing.assert_array_equal(registry.get("a").column("close"), self.close)
+
+    def test_drop_and_names(self, tmp_path):
+        """Dropping removes the files; unsafe names are rejected."""
+        registry = DatasetRegistry(str(tmp_path))
+        registry.register("AAPL_1m", {"close": self.close})
+        registry.drop("AAPL_1m")
+        assert not (tmp_path / "AAPL_1m").exists()
+        with pytest.raises(ValueError, match="Invalid dataset name"):
+            registry.register("../escape", {"close": self.close})
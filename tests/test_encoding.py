@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.ta_lib_mcp_server.encoding import encode_json
+from src.ta_lib_mcp_server.tools.overlap_studies import calculate_sma
+from src.ta_lib_mcp_server.tools.pattern_recognition import calculate_cdldoji
+
+
+class TestEncoding:
+    """Tests for encoding ndarray tool results straight to JSON bytes."""
+
+    def test_nan_is_null(self):
+        """NaN and infinite values are encoded as null."""
+        value = {"a": np.array([np.nan, 1.5, np.inf]), "b": float("nan")}
+        assert json.loads(encode_json(value)) == {"a": [None, 1.5, None], "b": None}
+
+    def test_indicator_result(self):
+        """Float and integer indicator outputs encode without tolist()."""
+        prices = [10.0, 11.0, 12.0, 13.0, 14.0, 15.0]
+        sma = json.loads(encode_json(calculate_sma(prices, timeperiod=3)))
+        assert sma["sma"] == [None, None, 11.0, 12.0, 13.0, 14.0]
+        doji = calculate_cdldoji(prices, prices, prices, prices)
+        assert json.loads(encode_json(doji))["result"] == doji["result"].tolist()
+
+    def test_non_contiguous_array(self):
+        """Strided views are encoded like their contiguous copies."""
+        values = np.arange(10, dtype=np.float64)[::2]
+        assert json.loads(encode_json(values)) == [0.0, 2.0, 4.0, 6.0, 8.0]
+
+    def test_unsupported_type(self):
+        """Values of other types are errors, not strings."""
+        with pytest.raises(TypeError):
+            encode_json({"a": {1, 2}})
+        with pytest.raises(TypeError):
+            encode_json({"a": object()})
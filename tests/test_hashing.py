@@ -0,0 +1,28 @@
+import numpy as np
+
+from src.ta_lib_mcp_server.hashing import Fingerprint, fingerprint, to_float64_array
+
+
+class TestHashing:
+    """Tests for content fingerprints of input arrays."""
+
+    def test_fingerprint_depends_on_content(self):
+        """Equal buffers share a digest and different buffers do not."""
+        a = to_float64_array([1.0, 2.0, 3.0])
+        assert fingerprint(a) == fingerprint(np.array([1.0, 2.0, 3.0]))
+        assert fingerprint(a) != fingerprint(np.array([1.0, 2.0, 3.5]))
+
+    def test_incremental_update(self):
+        """Extending a fingerprint equals hashing the extended series."""
+        values = np.random.default_rng(0).normal(size=1000)
+        incremental = Fingerprint(values[:600])
+        extended = incremental.copy().update(values[600:])
+        assert extended.hexdigest() == fingerprint(values)
+        assert extended.length == 1000
+        assert incremental.hexdigest() == fingerprint(values[:600])
+
+    def test_conversion_reuses_float64_buffers(self):
+        """Converting an existing float64 array does not copy it."""
+        values = np.arange(5, dtype=np.float64)
+        assert to_float64_array(values) is values
+        assert to_float64_array([1, 2]).dtype == np.float64
@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import numpy as np
+import talib
+from mcp.server.fastmcp import FastMCP
+
+from src.ta_lib_mcp_server import kernels
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import overlap_studies, volume_indicators
+
+
+def make_server():
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache())
+    overlap_studies.register_overlap_studies(indicators)
+    volume_indicators.register_volume_indicators(indicators)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestKernels:
+    """Tests for computing indicators on whole panels with NumPy kernels."""
+
+    rng = np.random.default_rng(12)
+    close = 100 + np.cumsum(rng.normal(size=(40, kernels.MAX_KERNEL_LENGTH)), axis=1)
+    close[3, 10:20] = close[3, 9]
+    close[4, 30:40] = 0.0
+    bars = {
+        "high": close + rng.random(close.shape),
+        "low": close - rng.random(close.shape),
+        "close": close,
+        "volume": rng.integers(1, 1000, close.shape).astype(float),
+    }
+
+    def test_kernels_match_talib(self):
+        """Every calibrated kernel equals TA-Lib on each row, for several periods."""
+        for function in kernels.KERNELS:
+            for period in (1, 2, 5, 30, 100):
+                params = {"timeperiod": period, "nbdev": 2.0}
+                panel = kernels.evaluate(
+                    function, {"real": self.close, **self.bars}, params
+                )
+                if panel is None:
+                    continue
+                indicator = talib.abstract.Function(function)
+                params = {
+                    name: value
+                    for name, value in params.items()
+                    if name in indicator.parameters
+                }
+                for row in range(len(self.close)):
+                    expected = indicator(
+                        {name: values[row] for name, values in self.bars.items()},
+                        **params,
+                    )
+                    (actual,) = panel.values()
+                    np.testing.assert_array_equal(actual[row], expected)
+
+    def test_kernels_are_calibrated(self):
+        """Every registered kernel reproduces the installed TA-Lib."""
+        for function in kernels.KERNELS:
+            assert kernels.arithmetic(function) is not None, function
+
+    def test_fallback(self):
+        """NaN inputs, long rows and uncovered functions are left to TA-Lib."""
+        with_nan = self.close.copy()
+        with_nan[2, 5] = np.nan
+        longer = np.ones((2, kernels.MAX_KERNEL_LENGTH + 1))
+        assert kernels.evaluate("SMA", {"real": with_nan}, {"timeperiod": 5}) is None
+        assert kernels.evaluate("SMA", {"real": longer}, {"timeperiod": 5}) is None
+        assert kernels.evaluate("KAMA", {"real": self.close}, {"timeperiod": 5}) is None
+
+    def test_panel_tools(self):
+        """Panel tools return TA-Lib's values, with or without a kernel."""
+        mcp = make_server()
+        with_nan = self.close.copy()
+        with_nan[0, 7] = np.nan
+        for real in (self.close, with_nan):
+            sma = call(mcp, "_sma", {"real": real.tolist(), "timeperiod": 7})["sma"]
+            for row, values in zip(sma, real, strict=True):
+                np.testing.assert_array_equal(
+                    np.array(row, dtype=float), talib.SMA(values, 7)
+                )
+        obv = call(
+            mcp,
+            "_calculate_obv",
+            {"close": self.close.tolist(), "volume": self.bars["volume"].tolist()},
+        )["obv"]
+        for row, close, volume in zip(
+            obv, self.close, self.bars["volume"], strict=True
+        ):
+            np.testing.assert_array_equal(row, talib.OBV(close, volume))
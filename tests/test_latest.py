@@ -0,0 +1,163 @@
+import asyncio
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server import latest as latest_module
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import (
+    cycle_indicators,
+    momentum_indicators,
+    overlap_studies,
+    pattern_recognition,
+    price_transform,
+    statistic_functions,
+    volatility_indicators,
+    volume_indicators,
+)
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server():
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache(), datasets)
+    overlap_studies.register_overlap_studies(indicators)
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    cycle_indicators.register_cycle_indicators(indicators)
+    price_transform.register_price_transform(indicators)
+    pattern_recognition.register_pattern_recognition(indicators)
+    statistic_functions.register_statistic_functions(indicators)
+    volume_indicators.register_volume_indicators(indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp, indicators
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestLatestOnly:
+    """Tests for returning only the latest value of each output."""
+
+    rng = np.random.default_rng(4)
+    close = 100 + np.cumsum(rng.normal(size=120))
+    bars = {
+        "open": close + rng.normal(scale=0.5, size=120),
+        "high": close + rng.random(120),
+        "low": close - rng.random(120),
+        "close": close,
+        "volume": rng.integers(1, 1000, 120).astype(float),
+        "real": close,
+        "real0": close,
+        "real1": 50 + np.cumsum(rng.normal(size=120)),
+        "periods": rng.integers(2, 20, 120).astype(float),
+    }
+    # Parameters for tools whose defaults TA-Lib rejects.
+    params = {"MAMA": {"fastlimit": 0.5, "slowlimit": 0.05}}
+
+    def test_every_indicator_returns_its_last_value(self):
+        """latest_only returns the last value of every output of every tool."""
+        mcp, indicators = make_server()
+        for indicator in indicators.indicators.values():
+            inputs = {name: self.bars[name].tolist() for name in indicator.series}
+            inputs.update(self.params.get(indicator.function, {}))
+            full = call(mcp, indicator.name, inputs)
+            latest = call(mcp, indicator.name, {**inputs, "latest_only": True})
+            assert latest == {name: values[-1] for name, values in full.items()}, (
+                indicator.function
+            )
+
+    def test_full_series_fallbacks(self):
+        """A NaN last bar, or a TA-Lib without stream objects, is computed in full."""
+        mcp, indicators = make_server()
+        with_nan = {name: values.copy() for name, values in self.bars.items()}
+        for values in with_nan.values():
+            values[-1] = np.nan
+        for bars, patch in (
+            (with_nan, mock.patch.object(latest_module, "stream")),
+            (self.bars, mock.patch.object(latest_module, "STREAM_OBJECTS", False)),
+        ):
+            for indicator in indicators.indicators.values():
+                inputs = {name: bars[name].tolist() for name in indicator.series}
+                inputs.update(self.params.get(indicator.function, {}))
+                full = call(mcp, indicator.name, inputs)
+                with patch:
+                    latest = call(mcp, indicator.name, {**inputs, "latest_only": True})
+                assert latest == {name: values[-1] for name, values in full.items()}, (
+                    indicator.function
+                )
+        with mock.patch.object(latest_module, "stream") as stream:
+            call(
+                mcp,
+                "_midpoint",
+                {"real": with_nan["real"].tolist(), "latest_only": True},
+            )
+        stream.MIDPOINT.assert_not_called()
+
+    def test_sources(self):
+        """Datasets, panels and short series give the last value of each row."""
+        mcp, _ = make_server()
+        call(
+            mcp,
+            "register_dataset",
+            {"name": "a", "columns": {"close": self.close.tolist()}},
+        )
+        call(
+            mcp,
+            "register_dataset",
+            {"name": "b", "columns": {"close": self.close[:5].tolist()}},
+        )
+        full = call(mcp, "_sma", {"dataset": "a", "timeperiod": 10})
+        with mock.patch.object(overlap_studies.talib, "SMA") as sma:
+            latest = call(
+                mcp,
+                "_sma",
+                {"dataset": "a", "timeperiod": 10, "latest_only": True},
+            )
+        # Only the empty series naming the outputs reaches the array function.
+        assert all(len(args[0]) == 0 for args, _ in sma.call_args_list)
+        assert latest == {"sma": full["sma"][-1]}
+
+        latest = call(
+            mcp,
+            "_bbands",
+            {"datasets": ["a", "b"], "timeperiod": 10, "latest_only": True},
+        )
+        assert latest["upperband"][0] == pytest.approx(
+            call(mcp, "_bbands", {"dataset": "a", "timeperiod": 10})["upperband"][-1]
+        )
+        assert latest["upperband"][1] is None
+
+        panel = [self.close[:60].tolist(), self.close[60:].tolist()]
+        latest = call(mcp, "_rsi", {"real": panel, "latest_only": True})
+        assert latest["rsi"] == [
+            call(mcp, "_rsi", {"real": row})["rsi"][-1] for row in panel
+        ]
+
+    def test_invalid_requests(self):
+        """latest_only rejects ranges, segments, timestamps and empty series."""
+        mcp, _ = make_server()
+        real = self.close[:20].tolist()
+        for arguments in (
+            {"real": real, "offsets": [0, 10, 20]},
+            {"real": real, "start": 1},
+            {"real0": real, "real1": real, "timestamps": {"real0": [1], "real1": [1]}},
+        ):
+            with pytest.raises(ToolError):
+                call(
+                    mcp,
+                    "_calculate_correl" if "real0" in arguments else "_sma",
+                    {**arguments, "latest_only": True},
+                )
+        with pytest.raises(ToolError, match="at least one bar"):
+            call(mcp, "_sma", {"real": [], "latest_only": True})
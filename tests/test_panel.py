@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import momentum_indicators, volatility_indicators
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server(panel_workers=3, inline_limit=10_000_000):
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(
+        mcp,
+        ResultStore(inline_limit=inline_limit),
+        ResultCache(),
+        datasets,
+        panel_workers=panel_workers,
+    )
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestPanel:
+    """Tests for computing indicators on a panel of symbols in one call."""
+
+    rng = np.random.default_rng(4)
+    close = 100 + np.cumsum(rng.normal(size=(7, 60)), axis=1)
+    high = close + rng.random((7, 60))
+    low = close - rng.random((7, 60))
+
+    def test_panel_matches_rows(self):
+        """Each output row equals the indicator computed on that symbol."""
+        for workers in (1, 3):
+            mcp = make_server(panel_workers=workers)
+            rsi = call(mcp, "_rsi", {"real": self.close.tolist()})["rsi"]
+            atr = call(
+                mcp,
+                "_calculate_atr",
+                {
+                    "high": self.high.tolist(),
+                    "low": self.low.tolist(),
+                    "close": self.close.tolist(),
+                    "timeperiod": 5,
+                },
+            )["atr"]
+            for i in range(len(self.close)):
+                np.testing.assert_array_equal(
+                    as_array(rsi[i]), talib.RSI(self.close[i])
+                )
+                np.testing.assert_array_equal(
+                    as_array(atr[i]),
+                    talib.ATR(self.high[i], self.low[i], self.close[i], 5),
+                )
+
+    def test_dataset_panel(self):
+        """A list of datasets of different lengths gives one row per dataset."""
+        mcp = make_server()
+        lengths = [60, 45, 30]
+        for i, length in enumerate(lengths):
+            call(
+                mcp,
+                "register_dataset",
+                {
+                    "name": f"S{i}",
+                    "columns": {"close": self.close[i, :length].tolist()},
+                },
+            )
+        rsi = call(mcp, "_rsi", {"datasets": ["S2", "S0", "S1"], "timeperiod": 10})[
+            "rsi"
+        ]
+        assert [len(row) for row in rsi] == [30, 60, 45]
+        for row, i in zip(rsi, (2, 0, 1), strict=True):
+            np.testing.assert_array_equal(
+                as_array(row), talib.RSI(self.close[i, : lengths[i]], 10)
+            )
+
+    def test_invalid_panels(self):
+        """Mismatched shapes and mixing panels with other sources are errors."""
+        mcp = make_server()
+        call(mcp, "register_dataset", {"name": "S", "columns": {"close": [1.0] * 20}})
+        for name, arguments in (
+            (
+                "_calculate_atr",
+                {
+                    "high": self.high.tolist(),
+                    "low": self.low[:3].tolist(),
+                    "close": self.close.tolist(),
+                },
+            ),
+            ("_rsi", {"real": self.close.tolist(), "datasets": ["S"]}),
+            ("_rsi", {"datasets": ["S"], "dataset": "S"}),
+            ("_rsi", {"datasets": []}),
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, name, arguments)
+
+    def test_large_panel_pages_by_symbol(self):
+        """An offloaded panel is summarized and paged by row."""
+        mcp = make_server(inline_limit=100)
+        content = asyncio.run(mcp.call_tool("_rsi", {"real": self.close.tolist()}))
+        summary = json.loads(content[0].text)
+        assert summary["length"] == len(self.close)
+        assert summary["outputs"]["rsi"]["last"] == pytest.approx(
+            talib.RSI(self.close[-1])[-1]
+        )
@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools.pattern_recognition import (
+    register_pattern_recognition,
+)
+from src.ta_lib_mcp_server.tools.pattern_scan import register_pattern_scan
+
+
+def make_server():
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache())
+    register_pattern_recognition(indicators)
+    register_pattern_scan(mcp, indicators)
+    return mcp, indicators
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def rows(result):
+    return list(zip(result["index"], result["pattern"], result["signal"], strict=True))
+
+
+class TestPatternScan:
+    """Tests for scanning all candlestick patterns in one call."""
+
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(size=400))
+    open = close + rng.normal(scale=0.5, size=400)
+    high = np.maximum(open, close) + rng.random(400)
+    low = np.minimum(open, close) - rng.random(400)
+    bars = {
+        "open": open.tolist(),
+        "high": high.tolist(),
+        "low": low.tolist(),
+        "close": close.tolist(),
+    }
+
+    def expected_rows(self, patterns):
+        expected = []
+        for pattern in patterns:
+            output = getattr(talib, pattern)(self.open, self.high, self.low, self.close)
+            expected += [
+                (int(i), pattern, int(output[i])) for i in np.flatnonzero(output)
+            ]
+        return sorted(expected)
+
+    def test_scan_all_patterns(self):
+        """Every registered pattern runs and only its non-zero outputs are rows."""
+        mcp, indicators = make_server()
+        result = call(mcp, "scan_candlestick_patterns", self.bars)
+        # Patterns taking a penetration use the tools' default of 0.
+        patterns = sorted(name for name in indicators.indicators)
+        expected = []
+        for pattern in patterns:
+            output = indicators.indicator(pattern)(
+                {name: np.array(values) for name, values in self.bars.items()}, {}
+            )["result"]
+            expected += [
+                (int(i), pattern, int(output[i])) for i in np.flatnonzero(output)
+            ]
+        assert len(patterns) == 61
+        assert rows(result) == sorted(expected)
+
+    def test_subset_and_workers(self):
+        """A chosen subset gives the same rows sequentially and in parallel."""
+        mcp, _ = make_server()
+        patterns = ["cdldoji", "CDLENGULFING", "CDLHAMMER"]
+        sequential = call(
+            mcp, "scan_candlestick_patterns", {**self.bars, "patterns": patterns}
+        )
+        parallel = call(
+            mcp,
+            "scan_candlestick_patterns",
+            {**self.bars, "patterns": patterns, "workers": 3},
+        )
+        assert sequential == parallel
+        assert rows(sequential) == self.expected_rows(
+            ["CDLDOJI", "CDLENGULFING", "CDLHAMMER"]
+        )
+
+    def test_errors(self):
+        """Unknown patterns and missing series are rejected."""
+        mcp, _ = make_server()
+        with pytest.raises(ToolError, match="CDLNOPE"):
+            call(
+                mcp, "scan_candlestick_patterns", {**self.bars, "patterns": ["CDLNOPE"]}
+            )
+        with pytest.raises(ToolError, match="open"):
+            call(mcp, "scan_candlestick_patterns", {"close": self.bars["close"]})
@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import (
+    cycle_indicators,
+    momentum_indicators,
+    overlap_studies,
+    statistic_functions,
+    volatility_indicators,
+    volume_indicators,
+)
+from src.ta_lib_mcp_server.tools.pipeline import register_pipeline
+
+
+def make_server():
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache())
+    for module, register in [
+        (overlap_studies, "register_overlap_studies"),
+        (momentum_indicators, "register_momentum_indicators"),
+        (volatility_indicators, "register_volatility_indicators"),
+        (volume_indicators, "register_volume_indicators"),
+        (cycle_indicators, "register_cycle_indicators"),
+        (statistic_functions, "register_statistic_functions"),
+    ]:
+        getattr(module, register)(indicators)
+    register_pipeline(mcp, indicators)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestPipeline:
+    """Tests for server-side indicator pipelines."""
+
+    rng = np.random.default_rng(3)
+    close = 100 + np.cumsum(rng.normal(size=120))
+    high = close + rng.random(120)
+    low = close - rng.random(120)
+    volume = rng.integers(1000, 5000, size=120).astype(float)
+    inputs = {
+        "close": close.tolist(),
+        "high": high.tolist(),
+        "low": low.tolist(),
+        "volume": volume.tolist(),
+    }
+
+    def test_chained_steps(self):
+        """RSI of OBV and BBANDS on ATR match the step-by-step computation."""
+        result = call(
+            make_server(),
+            "pipeline",
+            {
+                "inputs": self.inputs,
+                "steps": [
+                    {"name": "obv", "function": "OBV"},
+                    {
+                        "name": "rsi_obv",
+                        "function": "RSI",
+                        "inputs": {"real": "obv"},
+                        "params": {"timeperiod": 10},
+                    },
+                    {"name": "atr", "function": "ATR", "params": {"timeperiod": 14}},
+                    {
+                        "name": "bb",
+                        "function": "BBANDS",
+                        "inputs": {"real": "atr"},
+                        "params": {"timeperiod": 5},
+                    },
+                ],
+                "outputs": ["rsi_obv", "bb.upperband"],
+            },
+        )
+        assert list(result) == ["rsi_obv", "bb.upperband"]
+        obv = talib.OBV(self.close, self.volume)
+        np.testing.assert_allclose(
+            as_array(result["rsi_obv"]), talib.RSI(obv, 10), equal_nan=True
+        )
+        upper, _, _ = talib.BBANDS(talib.ATR(self.high, self.low, self.close, 14), 5)
+        np.testing.assert_allclose(
+            as_array(result["bb.upperband"]), upper, equal_nan=True
+        )
+
+    def test_default_outputs_and_mavp(self):
+        """Without outputs, every output of the last step is returned."""
+        result = call(
+            make_server(),
+            "pipeline",
+            {
+                "inputs": {"close": self.inputs["close"]},
+                "steps": [
+                    {"name": "period", "function": "HT_DCPERIOD"},
+                    {
+                        "name": "mavp",
+                        "function": "MAVP",
+                        "inputs": {"periods": "period"},
+                        "params": {"minperiod": 2, "maxperiod": 30},
+                    },
+                ],
+            },
+        )
+        expected = talib.MAVP(self.close, talib.HT_DCPERIOD(self.close), 2, 30)
+        np.testing.assert_allclose(as_array(result["mavp"]), expected, equal_nan=True)
+
+    def test_errors(self):
+        """Unknown functions, series and ambiguous references are rejected."""
+        mcp = make_server()
+        cases = [
+            ([{"name": "x", "function": "NOPE"}], "Unknown indicator function"),
+            ([{"name": "x", "function": "RSI", "inputs": {"real": "y"}}], "'y'"),
+            (
+                [
+                    {"name": "macd", "function": "MACD"},
+                    {"name": "rsi", "function": "RSI", "inputs": {"real": "macd"}},
+                ],
+                "several outputs",
+            ),
+            (
+                [{"name": "x", "function": "RSI", "params": {"period": 3}}],
+                "period",
+            ),
+        ]
+        for steps, message in cases:
+            with pytest.raises(ToolError, match=message):
+                call(mcp, "pipeline", {"inputs": self.inputs, "steps": steps})
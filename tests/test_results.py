@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from mcp.server.fastmcp import FastMCP
+from mcp.types import ResourceLink, TextContent
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore, register_result_resources
+from src.ta_lib_mcp_server.tools.momentum_indicators import (
+    register_momentum_indicators,
+)
+
+
+def make_server(inline_limit):
+    mcp = FastMCP("test")
+    results = ResultStore(inline_limit=inline_limit, page_size=10)
+    register_momentum_indicators(IndicatorTools(mcp, results, ResultCache()))
+    register_result_resources(mcp, results)
+    return mcp, results
+
+
+def read_resource(mcp, uri):
+    contents = asyncio.run(mcp.read_resource(uri))
+    return contents[0].content
+
+
+class TestResultStore:
+    """Tests for offloading large tool results to ta://results resources."""
+
+    prices = [float(i % 7 + 10) for i in range(25)]
+
+    def test_small_result_is_inline(self):
+        """Results under the inline limit are returned as JSON text."""
+        mcp, _ = make_server(inline_limit=1_000_000)
+        content = asyncio.run(mcp.call_tool("_rsi", {"real": self.prices}))
+        assert len(content) == 1
+        assert isinstance(content[0], TextContent)
+        assert len(json.loads(content[0].text)["rsi"]) == len(self.prices)
+
+    def test_large_result_is_resource_link(self):
+        """Results over the inline limit are replaced by a summary and a link."""
+        mcp, _ = make_server(inline_limit=10)
+        content = asyncio.run(mcp.call_tool("_rsi", {"real": self.prices}))
+        summary, link = content
+        assert isinstance(link, ResourceLink)
+        assert str(link.uri).startswith("ta://results/")
+        metadata = json.loads(summary.text)
+        assert metadata["length"] == len(self.prices)
+        assert metadata["pages"] == 3
+        assert metadata["outputs"]["rsi"]["length"] == len(self.prices)
+
+        full = json.loads(read_resource(mcp, str(link.uri)))
+        assert len(full["rsi"]) == len(self.prices)
+
+        page = json.loads(read_resource(mcp, f"{link.uri}/pages/2"))
+        assert page["start"] == 20
+        assert page["rsi"] == full["rsi"][20:]
+
+        head = read_resource(mcp, f"{link.uri}/bytes/0/8")
+        tail = read_resource(mcp, f"{link.uri}/bytes/8/{link.size}")
+        assert json.loads(head + tail) == full
+
+    def test_eviction(self):
+        """The least recently used results are dropped past the byte limit."""
+        store = ResultStore(max_bytes=10)
+        first = store.put("tool", {"a": [1]}, b"12345678")
+        second = store.put("tool", {"a": [2]}, b"12345678")
+        assert store.get(second.result_id) is second
+        try:
+            store.get(first.result_id)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected the first result to be evicted")
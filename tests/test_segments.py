@@ -0,0 +1,103 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import momentum_indicators, volatility_indicators
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server(panel_workers=2):
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(
+        mcp, ResultStore(), ResultCache(), datasets, panel_workers=panel_workers
+    )
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestSegments:
+    """Tests for computing indicators on segments of concatenated series."""
+
+    rng = np.random.default_rng(6)
+    close = 100 + np.cumsum(rng.normal(size=120))
+    high = close + rng.random(120)
+    low = close - rng.random(120)
+    offsets = [0, 50, 50, 53, 120]
+
+    def test_segments_match_separate_calls(self):
+        """Each segment is computed on its own and starts with its lookback."""
+        for workers in (1, 2):
+            mcp = make_server(panel_workers=workers)
+            atr = call(
+                mcp,
+                "_calculate_atr",
+                {
+                    "high": self.high.tolist(),
+                    "low": self.low.tolist(),
+                    "close": self.close.tolist(),
+                    "timeperiod": 5,
+                    "offsets": self.offsets,
+                },
+            )["atr"]
+            expected = np.concatenate(
+                [
+                    talib.ATR(
+                        self.high[start:stop],
+                        self.low[start:stop],
+                        self.close[start:stop],
+                        5,
+                    )
+                    for start, stop in zip(
+                        self.offsets[:-1], self.offsets[1:], strict=True
+                    )
+                ]
+            )
+            np.testing.assert_array_equal(as_array(atr), expected)
+
+    def test_dataset_segments(self):
+        """Segments also apply to series read from a dataset."""
+        mcp = make_server()
+        call(
+            mcp,
+            "register_dataset",
+            {"name": "sessions", "columns": {"close": self.close.tolist()}},
+        )
+        rsi = call(
+            mcp,
+            "_rsi",
+            {"dataset": "sessions", "timeperiod": 10, "offsets": [0, 60, 120]},
+        )["rsi"]
+        np.testing.assert_array_equal(
+            as_array(rsi),
+            np.concatenate(
+                [talib.RSI(self.close[:60], 10), talib.RSI(self.close[60:], 10)]
+            ),
+        )
+
+    def test_invalid_offsets(self):
+        """Offsets must run from 0 to the series length without decreasing."""
+        mcp = make_server()
+        for offsets in ([0, 60], [10, 120], [0, 70, 60, 120], [0]):
+            with pytest.raises(ToolError):
+                call(mcp, "_rsi", {"real": self.close.tolist(), "offsets": offsets})
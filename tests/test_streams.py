@@ -0,0 +1,304 @@
+import asyncio
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from talib import abstract
+
+from src.ta_lib_mcp_server import windows
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.incremental import lookback
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import (
+    momentum_indicators,
+    overlap_studies,
+    pattern_recognition,
+    statistic_functions,
+    volatility_indicators,
+    volume_indicators,
+)
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+from src.ta_lib_mcp_server.tools.streams import register_streams
+
+
+def make_server():
+    mcp = FastMCP("test")
+    datasets = DatasetRegistry()
+    indicators = IndicatorTools(mcp, ResultStore(), ResultCache(), datasets)
+    overlap_studies.register_overlap_studies(indicators)
+    momentum_indicators.register_momentum_indicators(indicators)
+    volatility_indicators.register_volatility_indicators(indicators)
+    volume_indicators.register_volume_indicators(indicators)
+    statistic_functions.register_statistic_functions(indicators)
+    pattern_recognition.register_pattern_recognition(indicators)
+    register_streams(mcp, indicators)
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+def as_array(values):
+    return np.array(values, dtype=float)
+
+
+class TestStreams:
+    """Tests for streaming sessions of recursive and windowed indicators."""
+
+    rng = np.random.default_rng(11)
+    close = 100 + np.cumsum(rng.normal(size=160))
+    close[60:66] = close[59]
+    bars = {
+        "open": close + rng.normal(scale=0.5, size=160),
+        "high": close + rng.random(160),
+        "low": close - rng.random(160),
+        "close": close,
+        "volume": rng.integers(1, 1000, 160).astype(float),
+        "real0": close,
+        "real1": 50 + np.cumsum(rng.normal(size=160)),
+    }
+    streams = {
+        "EMA": {"timeperiod": 2},
+        "DEMA": {"timeperiod": 10},
+        "TEMA": {"timeperiod": 5},
+        "T3": {"timeperiod": 4, "vfactor": 0.7},
+        "KAMA": {"timeperiod": 10},
+        "RSI": {"timeperiod": 14},
+        "MACD": {"fastperiod": 12, "slowperiod": 26, "signalperiod": 9},
+        "ATR": {"timeperiod": 14},
+        "ADX": {"timeperiod": 7},
+        "SAR": {"acceleration": 0.02, "maximum": 0.2},
+        "OBV": {},
+        "AD": {},
+    }
+    windows = {
+        "SMA": {"timeperiod": 20},
+        "TRIMA": {"timeperiod": 9},
+        "MIDPOINT": {"timeperiod": 14},
+        "MIDPRICE": {"timeperiod": 5},
+        "WILLR": {"timeperiod": 14},
+        "AROON": {"timeperiod": 10},
+        "AROONOSC": {"timeperiod": 14},
+        "STOCH": {"fastk_period": 14, "slowk_period": 3, "slowd_period": 3},
+        "STOCHF": {"fastk_period": 5, "fastd_period": 3},
+        "STOCHRSI": {"timeperiod": 14, "fastk_period": 5, "fastd_period": 3},
+        "WMA": {"timeperiod": 10},
+        "VAR": {"timeperiod": 5},
+        "STDDEV": {"timeperiod": 20, "nbdev": 2.0},
+        "LINEARREG": {"timeperiod": 14},
+        "LINEARREG_ANGLE": {"timeperiod": 14},
+        "LINEARREG_INTERCEPT": {"timeperiod": 14},
+        "LINEARREG_SLOPE": {"timeperiod": 14},
+        "TSF": {"timeperiod": 14},
+        "CORREL": {"timeperiod": 30},
+        "BETA": {"timeperiod": 5},
+    }
+
+    def expected(self, function, params):
+        """Return TA-Lib's output arrays on the whole series."""
+        indicator = abstract.Function(function)
+        if function in ("CORREL", "BETA"):
+            indicator.input_names = {"price0": "real0", "price1": "real1"}
+        expected = indicator(self.bars, **params)
+        return [expected] if isinstance(expected, np.ndarray) else expected
+
+    def window(self, columns, start, stop):
+        return {name: self.bars[name][start:stop].tolist() for name in columns}
+
+    def replay(self, mcp, function, params):
+        """Stream the bars after the first 40 in runs of several sizes.
+
+        Returns the stream's final description and the values it streamed
+        alongside TA-Lib's values on the whole series.
+        """
+        opened = call(
+            mcp,
+            "open_stream",
+            {
+                "function": function,
+                "params": params,
+                "inputs": self.window(self.bars, 0, 40),
+            },
+        )
+        streamed = {name: [] for name in opened["outputs"]}
+        for start, stop in (
+            (40, 41),
+            (41, 44),
+            (44, 100),
+            *((i, i + 1) for i in range(100, 160)),
+        ):
+            update = call(
+                mcp,
+                "update_stream",
+                {
+                    "stream": opened["stream"],
+                    "bars": self.window(opened["columns"], start, stop),
+                },
+            )
+            assert update["length"] == stop
+            for name in streamed:
+                streamed[name].extend(update[name])
+        expected = self.expected(function, params)
+        described = call(mcp, "close_stream", {"stream": opened["stream"]})
+        return described, [
+            (as_array(streamed[name]), values[40:])
+            for name, values in zip(streamed, expected, strict=True)
+        ]
+
+    def test_updates_match_full_recompute(self):
+        """Values streamed bar by bar equal TA-Lib's on the whole series."""
+        mcp = make_server()
+        for function, params in {**self.streams, **self.windows}.items():
+            described, outputs = self.replay(mcp, function, params)
+            assert described["stateful"], function
+            assert described["buffered"] == 0
+            for actual, expected in outputs:
+                np.testing.assert_array_equal(actual, expected, err_msg=function)
+
+    def test_windowed_functions_keep_their_window(self):
+        """Windowed functions without a state keep only their lookback bars."""
+        mcp = make_server()
+        for function, params, buffered in (
+            ("MOM", {"timeperiod": 10}, 10),
+            ("ROC", {"timeperiod": 10}, 10),
+            ("CDLENGULFING", {}, 2),
+        ):
+            described, outputs = self.replay(mcp, function, params)
+            assert not described["stateful"]
+            assert described["buffered"] == buffered
+            for actual, expected in outputs:
+                np.testing.assert_array_equal(actual, expected, err_msg=function)
+
+    def test_without_stream_objects(self):
+        """TA-Lib releases without stream objects keep these functions' window."""
+        mcp = make_server()
+        with mock.patch.object(windows, "STREAM_OBJECTS", False):
+            for function in ("WMA", "STDDEV", "LINEARREG", "CORREL", "CCI"):
+                params = self.windows.get(function, {})
+                described, outputs = self.replay(mcp, function, params)
+                assert not described["stateful"], function
+                assert described["buffered"] == lookback(function, params)
+                for actual, expected in outputs:
+                    np.testing.assert_allclose(
+                        actual, expected, rtol=1e-9, err_msg=function
+                    )
+
+    def test_short_openings_warm_up(self):
+        """Streams opened with fewer bars than their lookback keep them all."""
+        mcp = make_server()
+        for function, params in (
+            ("SMA", {"timeperiod": 50}),
+            ("TRIMA", {"timeperiod": 30}),
+            ("TRIMA", {"timeperiod": 11}),
+            ("MIDPOINT", {"timeperiod": 9}),
+            ("MIDPRICE", {"timeperiod": 9}),
+            ("WILLR", {"timeperiod": 14}),
+            ("AROON", {"timeperiod": 14}),
+            ("AROONOSC", {"timeperiod": 14}),
+            ("LINEARREG", {"timeperiod": 14}),
+            ("CORREL", {"timeperiod": 30}),
+            ("CCI", {"timeperiod": 14}),
+            ("ROC", {"timeperiod": 10}),
+        ):
+            for opening in (0, 3):
+                opened = call(
+                    mcp,
+                    "open_stream",
+                    {
+                        "function": function,
+                        "params": params,
+                        "inputs": self.window(self.bars, 0, opening),
+                    },
+                )
+                streamed = {name: [] for name in opened["outputs"]}
+                for start in range(opening, 160, 7):
+                    stop = min(start + 7, 160)
+                    update = call(
+                        mcp,
+                        "update_stream",
+                        {
+                            "stream": opened["stream"],
+                            "bars": self.window(opened["columns"], start, stop),
+                        },
+                    )
+                    for name in streamed:
+                        streamed[name].extend(update[name])
+                expected = self.expected(function, params)
+                for name, values in zip(streamed, expected, strict=True):
+                    np.testing.assert_allclose(
+                        as_array(streamed[name]),
+                        values[opening:],
+                        rtol=1e-12,
+                        err_msg=f"{function} opened with {opening} bars",
+                    )
+
+    def test_warm_up_and_state(self):
+        """A stream keeps bars until its first value, then only its state."""
+        mcp = make_server()
+        call(
+            mcp,
+            "register_dataset",
+            {"name": "bars", "columns": self.window(("close",), 0, 3)},
+        )
+        opened = call(
+            mcp,
+            "open_stream",
+            {"function": "ema", "params": {"timeperiod": 5}, "dataset": "bars"},
+        )
+        assert opened["length"] == 3
+        assert not opened["stateful"]
+        for i in range(3, 6):
+            update = call(
+                mcp,
+                "update_stream",
+                {"stream": opened["stream"], "bars": {"close": [self.close[i]]}},
+            )
+        assert update["ema"] == [pytest.approx(abstract.EMA(self.close[:6], 5)[-1])]
+        (described,) = call(mcp, "list_streams", {})["streams"]
+        assert described["stateful"]
+        assert described["latest"] == {"ema": update["ema"][0]}
+        with mock.patch.object(overlap_studies.talib, "EMA") as ema:
+            call(
+                mcp,
+                "update_stream",
+                {"stream": opened["stream"], "bars": {"close": [1.0, 2.0]}},
+            )
+        ema.assert_not_called()
+
+    def test_invalid_requests(self):
+        """Unknown streams, unstreamable functions and bad bars are errors."""
+        mcp = make_server()
+        opened = call(mcp, "open_stream", {"function": "ATR"})
+        for name, arguments in (
+            ("open_stream", {"function": "TRIX"}),
+            ("open_stream", {"function": "EMA", "params": {"period": 3}}),
+            ("update_stream", {"stream": "missing", "bars": {"close": [1.0]}}),
+            ("update_stream", {"stream": opened["stream"], "bars": {"close": [1.0]}}),
+            (
+                "update_stream",
+                {
+                    "stream": opened["stream"],
+                    "bars": {"high": [2.0], "low": [1.0], "close": [float("nan")]},
+                },
+            ),
+            (
+                "update_stream",
+                {
+                    "stream": opened["stream"],
+                    "bars": {"high": [2.0], "low": [1.0, 1.5], "close": [1.5]},
+                },
+            ),
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, name, arguments)
+        call(mcp, "close_stream", {"stream": opened["stream"]})
+        with pytest.raises(ToolError, match="Unknown or closed stream"):
+            call(mcp, "close_stream", {"stream": opened["stream"]})
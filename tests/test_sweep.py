@@ -0,0 +1,205 @@
+import asyncio
+import base64
+import json
+from unittest import mock
+
+import numpy as np
+import pytest
+import talib
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server import sweep
+from src.ta_lib_mcp_server.cache import ResultCache
+from src.ta_lib_mcp_server.indicator_tools import IndicatorTools
+from src.ta_lib_mcp_server.results import ResultStore
+from src.ta_lib_mcp_server.tools import (
+    momentum_indicators,
+    overlap_studies,
+    statistic_functions,
+)
+from src.ta_lib_mcp_server.tools.sweep import register_sweep
+from src.ta_lib_mcp_server.tools.types import MA_TYPE_MAP
+
+
+def make_server(inline_limit=10_000_000):
+    mcp = FastMCP("test")
+    indicators = IndicatorTools(
+        mcp, ResultStore(inline_limit=inline_limit), ResultCache()
+    )
+    overlap_studies.register_overlap_studies(indicators)
+    momentum_indicators.register_momentum_indicators(indicators)
+    statistic_functions.register_statistic_functions(indicators)
+    register_sweep(mcp, indicators)
+    return mcp
+
+
+def call(mcp, arguments):
+    content = asyncio.run(mcp.call_tool("sweep", arguments))
+    return json.loads(content[0].text)
+
+
+def matrix(result):
+    values = np.frombuffer(base64.b64decode(result["values"]), "<f8")
+    return values.reshape(result["shape"])
+
+
+class TestSweep:
+    """Tests for computing an indicator over a parameter grid."""
+
+    rng = np.random.default_rng(9)
+    close = 100 + np.cumsum(rng.normal(size=500))
+    high = close + rng.random(500)
+    low = close - rng.random(500)
+    inputs = {"close": close.tolist(), "high": high.tolist(), "low": low.tolist()}
+
+    def test_matches_separate_calls(self):
+        """Every row is identical to calling TA-Lib with that combination."""
+        mcp = make_server()
+        cases = [
+            (
+                "SMA",
+                {"timeperiod": list(range(2, 40))},
+                lambda p: [talib.SMA(self.close, **p)],
+            ),
+            (
+                "RSI",
+                {"timeperiod": [7, 14, 21]},
+                lambda p: [talib.RSI(self.close, **p)],
+            ),
+            (
+                "MIDPOINT",
+                {"timeperiod": list(range(2, 70, 3))},
+                lambda p: [talib.MIDPOINT(self.close, **p)],
+            ),
+            (
+                "MIDPRICE",
+                {"timeperiod": [2, 5, 16, 17, 100]},
+                lambda p: [talib.MIDPRICE(self.high, self.low, **p)],
+            ),
+            (
+                "STDDEV",
+                {"timeperiod": [5, 20], "nbdev": [1, 2, 3]},
+                lambda p: [
+                    talib.STDDEV(self.close, p["timeperiod"], float(p["nbdev"]))
+                ],
+            ),
+            (
+                "BBANDS",
+                {"timeperiod": [5, 20], "nbdevup": [1, 2, 2.5], "nbdevdn": [2]},
+                lambda p: talib.BBANDS(
+                    self.close, p["timeperiod"], p["nbdevup"], p["nbdevdn"]
+                ),
+            ),
+            (
+                "BBANDS",
+                {"timeperiod": [5, 20], "nbdevup": [0.7, 1.5], "nbdevdn": [1.5, 2.2]},
+                lambda p: talib.BBANDS(
+                    self.close, p["timeperiod"], p["nbdevup"], p["nbdevdn"]
+                ),
+            ),
+            (
+                "BBANDS",
+                {
+                    "timeperiod": [5, 20],
+                    "nbdevup": [2],
+                    "matype": list(MA_TYPE_MAP),
+                },
+                lambda p: talib.BBANDS(
+                    self.close,
+                    p["timeperiod"],
+                    p["nbdevup"],
+                    p["nbdevdn"],
+                    MA_TYPE_MAP[p["matype"]],
+                ),
+            ),
+        ]
+        for function, grid, expected in cases:
+            for workers in (1, 3):
+                result = call(
+                    mcp,
+                    {
+                        "function": function,
+                        "grid": grid,
+                        "inputs": self.inputs,
+                        "workers": workers,
+                    },
+                )
+                rows = matrix(result)
+                assert result["shape"] == [
+                    len(result["params"]) * len(result["outputs"]),
+                    len(self.close),
+                ]
+                width = len(result["outputs"])
+                for c, params in enumerate(result["params"]):
+                    for o, values in enumerate(expected(params)):
+                        np.testing.assert_array_equal(rows[c * width + o], values)
+
+    def test_grid_order_and_outputs(self):
+        """Combinations vary the last parameter fastest and outputs can be chosen."""
+        result = call(
+            make_server(),
+            {
+                "function": "bbands",
+                "grid": {"timeperiod": [5, 10], "nbdevup": [1, 2]},
+                "inputs": {"close": self.inputs["close"]},
+                "outputs": ["upperband"],
+            },
+        )
+        assert result["function"] == "BBANDS"
+        assert [(p["timeperiod"], p["nbdevup"]) for p in result["params"]] == [
+            (5, 1),
+            (5, 2),
+            (10, 1),
+            (10, 2),
+        ]
+        assert result["outputs"] == ["upperband"]
+        upper, _, _ = talib.BBANDS(self.close, 10, 2, 2)
+        np.testing.assert_array_equal(matrix(result)[3], upper)
+
+    def test_invalid_sweeps(self):
+        """Unknown outputs, invalid parameters and empty value lists are errors."""
+        mcp = make_server()
+        for arguments in (
+            {"function": "SMA", "grid": {"timeperiod": [5]}, "outputs": ["x"]},
+            {"function": "SMA", "grid": {"period": [5]}},
+            {"function": "SMA", "grid": {"timeperiod": []}},
+            {"function": "NOPE", "grid": {}},
+        ):
+            with pytest.raises(ToolError):
+                call(mcp, {**arguments, "inputs": self.inputs})
+
+    def test_size_checked_first(self):
+        """A sweep over the size limit fails before any combination is computed."""
+        mcp = make_server()
+        shared = mock.Mock()
+        with (
+            mock.patch.object(sweep, "MAX_SWEEP_VALUES", len(self.close)),
+            mock.patch.dict(sweep._SHARED, {"BBANDS": shared}),
+            pytest.raises(ToolError, match="values allowed"),
+        ):
+            call(
+                mcp,
+                {
+                    "function": "BBANDS",
+                    "grid": {"timeperiod": [5, 20]},
+                    "inputs": self.inputs,
+                },
+            )
+        shared.assert_not_called()
+
+    def test_large_sweep_summary(self):
+        """An offloaded sweep's summary gives the size of its matrix, not its bytes."""
+        mcp = make_server(inline_limit=1000)
+        content = asyncio.run(
+            mcp.call_tool(
+                "sweep",
+                {
+                    "function": "SMA",
+                    "grid": {"timeperiod": [5, 10, 20]},
+                    "inputs": self.inputs,
+                },
+            )
+        )
+        summary = json.loads(content[0].text)
+        assert summary["outputs"]["values"] == {"size": len(self.close) * 3 * 32 // 3}
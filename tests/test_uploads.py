@@ -0,0 +1,110 @@
+import asyncio
+import base64
+import json
+
+import numpy as np
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+
+from src.ta_lib_mcp_server.datasets import DatasetRegistry
+from src.ta_lib_mcp_server.tools.dataset_management import register_dataset_management
+
+
+def make_server(datasets):
+    mcp = FastMCP("test")
+    register_dataset_management(mcp, datasets)
+    return mcp
+
+
+def call(mcp, name, arguments):
+    content = asyncio.run(mcp.call_tool(name, arguments))
+    return json.loads(content[0].text)
+
+
+class TestUploads:
+    """Tests for multi-part dataset uploads."""
+
+    close = np.linspace(100.0, 120.0, 25)
+
+    def upload(self, mcp):
+        upload = call(
+            mcp, "begin_upload", {"name": "big", "columns": ["close"], "length": 25}
+        )
+        upload_id = upload["upload_id"]
+        # Out of order, mixing binary and list chunks.
+        call(
+            mcp,
+            "upload_chunk",
+            {
+                "upload_id": upload_id,
+                "column": "close",
+                "offset": 10,
+                "data": base64.b64encode(self.close[10:].astype("<f8")).decode(),
+            },
+        )
+        progress = call(
+            mcp,
+            "upload_chunk",
+            {
+                "upload_id": upload_id,
+                "column": "close",
+                "values": self.close[:5].tolist(),
+            },
+        )
+        assert progress["missing"] == {"close": 5}
+        with pytest.raises(ToolError, match="incomplete"):
+            call(mcp, "commit_upload", {"upload_id": upload_id})
+        call(
+            mcp,
+            "upload_chunk",
+            {
+                "upload_id": upload_id,
+                "column": "close",
+                "offset": 5,
+                "values": self.close[5:10].tolist(),
+            },
+        )
+        return call(mcp, "commit_upload", {"upload_id": upload_id})
+
+    def test_upload_in_memory(self):
+        """Chunks sent out of order assemble into a registered dataset."""
+        datasets = DatasetRegistry()
+        handle = self.upload(make_server(datasets))
+        assert handle["length"] == 25
+        np.testing.assert_array_equal(datasets.get("big").column("close"), self.close)
+
+    def test_upload_to_store(self, tmp_path):
+        """With a dataset directory, chunks are written into mapped files."""
+        self.upload(make_server(DatasetRegistry(str(tmp_path))))
+        reopened = DatasetRegistry(str(tmp_path)).get("big")
+        np.testing.assert_array_equal(reopened.column("close"), self.close)
+        assert [path.name for path in tmp_path.iterdir()] == ["big"]
+
+    def test_rejects_bad_chunks(self, tmp_path):
+        """Chunks outside the upload and aborted uploads are rejected."""
+        mcp = make_server(DatasetRegistry(str(tmp_path)))
+        upload_id = call(
+            mcp, "begin_upload", {"name": "big", "columns": ["close"], "length": 4}
+        )["upload_id"]
+        with pytest.raises(ToolError, match="exceeds the upload length"):
+            call(
+                mcp,
+                "upload_chunk",
+                {
+                    "upload_id": upload_id,
+                    "column": "close",
+                    "offset": 2,
+                    "values": [1.0, 2.0, 3.0],
+                },
+            )
+        with pytest.raises(ToolError, match="base64"):
+            call(
+                mcp,
+                "upload_chunk",
+                {"upload_id": upload_id, "column": "close", "data": "AAAA"},
+            )
+        call(mcp, "abort_upload", {"upload_id": upload_id})
+        assert list(tmp_path.iterdir()) == []
+        with pytest.raises(ToolError, match="Unknown upload"):
+            call(mcp, "commit_upload", {"upload_id": upload_id})